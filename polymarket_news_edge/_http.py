@@ -0,0 +1,17 @@
+"""Shared HTTP client — one connection pool for every outbound API call."""
+
+import atexit
+import importlib.util
+
+import httpx
+
+# HTTP/2 needs the optional h2 package; fall back to pooled HTTP/1.1 keep-alive without it
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+CLIENT = httpx.Client(
+    http2=_HTTP2,
+    headers={"User-Agent": "Mozilla/5.0"},
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=16),
+)
+atexit.register(CLIENT.close)
@@ -1,9 +1,18 @@
 """Edge detection with proper fee modeling and Kelly criterion sizing."""
 
 from dataclasses import dataclass
+
+import numpy as np
+
 from .probability_engine import ProbEstimate
 
 
+# Fee model shared by estimate_fee and the find_edges kernels
+BASE_FEE = 0.016  # 1.6% baseline
+SPREAD_COST_MIN = 0.005  # spread cost at the midpoint
+SPREAD_COST_EXTREME = 0.02  # extra spread cost as the price approaches 0 or 1
+
+
 def estimate_fee(price: float) -> float:
     """
     Estimate Polymarket taker fee based on price.
@@ -14,10 +23,9 @@ def estimate_fee(price: float) -> float:
     # Polymarket uses a fee schedule that's roughly:
     # ~1% for prices near 0.5, scaling up as you approach 0 or 1
     # Plus there's spread cost
-    base_fee = 0.016  # 1.6% baseline
     # At extreme prices, effective cost is higher due to spread
-    spread_cost = 0.005 + 0.02 * (1 - 4 * price * (1 - price))
-    return base_fee + spread_cost
+    spread_cost = SPREAD_COST_MIN + SPREAD_COST_EXTREME * (1 - 4 * price * (1 - price))
+    return BASE_FEE + spread_cost
 
 
 MIN_EDGE_THRESHOLD = 0.03  # 3% after fees — much more realistic
@@ -26,7 +34,7 @@ DEFAULT_BANKROLL = 1000.0
 MIN_SHARES = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeSignal:
     market_id: str
     question: str
@@ -94,16 +102,6 @@ def calculate_edge(estimate: ProbEstimate, bankroll: float = DEFAULT_BANKROLL,
     if expected_shares < MIN_SHARES:
         return None
 
-    # Reliability indicator
-    n_signals = estimate.signals.get("n_signals", 1)
-    avg_imp = estimate.signals.get("avg_importance", 2)
-    if n_signals >= 3 and avg_imp >= 3.5 and estimate.confidence > 0.5:
-        reliability = "high"
-    elif n_signals >= 2 and avg_imp >= 2.5:
-        reliability = "medium"
-    else:
-        reliability = "low"
-
     return TradeSignal(
         market_id=estimate.market_id,
         question=estimate.question,
@@ -114,7 +112,7 @@ def calculate_edge(estimate: ProbEstimate, bankroll: float = DEFAULT_BANKROLL,
         fee_estimate=round(fee, 4),
         edge=round(edge, 4),
         confidence=estimate.confidence,
-        reliability=reliability,
+        reliability=_reliability(estimate),
         kelly_fraction=round(kelly, 4),
         position_size=position_size,
         expected_shares=expected_shares,
@@ -123,12 +121,141 @@ def calculate_edge(estimate: ProbEstimate, bankroll: float = DEFAULT_BANKROLL,
     )
 
 
+def _reliability(estimate: ProbEstimate) -> str:
+    n_signals = estimate.signals.get("n_signals", 1)
+    avg_imp = estimate.signals.get("avg_importance", 2)
+    if n_signals >= 3 and avg_imp >= 3.5 and estimate.confidence > 0.5:
+        return "high"
+    elif n_signals >= 2 and avg_imp >= 2.5:
+        return "medium"
+    return "low"
+
+
+def _edges_numpy(ai_prob: np.ndarray, market: np.ndarray, conf: np.ndarray, min_edge: float):
+    """Array form of calculate_edge's numeric core.
+
+    Returns (ok, is_yes, edge, raw_edge, fee, entry, kelly), one element per estimate.
+    """
+    # Fees for the YES price and the NO price (1 - market)
+    no_price = 1 - market
+    yes_fee = estimate_fee(market)
+    no_fee = estimate_fee(no_price)
+    yes_raw = ai_prob - market
+    no_raw = market - ai_prob
+    yes_edge = yes_raw - yes_fee
+    no_edge = no_raw - no_fee
+
+    is_yes = yes_edge > no_edge
+    edge = np.where(is_yes, yes_edge, no_edge)
+    raw_edge = np.where(is_yes, yes_raw, no_raw)
+    fee = np.where(is_yes, yes_fee, no_fee)
+    entry = np.where(is_yes, market, no_price)
+    p = np.where(is_yes, ai_prob, 1 - ai_prob)
+
+    ok = (edge >= min_edge) & (entry > 0.01) & (entry < 0.99)
+
+    # Kelly criterion (entry is bounded away from 0 and 1 wherever ok holds)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        b = 1.0 / entry - 1.0
+        kelly = np.where(b > 0, (b * p - (1 - p)) / b, 0.0)
+    kelly = np.clip(kelly, 0, MAX_KELLY_FRACTION) * conf
+    return ok, is_yes, edge, raw_edge, fee, entry, kelly
+
+
+def _edges_loop(ai_prob, market, conf, min_edge):
+    """Single-pass loop form of _edges_numpy, for numba to compile without temporaries."""
+    n = ai_prob.shape[0]
+    ok = np.zeros(n, dtype=np.bool_)
+    is_yes = np.zeros(n, dtype=np.bool_)
+    edge = np.empty(n)
+    raw_edge = np.empty(n)
+    fee = np.empty(n)
+    entry = np.empty(n)
+    kelly = np.zeros(n)
+    for i in range(n):
+        m = market[i]
+        no_price = 1 - m
+        # estimate_fee() inlined: numba can't call the plain-Python function
+        yes_fee = BASE_FEE + (SPREAD_COST_MIN + SPREAD_COST_EXTREME * (1 - 4 * m * (1 - m)))
+        no_fee = BASE_FEE + (SPREAD_COST_MIN + SPREAD_COST_EXTREME * (1 - 4 * no_price * (1 - no_price)))
+        yes_raw = ai_prob[i] - m
+        no_raw = m - ai_prob[i]
+        yes_edge = yes_raw - yes_fee
+        no_edge = no_raw - no_fee
+        if yes_edge > no_edge:
+            is_yes[i] = True
+            edge[i], raw_edge[i], fee[i], entry[i] = yes_edge, yes_raw, yes_fee, m
+            p = ai_prob[i]
+        else:
+            edge[i], raw_edge[i], fee[i], entry[i] = no_edge, no_raw, no_fee, no_price
+            p = 1 - ai_prob[i]
+        if edge[i] < min_edge or entry[i] <= 0.01 or entry[i] >= 0.99:
+            continue
+        ok[i] = True
+        b = (1.0 / entry[i]) - 1.0
+        k = (b * p - (1 - p)) / b if b > 0 else 0.0
+        kelly[i] = max(0.0, min(k, MAX_KELLY_FRACTION)) * conf[i]
+    return ok, is_yes, edge, raw_edge, fee, entry, kelly
+
+
+_compute_edges_kernel = None  # set by _edges_kernel() on first use
+
+
+def _edges_kernel():
+    """The numba-compiled _edges_loop, or _edges_numpy without numba.
+
+    Resolved on the first find_edges call so importing the package doesn't
+    pay for importing numba or the JIT compile.
+    """
+    global _compute_edges_kernel
+    if _compute_edges_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional — find_edges falls back to plain NumPy
+            _compute_edges_kernel = _edges_numpy
+        else:
+            _compute_edges_kernel = njit(cache=True)(_edges_loop)
+    return _compute_edges_kernel
+
+
 def find_edges(estimates: list[ProbEstimate], bankroll: float = DEFAULT_BANKROLL,
                min_edge: float = MIN_EDGE_THRESHOLD) -> list[TradeSignal]:
+    """Vectorized calculate_edge over all estimates; builds TradeSignals only for survivors."""
+    if not estimates:
+        return []
+
+    n = len(estimates)
+    ai_prob = np.fromiter((e.ai_probability for e in estimates), float, count=n)
+    market = np.fromiter((e.current_price for e in estimates), float, count=n)
+    conf = np.fromiter((e.confidence for e in estimates), float, count=n)
+    ok, is_yes, edge, raw_edge, fee, entry, kelly = _edges_kernel()(ai_prob, market, conf, min_edge)
+
     signals = []
-    for est in estimates:
-        sig = calculate_edge(est, bankroll, min_edge)
-        if sig:
-            signals.append(sig)
+    for i in np.flatnonzero(ok):
+        est = estimates[i]
+        k = float(kelly[i])
+        entry_price = float(entry[i])
+        position_size = round(bankroll * k, 2)
+        expected_shares = max(0, int(position_size / entry_price)) if position_size > 0 else 0
+        if expected_shares < MIN_SHARES:
+            continue
+        e = float(edge[i])
+        signals.append(TradeSignal(
+            market_id=est.market_id,
+            question=est.question,
+            direction="BUY_YES" if is_yes[i] else "BUY_NO",
+            current_price=est.current_price,
+            ai_probability=est.ai_probability,
+            raw_edge=round(float(raw_edge[i]), 4),
+            fee_estimate=round(float(fee[i]), 4),
+            edge=round(e, 4),
+            confidence=est.confidence,
+            reliability=_reliability(est),
+            kelly_fraction=round(k, 4),
+            position_size=position_size,
+            expected_shares=expected_shares,
+            expected_value=round(e * expected_shares * entry_price, 2),
+            signals=est.signals,
+        ))
     signals.sort(key=lambda s: s.edge, reverse=True)
     return signals
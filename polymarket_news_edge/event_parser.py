@@ -1,10 +1,14 @@
 """News-to-market matching with category tagging, entity matching, and question parsing."""
 
 import re
+import heapq
 import hashlib
 from dataclasses import dataclass
 from rapidfuzz import fuzz
 
+from .market_cache import get_market_extended
+from .probability_engine import SOURCE_ID, UNKNOWN_SOURCE_ID
+
 # ── Categories ──────────────────────────────────────────────────────────────
 
 CATEGORIES = {
@@ -112,6 +116,7 @@ class NewsSignal:
     importance: int  # 1-5
     is_breaking: bool
     matched_markets: list[dict]
+    source_id: int = UNKNOWN_SOURCE_ID  # index into probability_engine.SRC_W
 
 
 # ── Sentiment ───────────────────────────────────────────────────────────────
@@ -180,10 +185,19 @@ def detect_category(text: str) -> str:
     return best if scores[best] > 0 else "unknown"
 
 
-def detect_market_meta(market: dict) -> MarketMeta:
-    """Parse market question to extract metadata."""
+def detect_market_meta(market: dict, extended: dict | None = None) -> MarketMeta:
+    """Parse market question to extract metadata.
+
+    `extended` is the get_market_extended() map; pass it in when calling this
+    in a loop so the cache file is checked once, not once per market.
+    """
     q = market["question"].lower()
-    desc = market.get("description", "").lower()
+    desc = market.get("description")
+    if desc is None:
+        if extended is None:
+            extended = get_market_extended()
+        desc = extended.get(market.get("id", ""), {}).get("description", "")
+    desc = desc.lower()
     full = f"{q} {desc}"
 
     category = detect_category(full)
@@ -214,6 +228,12 @@ def detect_market_meta(market: dict) -> MarketMeta:
     )
 
 
+def build_market_metas(markets: list[dict]) -> list[MarketMeta]:
+    """MarketMeta for each market, reading the extended cache once."""
+    extended = get_market_extended()
+    return [detect_market_meta(m, extended) for m in markets]
+
+
 # ── Entity extraction ───────────────────────────────────────────────────────
 
 def extract_entities(text: str) -> list[str]:
@@ -235,12 +255,18 @@ def match_markets(
     news_category: str,
     markets: list[dict],
     threshold: int = 75,
+    market_metas: list[MarketMeta] | None = None,
 ) -> list[dict]:
-    """Match news to markets with category filtering and entity requirements."""
+    """Match news to markets with category filtering and entity requirements.
+
+    `market_metas` (parallel to `markets`, see build_market_metas) lets a
+    caller matching many news items parse each market only once.
+    """
+    if market_metas is None:
+        market_metas = build_market_metas(markets)
     matches = []
-    for market in markets:
+    for market, meta in zip(markets, market_metas):
         q = market["question"].lower()
-        meta = detect_market_meta(market)
 
         # CATEGORY GATE: only match same category (or unknown)
         if news_category != "unknown" and meta.category != "unknown":
@@ -296,8 +322,7 @@ def match_markets(
             },
         })
 
-    matches.sort(key=lambda x: x["match_score"], reverse=True)
-    return matches[:5]  # Tighter limit
+    return heapq.nlargest(5, matches, key=lambda x: x["match_score"])  # Tighter limit
 
 
 # ── News importance & dedup ─────────────────────────────────────────────────
@@ -365,7 +390,11 @@ def deduplicate_news(news_items: list[dict], threshold: int = 80) -> list[dict]:
 
 # ── Main parsing ────────────────────────────────────────────────────────────
 
-def parse_news_item(news_item: dict, markets: list[dict]) -> NewsSignal | None:
+def parse_news_item(
+    news_item: dict,
+    markets: list[dict],
+    market_metas: list[MarketMeta] | None = None,
+) -> NewsSignal | None:
     """Analyze a single news item against available markets."""
     text = f"{news_item['title']} {news_item.get('summary', '')}"
     entities = extract_entities(text)
@@ -378,7 +407,7 @@ def parse_news_item(news_item: dict, markets: list[dict]) -> NewsSignal | None:
     importance = score_importance(news_item["title"], source)
     breaking = is_breaking(news_item["title"])
 
-    matched = match_markets(entities, category, markets, threshold=75)
+    matched = match_markets(entities, category, markets, threshold=75, market_metas=market_metas)
     if not matched:
         return None
 
@@ -392,15 +421,17 @@ def parse_news_item(news_item: dict, markets: list[dict]) -> NewsSignal | None:
         importance=importance,
         is_breaking=breaking,
         matched_markets=matched,
+        source_id=SOURCE_ID.get(source, UNKNOWN_SOURCE_ID),
     )
 
 
 def parse_all(news_items: list[dict], markets: list[dict]) -> list[NewsSignal]:
     """Parse all news, deduplicate first, return signals."""
     deduped = deduplicate_news(news_items)
+    market_metas = build_market_metas(markets)  # once per scan, not per news item
     signals = []
     for item in deduped:
-        sig = parse_news_item(item, markets)
+        sig = parse_news_item(item, markets, market_metas)
         if sig:
             signals.append(sig)
     return signals
@@ -412,7 +443,7 @@ def parse_with_llm(news_items: list[dict], markets: list[dict]) -> list[dict]:
     Returns list of dicts with keys: market_id, question, estimated_probability,
     confidence, direction, reasoning, news_title, source (='LLM').
     """
-    from llm_analyzer import analyze_news_batch
+    from .llm_analyzer import analyze_news_batch
 
     try:
         llm_signals = analyze_news_batch(news_items, markets)
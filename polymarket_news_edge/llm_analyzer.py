@@ -1,12 +1,21 @@
-"""LLM-powered news analysis using Gemini CLI."""
+"""LLM-powered news analysis using the Gemini API."""
 
+import hashlib
 import json
+import os
 import re
-import subprocess
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from pathlib import Path
 
+import httpx
+import orjson
 
-@dataclass
+from ._http import CLIENT
+
+
+@dataclass(slots=True)
 class LLMSignal:
     news_index: int
     market_index: int
@@ -19,26 +28,54 @@ class LLMSignal:
     market_id: str = ""
 
 
-GEMINI_BIN = "/opt/homebrew/bin/gemini"
 GEMINI_MODEL = "gemini-2.5-flash"
 
+# News is sent in position-tagged sub-batches so one call (and one preamble) covers more items
+NEWS_BATCH_SIZE = 20
+MAX_NEWS_BATCHES = 3
+GEMINI_URL = f"https://generativelanguage.googleapis.com/v1beta/models/{GEMINI_MODEL}:generateContent"
 
-def build_prompt(news_items: list[dict], markets: list[dict]) -> str:
-    news_section = "\n".join(
-        f"  [{i}] {item.get('title', 'N/A')} (source: {item.get('source', 'unknown')})"
-        for i, item in enumerate(news_items[:20])
-    )
-    market_section = "\n".join(
-        f"  [{i}] {m.get('question', 'N/A')} | YES: {_yes_price(m)} | vol: ${m.get('volume', 0):,.0f}"
-        for i, m in enumerate(markets[:30])
-    )
-    return f"""You are an expert Polymarket trading analyst. Your job is to identify how breaking news affects prediction market prices.
+# Structured-output schema — Gemini returns bare JSON matching this, no markdown wrapping
+SIGNAL_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "signals": {
+            "type": "ARRAY",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "batch": {"type": "INTEGER"},
+                    "news_index": {"type": "INTEGER"},
+                    "market_index": {"type": "INTEGER"},
+                    "direction": {"type": "STRING", "enum": ["YES_UP", "YES_DOWN"]},
+                    "estimated_probability": {"type": "NUMBER"},
+                    "confidence": {"type": "NUMBER"},
+                    "reasoning": {"type": "STRING"},
+                },
+                "required": ["news_index", "market_index", "direction",
+                             "estimated_probability", "confidence"],
+            },
+        },
+    },
+    "required": ["signals"],
+}
 
-CURRENT NEWS (last 2 hours):
-{news_section}
+# Response cache — identical news/market snapshots within the TTL reuse the last answer
+RESP_CACHE_TTL = 300  # seconds — matches the market cache refresh
+_RESP_CACHE: dict[str, tuple[float, list["LLMSignal"]]] = {}
+
+# Per-news results, persisted across runs: (news id, market set) -> that item's signals.
+# Lets already-analyzed news keep contributing its signals without another Gemini call,
+# so later scans only send news the model hasn't seen against these markets.
+LLM_CACHE_FILE = Path(__file__).parent / "llm_cache.json"
+LLM_CACHE_MAX = 5000  # entries; oldest dropped first
+_llm_cache: OrderedDict[str, list[dict]] | None = None
 
-ACTIVE POLYMARKET MARKETS:
-{market_section}
+
+SYSTEM_PREAMBLE = """You are an expert Polymarket trading analyst. Your job is to identify how breaking news affects prediction market prices.
+
+You will be given a numbered list of CURRENT NEWS (last 2 hours) and a numbered list of ACTIVE POLYMARKET MARKETS.
+News may be split into batches with items labelled [batch k, item i]; for those, set "batch" to k and "news_index" to i.
 
 TASK: For each news item that MEANINGFULLY affects any market, output a signal.
 Rules:
@@ -49,8 +86,33 @@ Rules:
 - Consider: does this news make the event MORE or LESS likely?
 
 Return ONLY valid JSON, no other text:
-{{"signals": [{{"news_index": 0, "market_index": 5, "direction": "YES_UP", "estimated_probability": 0.75, "confidence": 0.8, "reasoning": "..."}}]}}
-If no signals, return {{"signals": []}}"""
+{"signals": [{"news_index": 0, "market_index": 5, "direction": "YES_UP", "estimated_probability": 0.75, "confidence": 0.8, "reasoning": "..."}]}
+If no signals, return {"signals": []}"""
+
+
+def build_user_section(news_items: list[dict], markets: list[dict]) -> str:
+    """Per-scan part of the prompt: the news and market lists only."""
+    news_items = news_items[:NEWS_BATCH_SIZE * MAX_NEWS_BATCHES]
+    if len(news_items) <= NEWS_BATCH_SIZE:
+        news_section = "\n".join(
+            f"  [{i}] {item.get('title', 'N/A')} (source: {item.get('source', 'unknown')})"
+            for i, item in enumerate(news_items)
+        )
+    else:
+        news_section = "\n".join(
+            f"  [batch {i // NEWS_BATCH_SIZE}, item {i % NEWS_BATCH_SIZE}] "
+            f"{item.get('title', 'N/A')} (source: {item.get('source', 'unknown')})"
+            for i, item in enumerate(news_items)
+        )
+    market_section = "\n".join(
+        f"  [{i}] {m.get('question', 'N/A')} | YES: {_yes_price(m)} | vol: ${m.get('volume', 0):,.0f}"
+        for i, m in enumerate(markets[:30])
+    )
+    return f"""CURRENT NEWS (last 2 hours):
+{news_section}
+
+ACTIVE POLYMARKET MARKETS:
+{market_section}"""
 
 
 def _yes_price(market: dict) -> str:
@@ -60,74 +122,190 @@ def _yes_price(market: dict) -> str:
     return "N/A"
 
 
+_CODEBLOCK_RE = re.compile(r'```(?:json)?\s*\n?(.*?)\n?```', re.DOTALL)
+_json_decoder = json.JSONDecoder()
+
+
 def _extract_json(text: str) -> dict | None:
     """Extract JSON from markdown code blocks or raw text."""
     # Try markdown code block first
-    m = re.search(r'```(?:json)?\s*\n?(.*?)\n?```', text, re.DOTALL)
+    m = _CODEBLOCK_RE.search(text)
     if m:
         text = m.group(1).strip()
     # Try to parse
     try:
         return json.loads(text)
     except json.JSONDecodeError:
-        # Try finding JSON object in text
-        m = re.search(r'\{.*\}', text, re.DOTALL)
-        if m:
-            try:
-                return json.loads(m.group(0))
-            except json.JSONDecodeError:
-                pass
+        pass
+    # Find the first complete JSON object embedded in surrounding prose.
+    # raw_decode scans from each '{' in one linear pass — no regex backtracking.
+    start = text.find("{")
+    while start != -1:
+        try:
+            obj, _ = _json_decoder.raw_decode(text, start)
+            if isinstance(obj, dict):
+                return obj
+        except json.JSONDecodeError:
+            pass
+        start = text.find("{", start + 1)
     return None
 
 
+def _response_cache_key(news_items: list[dict], markets: list[dict]) -> str:
+    """Content hash of the news titles and market ids actually sent to the model.
+
+    Order is kept (not sorted): cached signals carry news/market indices.
+    """
+    blob = json.dumps([
+        [n.get("title", "") for n in news_items[:NEWS_BATCH_SIZE * MAX_NEWS_BATCHES]],
+        [str(m.get("id", "")) for m in markets[:30]],
+    ])
+    return hashlib.blake2b(blob.encode(), digest_size=16).hexdigest()
+
+
+def _news_cache_key(item: dict, market_set: str) -> str:
+    news_id = item.get("id") or item.get("title", "")
+    return hashlib.blake2b(f"{news_id}|{market_set}".encode(), digest_size=8).hexdigest()
+
+
+def _load_llm_cache() -> OrderedDict[str, list[dict]]:
+    global _llm_cache
+    if _llm_cache is None:
+        try:
+            _llm_cache = OrderedDict(orjson.loads(LLM_CACHE_FILE.read_bytes()))
+        except (OSError, orjson.JSONDecodeError, TypeError, ValueError):
+            _llm_cache = OrderedDict()
+    return _llm_cache
+
+
+def _save_llm_cache():
+    """Cap the per-news cache (FIFO) and write it atomically."""
+    cache = _load_llm_cache()
+    while len(cache) > LLM_CACHE_MAX:
+        cache.popitem(last=False)
+    tmp = LLM_CACHE_FILE.with_suffix(".json.tmp")
+    tmp.write_bytes(orjson.dumps(cache))
+    os.replace(tmp, LLM_CACHE_FILE)
+
+
 def analyze_news_batch(news_items: list[dict], markets: list[dict]) -> list[LLMSignal]:
-    """Call Gemini to analyze news against markets. Returns structured signals."""
+    """Call Gemini to analyze news against markets. Returns structured signals.
+
+    News already analyzed against the same market set is answered from the
+    per-news cache; only the rest is sent. Signal news_index values always
+    refer to positions in the caller's news_items.
+    """
     if not news_items or not markets:
         return []
 
-    prompt = build_prompt(news_items, markets)
+    cache_key = _response_cache_key(news_items, markets)
+    cached = _RESP_CACHE.get(cache_key)
+    if cached and time.time() - cached[0] < RESP_CACHE_TTL:
+        return list(cached[1])
+
+    market_pos = {str(m.get("id", "")): i for i, m in enumerate(markets[:30])}
+    market_set = ",".join(sorted(market_pos))
+    llm_cache = _load_llm_cache()
+
+    signals = []
+    fresh_idx = []
+    for i, n in enumerate(news_items):
+        hit = llm_cache.get(_news_cache_key(n, market_set))
+        if hit is not None:
+            for c in hit:
+                mi = market_pos.get(c["market_id"])
+                if mi is None:
+                    continue
+                signals.append(LLMSignal(
+                    news_index=i,
+                    market_index=mi,
+                    direction=c["direction"],
+                    estimated_probability=c["estimated_probability"],
+                    confidence=c["confidence"],
+                    reasoning=c["reasoning"],
+                    news_title=n.get("title", ""),
+                    market_question=markets[mi].get("question", ""),
+                    market_id=markets[mi].get("id", ""),
+                ))
+        else:
+            fresh_idx.append(i)
+    fresh_idx = fresh_idx[:NEWS_BATCH_SIZE * MAX_NEWS_BATCHES]
+    if not fresh_idx:
+        return signals
+    fresh = [news_items[i] for i in fresh_idx]
+
+    api_key = os.environ.get("GEMINI_API_KEY", "")
+    if not api_key:
+        print("[LLM] GEMINI_API_KEY not set — skipping LLM analysis")
+        return signals
+
+    payload = {
+        "systemInstruction": {"parts": [{"text": SYSTEM_PREAMBLE}]},
+        "contents": [{"role": "user", "parts": [{"text": build_user_section(fresh, markets)}]}],
+        "generationConfig": {
+            "response_mime_type": "application/json",
+            "response_schema": SIGNAL_SCHEMA,
+        },
+    }
 
     try:
-        result = subprocess.run(
-            [GEMINI_BIN, "-m", GEMINI_MODEL, "-p", prompt],
-            capture_output=True, text=True, timeout=60,
-        )
-    except subprocess.TimeoutExpired:
+        resp = CLIENT.post(GEMINI_URL, params={"key": api_key}, json=payload, timeout=60)
+        resp.raise_for_status()
+        text = resp.json()["candidates"][0]["content"]["parts"][0]["text"]
+    except httpx.TimeoutException:
         print("[LLM] Gemini timed out (60s)")
-        return []
-    except FileNotFoundError:
-        print(f"[LLM] Gemini binary not found at {GEMINI_BIN}")
-        return []
+        return signals
+    except (httpx.HTTPError, KeyError, IndexError, ValueError) as e:
+        print(f"[LLM] Gemini API call failed: {e}")
+        return signals
 
-    stdout = result.stdout.strip()
-    if not stdout:
-        print(f"[LLM] Empty response from Gemini (rc={result.returncode})")
-        return []
-
-    data = _extract_json(stdout)
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        # Schema-constrained output should be bare JSON; tolerate stray wrapping anyway
+        data = _extract_json(text)
     if not data or "signals" not in data:
-        print(f"[LLM] Failed to parse Gemini response: {stdout[:200]}")
-        return []
+        print(f"[LLM] Failed to parse Gemini response: {text[:200]}")
+        return signals
 
-    signals = []
+    per_news: dict[int, list[dict]] = {ni: [] for ni in range(len(fresh))}
     for s in data["signals"]:
         try:
-            ni = int(s["news_index"])
+            # Decode "[batch k, item i]" back to a flat index (batch is absent/0 when unbatched)
+            ni = int(s.get("batch") or 0) * NEWS_BATCH_SIZE + int(s["news_index"])
             mi = int(s["market_index"])
-            if ni >= len(news_items) or mi >= len(markets):
+            if ni >= len(fresh) or mi >= len(markets):
                 continue
-            signals.append(LLMSignal(
-                news_index=ni,
+            sig = LLMSignal(
+                news_index=fresh_idx[ni],
                 market_index=mi,
                 direction=s.get("direction", "YES_UP"),
                 estimated_probability=max(0.01, min(0.99, float(s.get("estimated_probability", 0.5)))),
                 confidence=max(0.5, min(1.0, float(s.get("confidence", 0.5)))),
                 reasoning=s.get("reasoning", ""),
-                news_title=news_items[ni].get("title", ""),
+                news_title=fresh[ni].get("title", ""),
                 market_question=markets[mi].get("question", ""),
                 market_id=markets[mi].get("id", ""),
-            ))
+            )
         except (KeyError, ValueError, IndexError):
             continue
+        signals.append(sig)
+        per_news[ni].append({
+            "market_id": str(sig.market_id),
+            "direction": sig.direction,
+            "estimated_probability": sig.estimated_probability,
+            "confidence": sig.confidence,
+            "reasoning": sig.reasoning,
+        })
 
-    return signals
+    now = time.time()
+    for ni, n in enumerate(fresh):
+        llm_cache[_news_cache_key(n, market_set)] = per_news[ni]
+    try:
+        _save_llm_cache()
+    except OSError as e:
+        print(f"[LLM] Could not persist {LLM_CACHE_FILE.name}: {e}")
+    for k in [k for k, (ts, _) in _RESP_CACHE.items() if now - ts >= RESP_CACHE_TTL]:
+        del _RESP_CACHE[k]
+    _RESP_CACHE[cache_key] = (now, signals)
+    return list(signals)
@@ -1,40 +1,64 @@
 """Polymarket market cache via Gamma API."""
 
-import json
 import time
 from pathlib import Path
 from datetime import datetime, timezone
 
-import httpx
+import orjson
+
+from ._http import CLIENT
 
 DATA_DIR = Path(__file__).parent
 CACHE_FILE = DATA_DIR / "market_cache.json"
+EXTENDED_CACHE_FILE = DATA_DIR / "market_cache_extended.json"
 CACHE_TTL = 300  # 5 minutes
 
+# Fields the scan path (matching, LLM prompt, edges) reads; everything else goes to the extended file
+CORE_FIELDS = ("id", "question", "outcomePrices", "volume", "clobTokenIds")
+
+_extended_cache: tuple[int, dict[str, dict]] | None = None  # (file mtime, id -> extended fields)
+
 GAMMA_URL = "https://gamma-api.polymarket.com/markets"
 
 
+def _parse_embedded(values: list[str]) -> list:
+    """Parse a column of JSON-encoded strings (Gamma embeds arrays as strings).
+
+    Joins them into one array and parses once; falls back per-item if any is malformed.
+    """
+    try:
+        parsed = orjson.loads("[" + ",".join(v or "[]" for v in values) + "]")
+        if len(parsed) == len(values):
+            return parsed
+    except (orjson.JSONDecodeError, TypeError):
+        pass
+
+    parsed = []
+    for v in values:
+        try:
+            parsed.append(v if isinstance(v, list) else orjson.loads(v or "[]"))
+        except (orjson.JSONDecodeError, TypeError):
+            parsed.append([])
+    return parsed
+
+
 def fetch_markets() -> list[dict]:
     """Fetch active markets from Gamma API, return parsed list."""
     params = {"closed": "false", "limit": 100, "order": "volume", "ascending": "false"}
-    resp = httpx.get(GAMMA_URL, params=params, timeout=30,
-                     headers={"User-Agent": "Mozilla/5.0"})
+    resp = CLIENT.get(GAMMA_URL, params=params)
     resp.raise_for_status()
-    raw = resp.json()
+    raw = orjson.loads(resp.content)
+
+    all_prices = _parse_embedded([m.get("outcomePrices", "[]") for m in raw])
+    all_clob_ids = _parse_embedded([m.get("clobTokenIds", "[]") for m in raw])
 
     markets = []
-    for m in raw:
+    for m, outcome_prices, clob_ids in zip(raw, all_prices, all_clob_ids):
         try:
-            outcome_prices = json.loads(m.get("outcomePrices", "[]"))
             prices = [float(p) for p in outcome_prices]
-        except (json.JSONDecodeError, ValueError):
+        except (TypeError, ValueError):
             prices = []
 
-        try:
-            clob_ids = json.loads(m.get("clobTokenIds", "[]"))
-        except (json.JSONDecodeError, ValueError):
-            clob_ids = []
-
         markets.append({
             "id": m.get("id", ""),
             "question": m.get("question", ""),
@@ -51,24 +75,53 @@ def fetch_markets() -> list[dict]:
 
 
 def get_markets(force_refresh: bool = False) -> list[dict]:
-    """Return cached markets, refreshing if stale."""
+    """Return cached markets (core fields only), refreshing if stale.
+
+    Description, slug, endDate etc. are available via get_market_extended().
+    """
     if not force_refresh and CACHE_FILE.exists():
         try:
-            data = json.loads(CACHE_FILE.read_text())
+            data = orjson.loads(CACHE_FILE.read_bytes())
             if time.time() - data.get("fetched_at", 0) < CACHE_TTL:
                 return data["markets"]
         except Exception:
             pass
 
-    markets = fetch_markets()
-    CACHE_FILE.write_text(json.dumps({
-        "fetched_at": time.time(),
+    fetched_at = time.time()
+    markets = []
+    extended = {}
+    for m in fetch_markets():
+        markets.append({k: m[k] for k in CORE_FIELDS})
+        extended[m["id"]] = {k: v for k, v in m.items() if k not in CORE_FIELDS}
+
+    EXTENDED_CACHE_FILE.write_bytes(orjson.dumps({"fetched_at": fetched_at, "markets": extended}))
+    CACHE_FILE.write_bytes(orjson.dumps({
+        "fetched_at": fetched_at,
         "count": len(markets),
         "markets": markets,
-    }, indent=2))
+    }))
     return markets
 
 
+def get_market_extended() -> dict[str, dict]:
+    """Return {market_id: {description, slug, endDate, ...}} from the extended cache file.
+
+    Loaded lazily and kept in memory until the file changes.
+    """
+    global _extended_cache
+    try:
+        mtime = EXTENDED_CACHE_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    if _extended_cache is None or _extended_cache[0] != mtime:
+        try:
+            data = orjson.loads(EXTENDED_CACHE_FILE.read_bytes())
+            _extended_cache = (mtime, data.get("markets", {}))
+        except Exception:
+            return {}
+    return _extended_cache[1]
+
+
 if __name__ == "__main__":
     from rich.console import Console
     console = Console()
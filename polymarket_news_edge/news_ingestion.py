@@ -1,19 +1,30 @@
 """Real-time news pipeline — RSS feeds, CoinGecko trending, Fear & Greed Index, Chinese crypto media."""
 
-import json
+import os
 import re
 import time
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 
 import feedparser
-import httpx
+import orjson
+
+from ._http import CLIENT
 
 DATA_DIR = Path(__file__).parent
 NEWS_FILE = DATA_DIR / "news_feed.json"
 MAX_ITEMS = 100
 
+# news_feed.json is only re-read when its mtime changes (monitor mode ingests every cycle)
+_feed_cache: list[dict] | None = None
+_feed_mtime: int = 0
+_seen_ids: set[str] = set()
+
+# Conditional-GET validators per feed URL: url -> (ETag, Last-Modified, items parsed from that body)
+_feed_validators: dict[str, tuple[str | None, str | None, list[dict]]] = {}
+
 RSS_FEEDS = {
     "Reuters": "https://www.reutersagency.com/feed/?taxonomy=best-sectors&post_type=best",
     "AP": "https://rsshub.app/apnews/topics/apf-business",
@@ -33,51 +44,84 @@ FALLBACK_FEEDS = {
 
 
 def _item_id(title: str, source: str) -> str:
-    return hashlib.md5(f"{source}:{title}".encode()).hexdigest()
+    return hashlib.blake2b(f"{source}:{title}".encode(), digest_size=8).hexdigest()
+
 
+def _migrate_legacy_ids(items: list[dict]):
+    """Re-key items saved with the old 32-char md5 ids so they keep deduplicating.
 
-def fetch_rss() -> list[dict]:
-    """Fetch articles from all RSS feeds."""
+    Only ids that really are md5(source:title) can be recomputed; the rest
+    (CoinGecko, Fear&Greed) keep their old id and age out of the feed.
+    """
+    for item in items:
+        if len(item["id"]) != 32:
+            continue
+        key = f"{item.get('source', '')}:{item.get('title', '')}".encode()
+        if hashlib.md5(key).hexdigest() == item["id"]:
+            item["id"] = hashlib.blake2b(key, digest_size=8).hexdigest()
+
+
+def _fetch_feed(source: str, url: str, now_iso: str) -> list[dict]:
+    """Fetch and parse a single RSS feed; a failure only drops that feed."""
     items = []
-    client = httpx.Client(timeout=8, follow_redirects=True, headers={"User-Agent": "Mozilla/5.0"})
+    headers = {}
+    cached = _feed_validators.get(url)
+    if cached:
+        if cached[0]:
+            headers["If-None-Match"] = cached[0]
+        if cached[1]:
+            headers["If-Modified-Since"] = cached[1]
+    try:
+        resp = CLIENT.get(url, headers=headers, timeout=8, follow_redirects=True)
+        if resp.status_code == 304 and cached:
+            return cached[2]  # unchanged since last scan — skip feedparser entirely
+        feed = feedparser.parse(resp.text)
+        for entry in feed.entries[:10]:
+            title = entry.get("title", "")
+            summary = entry.get("summary", entry.get("description", ""))[:500]
+            published = entry.get("published", "")
+            items.append({
+                "id": _item_id(title, source),
+                "source": source,
+                "title": title,
+                "summary": summary,
+                "published": published,
+                "fetched_at": now_iso,
+                "url": entry.get("link", ""),
+            })
+        etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+        if resp.is_success and (etag or last_modified):
+            _feed_validators[url] = (etag, last_modified, items)
+    except Exception as e:
+        print(f"  [warn] {source}: {e}")
+    return items
 
+
+def fetch_rss(now_iso: str | None = None) -> list[dict]:
+    """Fetch articles from all RSS feeds concurrently (wall time ≈ the slowest feed)."""
+    now_iso = now_iso or datetime.now(timezone.utc).isoformat()
     all_feeds = {**RSS_FEEDS, **FALLBACK_FEEDS}
-    for source, url in all_feeds.items():
-        try:
-            resp = client.get(url)
-            feed = feedparser.parse(resp.text)
-            for entry in feed.entries[:10]:
-                title = entry.get("title", "")
-                summary = entry.get("summary", entry.get("description", ""))[:500]
-                published = entry.get("published", "")
-                items.append({
-                    "id": _item_id(title, source),
-                    "source": source,
-                    "title": title,
-                    "summary": summary,
-                    "published": published,
-                    "fetched_at": datetime.now(timezone.utc).isoformat(),
-                    "url": entry.get("link", ""),
-                })
-        except Exception as e:
-            print(f"  [warn] {source}: {e}")
-    client.close()
-    return items
+    with ThreadPoolExecutor(max_workers=len(all_feeds)) as pool:
+        results = pool.map(_fetch_feed, all_feeds.keys(), all_feeds.values(), [now_iso] * len(all_feeds))
+        return [item for feed_items in results for item in feed_items]
+
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
 
 
 def _strip_html(text: str) -> str:
     """Remove HTML tags from text."""
-    return re.sub(r'<[^>]+>', '', text).strip()
+    return _HTML_TAG_RE.sub('', text).strip()
 
 
-def fetch_blockbeats() -> list[dict]:
+def fetch_blockbeats(now_iso: str | None = None) -> list[dict]:
     """Fetch flash news from BlockBeats (律动)."""
+    now_iso = now_iso or datetime.now(timezone.utc).isoformat()
     items = []
     try:
-        resp = httpx.get(
+        resp = CLIENT.get(
             "https://api.theblockbeats.news/v1/open-api/open-flash?size=20&page=1&type=push",
             timeout=15,
-            headers={"User-Agent": "Mozilla/5.0"},
         )
         data = resp.json()
         if data.get("status") == 0:
@@ -88,14 +132,14 @@ def fetch_blockbeats() -> list[dict]:
                 try:
                     published = datetime.fromtimestamp(int(ts), tz=timezone.utc).isoformat()
                 except (ValueError, OSError):
-                    published = datetime.now(timezone.utc).isoformat()
+                    published = now_iso
                 items.append({
                     "id": _item_id(title, "BlockBeats"),
                     "source": "BlockBeats",
                     "title": title,
                     "summary": content,
                     "published": published,
-                    "fetched_at": datetime.now(timezone.utc).isoformat(),
+                    "fetched_at": now_iso,
                     "url": entry.get("link", "https://www.theblockbeats.news"),
                 })
     except Exception as e:
@@ -103,12 +147,12 @@ def fetch_blockbeats() -> list[dict]:
     return items
 
 
-def fetch_coingecko_trending() -> list[dict]:
+def fetch_coingecko_trending(now_iso: str | None = None) -> list[dict]:
     """Fetch CoinGecko trending coins as pseudo-news items."""
+    now_iso = now_iso or datetime.now(timezone.utc).isoformat()
     items = []
     try:
-        resp = httpx.get("https://api.coingecko.com/api/v3/search/trending", timeout=15,
-                         headers={"User-Agent": "Mozilla/5.0"})
+        resp = CLIENT.get("https://api.coingecko.com/api/v3/search/trending", timeout=15)
         data = resp.json()
         for coin in data.get("coins", [])[:5]:
             c = coin["item"]
@@ -117,8 +161,8 @@ def fetch_coingecko_trending() -> list[dict]:
                 "source": "CoinGecko-Trending",
                 "title": f"Trending: {c['name']} ({c['symbol']}) — rank #{c.get('market_cap_rank', '?')}",
                 "summary": f"{c['name']} is trending on CoinGecko. Score: {c.get('score', 'N/A')}",
-                "published": datetime.now(timezone.utc).isoformat(),
-                "fetched_at": datetime.now(timezone.utc).isoformat(),
+                "published": now_iso,
+                "fetched_at": now_iso,
                 "url": f"https://www.coingecko.com/en/coins/{c['id']}",
             })
     except Exception as e:
@@ -126,19 +170,20 @@ def fetch_coingecko_trending() -> list[dict]:
     return items
 
 
-def fetch_fear_greed() -> list[dict]:
+def fetch_fear_greed(now_iso: str | None = None) -> list[dict]:
     """Fetch Fear & Greed Index."""
+    now_iso = now_iso or datetime.now(timezone.utc).isoformat()
     items = []
     try:
-        resp = httpx.get("https://api.alternative.me/fng/?limit=1", timeout=15)
+        resp = CLIENT.get("https://api.alternative.me/fng/?limit=1", timeout=15)
         data = resp.json()["data"][0]
         items.append({
             "id": _item_id(f"fng-{data['timestamp']}", "FearGreed"),
             "source": "Fear&Greed",
             "title": f"Crypto Fear & Greed Index: {data['value']} ({data['value_classification']})",
             "summary": f"Current index: {data['value']}/100 — {data['value_classification']}",
-            "published": datetime.now(timezone.utc).isoformat(),
-            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "published": now_iso,
+            "fetched_at": now_iso,
             "url": "https://alternative.me/crypto/fear-and-greed-index/",
         })
     except Exception as e:
@@ -146,26 +191,73 @@ def fetch_fear_greed() -> list[dict]:
     return items
 
 
+def load_news() -> list[dict]:
+    """Return the news feed, re-parsing news_feed.json only if it changed on disk.
+
+    The returned list is the shared cached copy; treat it as read-only.
+    """
+    global _feed_cache, _feed_mtime, _seen_ids
+    try:
+        mtime = NEWS_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        _feed_cache, _seen_ids = None, set()
+        return []
+    if _feed_cache is not None and mtime == _feed_mtime:
+        return _feed_cache
+    try:
+        _feed_cache = orjson.loads(NEWS_FILE.read_bytes())
+        _migrate_legacy_ids(_feed_cache)
+    except Exception:
+        _feed_cache = []
+    _seen_ids = {item["id"] for item in _feed_cache}
+    _feed_mtime = mtime
+    return _feed_cache
+
+
 def ingest() -> list[dict]:
     """Run full ingestion, deduplicate, save to news_feed.json. Returns new items."""
-    existing = []
-    if NEWS_FILE.exists():
-        try:
-            existing = json.loads(NEWS_FILE.read_text())
-        except Exception:
-            existing = []
+    return ingest_with_feed()[0]
+
 
-    seen_ids = {item["id"] for item in existing}
+def ingest_with_feed() -> tuple[list[dict], list[dict]]:
+    """Like ingest(), but returns (new_items, all_news).
 
+    all_news is the full feed as written, so callers don't need to read the
+    file back.
+    """
+    global _feed_cache, _feed_mtime
+    existing = load_news()
+
+    # One timestamp for the whole scan — every fetched_at means "this scan"
+    now_iso = datetime.now(timezone.utc).isoformat()
+    # All sources are network-bound and independent — fetch them side by side
+    fetchers = (fetch_rss, fetch_blockbeats, fetch_coingecko_trending, fetch_fear_greed)
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as pool:
+        futures = [pool.submit(fetch, now_iso) for fetch in fetchers]
+        batches = [f.result() for f in futures]
+
+    # _seen_ids persists across scans; only this scan's new ids are tracked separately
+    new_ids = set()
     new_items = []
-    for item in fetch_rss() + fetch_blockbeats() + fetch_coingecko_trending() + fetch_fear_greed():
-        if item["id"] not in seen_ids:
+    for item in (item for batch in batches for item in batch):
+        if item["id"] not in _seen_ids and item["id"] not in new_ids:
             new_items.append(item)
-            seen_ids.add(item["id"])
+            new_ids.add(item["id"])
+
+    if not new_items and _feed_cache is not None:
+        return new_items, existing  # nothing to add — skip the rewrite
 
-    combined = (new_items + existing)[:MAX_ITEMS]
-    NEWS_FILE.write_text(json.dumps(combined, indent=2))
-    return new_items
+    merged = new_items + existing
+    combined = merged[:MAX_ITEMS]
+    tmp = NEWS_FILE.with_suffix(".json.tmp")
+    tmp.write_bytes(orjson.dumps(combined))
+    os.replace(tmp, NEWS_FILE)
+    _feed_cache = combined
+    _feed_mtime = NEWS_FILE.stat().st_mtime_ns
+    # Keep the seen set in step with the MAX_ITEMS window: add new ids, drop aged-out ones
+    _seen_ids.update(new_ids)
+    _seen_ids.difference_update(item["id"] for item in merged[MAX_ITEMS:])
+    return new_items, combined
 
 
 if __name__ == "__main__":
@@ -1,21 +1,26 @@
 """Position management and exit strategy for paper trading."""
 
-import json
+import os
+import threading
+import time
 import uuid
-import httpx
+import orjson
 from pathlib import Path
-from datetime import datetime, timezone, timedelta
-from dataclasses import dataclass, asdict, field
+from datetime import datetime, timezone
+from dataclasses import dataclass, asdict, field, fields
 
 from rich.console import Console
 from rich.table import Table
 from rich import box
 
+from ._http import CLIENT
+
 console = Console()
 
 DATA_DIR = Path(__file__).parent
 POSITIONS_FILE = DATA_DIR / "positions.json"
-HISTORY_FILE = DATA_DIR / "trade_history.json"
+HISTORY_FILE = DATA_DIR / "trade_history.jsonl"  # append-only, one closed trade per line
+LEGACY_HISTORY_FILE = DATA_DIR / "trade_history.json"
 
 # Risk parameters
 MAX_OPEN_POSITIONS = 5
@@ -24,9 +29,28 @@ MAX_TOTAL_EXPOSURE_PCT = 0.30  # 30% total
 COOLDOWN_HOURS = 1
 TIMEOUT_HOURS = 24
 TIMEOUT_MOVE_THRESHOLD = 0.02  # <2% move = "no movement"
+_COOLDOWN_SECS = COOLDOWN_HOURS * 3600
+_TIMEOUT_SECS = TIMEOUT_HOURS * 3600
+
+# In-process copy of positions.json, reused while the file's mtime is unchanged
+_positions_lock = threading.Lock()
+_positions_cache: list["Position"] | None = None
+_positions_mtime: int = 0
+
 
+def _iso_to_ts(ts: str) -> float | None:
+    """Epoch seconds for an ISO timestamp, or None if it doesn't parse.
 
-@dataclass
+    One bad record must not make _load_positions drop (and the next save wipe)
+    the whole file.
+    """
+    try:
+        return datetime.fromisoformat(ts).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True)
 class Position:
     id: str
     market_id: str
@@ -44,6 +68,17 @@ class Position:
     exit_reason: str | None = None
     pnl: float | None = None
     trigger_news: str = ""
+    # Epoch-seconds mirrors of entry_time/exit_time — used for all age math
+    # (None when a legacy timestamp can't be parsed)
+    entry_ts: float | None = 0.0
+    exit_ts: float | None = None
+
+    def __post_init__(self):
+        # Migrate records written before the *_ts fields existed (parsed once, saved on next write)
+        if not self.entry_ts and self.entry_time:
+            self.entry_ts = _iso_to_ts(self.entry_time)
+        if self.exit_ts is None and self.exit_time:
+            self.exit_ts = _iso_to_ts(self.exit_time)
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -51,48 +86,77 @@ class Position:
     @classmethod
     def from_dict(cls, d: dict) -> "Position":
         # Handle any extra/missing fields gracefully
-        valid = {f.name for f in cls.__dataclass_fields__.values()}
-        return cls(**{k: v for k, v in d.items() if k in valid})
+        return cls(**{k: v for k, v in d.items() if k in _POSITION_FIELDS})
+
+
+_POSITION_FIELDS = frozenset(f.name for f in fields(Position))
 
 
 def _load_positions() -> list[Position]:
-    if not POSITIONS_FILE.exists():
-        return []
-    try:
-        data = json.loads(POSITIONS_FILE.read_text())
-        return [Position.from_dict(d) for d in data]
-    except Exception:
-        return []
+    """Return the positions list, re-parsing positions.json only if it changed on disk.
+
+    The returned list is the shared cached copy; callers that mutate it must
+    hand it back to _save_positions.
+    """
+    global _positions_cache, _positions_mtime
+    with _positions_lock:
+        try:
+            mtime = POSITIONS_FILE.stat().st_mtime_ns
+        except FileNotFoundError:
+            _positions_cache = None
+            return []
+        if _positions_cache is not None and mtime == _positions_mtime:
+            return _positions_cache
+        try:
+            data = orjson.loads(POSITIONS_FILE.read_bytes())
+            _positions_cache = [Position.from_dict(d) for d in data]
+        except Exception:
+            _positions_cache = None
+            return []
+        _positions_mtime = mtime
+        return _positions_cache
 
 
 def _save_positions(positions: list[Position]):
-    POSITIONS_FILE.write_text(json.dumps([p.to_dict() for p in positions], indent=2))
+    """Atomically write positions.json (tempfile + rename) and refresh the cache."""
+    global _positions_cache, _positions_mtime
+    with _positions_lock:
+        tmp = POSITIONS_FILE.with_suffix(".json.tmp")
+        tmp.write_bytes(orjson.dumps([p.to_dict() for p in positions]))
+        os.replace(tmp, POSITIONS_FILE)
+        _positions_cache = positions
+        _positions_mtime = POSITIONS_FILE.stat().st_mtime_ns
+
+
+def _migrate_legacy_history():
+    """One-time conversion of the old trade_history.json array to JSON Lines."""
+    if not LEGACY_HISTORY_FILE.exists():
+        return
+    try:
+        records = orjson.loads(LEGACY_HISTORY_FILE.read_bytes())
+    except Exception:
+        records = []
+    with HISTORY_FILE.open("ab") as f:
+        for rec in records:
+            f.write(orjson.dumps(rec) + b"\n")
+    LEGACY_HISTORY_FILE.unlink()
 
 
 def _append_history(position: Position):
-    history = []
-    if HISTORY_FILE.exists():
-        try:
-            history = json.loads(HISTORY_FILE.read_text())
-        except Exception:
-            history = []
-    history.append(position.to_dict())
-    HISTORY_FILE.write_text(json.dumps(history, indent=2))
+    _migrate_legacy_history()
+    with HISTORY_FILE.open("ab") as f:
+        f.write(orjson.dumps(position.to_dict()) + b"\n")
 
 
 def _fetch_market_price(market_id: str) -> float | None:
     """Fetch fresh price for a market from Gamma API."""
     try:
-        resp = httpx.get(
-            f"https://gamma-api.polymarket.com/markets?id={market_id}",
-            timeout=15,
-            headers={"User-Agent": "Mozilla/5.0"},
-        )
+        resp = CLIENT.get(f"https://gamma-api.polymarket.com/markets?id={market_id}", timeout=15)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
         if isinstance(data, list) and data:
             data = data[0]
-        prices = json.loads(data.get("outcomePrices", "[]"))
+        prices = orjson.loads(data.get("outcomePrices", "[]"))
         if prices:
             return float(prices[0])  # YES price
     except Exception as e:
@@ -100,6 +164,51 @@ def _fetch_market_price(market_id: str) -> float | None:
     return None
 
 
+def _fetch_market_prices(market_ids: list[str]) -> dict[str, float]:
+    """Fetch fresh YES prices for several markets in one Gamma API request.
+
+    Ids missing from the bulk response fall back to a single-market fetch.
+    """
+    ids = list(dict.fromkeys(market_ids))
+    if not ids:
+        return {}
+
+    prices: dict[str, float] = {}
+    try:
+        resp = CLIENT.get(
+            "https://gamma-api.polymarket.com/markets",
+            params=[("id", mid) for mid in ids] + [("limit", len(ids))],
+            timeout=15,
+        )
+        resp.raise_for_status()
+        for m in orjson.loads(resp.content):
+            try:
+                outcome_prices = m.get("outcomePrices", "[]")
+                if isinstance(outcome_prices, str):
+                    outcome_prices = orjson.loads(outcome_prices)
+                if outcome_prices:
+                    prices[str(m.get("id", ""))] = float(outcome_prices[0])
+            except (orjson.JSONDecodeError, TypeError, ValueError):
+                continue
+    except Exception as e:
+        console.print(f"[dim red]  ⚠ Bulk price fetch failed ({len(ids)} markets): {e}[/dim red]")
+
+    for mid in ids:
+        if mid not in prices:
+            price = _fetch_market_price(mid)
+            if price is not None:
+                prices[mid] = price
+    return prices
+
+
+def _index_by_market(positions: list[Position]) -> dict[str, list[Position]]:
+    """Group positions by market_id."""
+    index: dict[str, list[Position]] = {}
+    for p in positions:
+        index.setdefault(p.market_id, []).append(p)
+    return index
+
+
 def open_position(
     market_id: str,
     question: str,
@@ -112,7 +221,9 @@ def open_position(
     """Open a new paper position if risk checks pass. Returns Position or None."""
     positions = _load_positions()
     open_positions = [p for p in positions if p.status == "open"]
+    same_market = _index_by_market(positions).get(market_id, [])
     now = datetime.now(timezone.utc)
+    now_ts = now.timestamp()
 
     # --- Risk checks ---
     if len(open_positions) >= MAX_OPEN_POSITIONS:
@@ -120,15 +231,15 @@ def open_position(
         return None
 
     # No duplicate market
-    if any(p.market_id == market_id for p in open_positions):
+    if any(p.status == "open" for p in same_market):
         console.print(f"[yellow]  ⚠ Already have position on this market, skipping[/yellow]")
         return None
 
     # Cooldown check
-    closed_same = [p for p in positions if p.market_id == market_id and p.status == "closed" and p.exit_time]
-    for cp in closed_same:
-        exit_dt = datetime.fromisoformat(cp.exit_time)
-        if now - exit_dt < timedelta(hours=COOLDOWN_HOURS):
+    for cp in same_market:
+        if cp.status != "closed" or not cp.exit_ts:
+            continue
+        if now_ts - cp.exit_ts < _COOLDOWN_SECS:
             console.print(f"[yellow]  ⚠ Cooldown active for this market (exited {cp.exit_time})[/yellow]")
             return None
 
@@ -167,6 +278,7 @@ def open_position(
         stop_loss=stop_loss,
         entry_time=now.isoformat(),
         trigger_news=trigger_news[:200],
+        entry_ts=now_ts,
     )
 
     positions.append(pos)
@@ -175,11 +287,13 @@ def open_position(
     return pos
 
 
-def _close_position(pos: Position, exit_price: float, reason: str):
-    """Close a position and record PnL."""
+def _close_position(pos: Position, exit_price: float, reason: str, now: datetime | None = None):
+    """Close a position and record PnL. `now` lets a batch of closes share one timestamp."""
     pos.status = "closed"
     pos.exit_price = exit_price
-    pos.exit_time = datetime.now(timezone.utc).isoformat()
+    now = now or datetime.now(timezone.utc)
+    pos.exit_time = now.isoformat()
+    pos.exit_ts = now.timestamp()
     pos.exit_reason = reason
 
     if pos.direction == "BUY_YES":
@@ -203,10 +317,12 @@ def check_exits() -> int:
         return 0
 
     now = datetime.now(timezone.utc)
+    timeout_cutoff = now.timestamp() - _TIMEOUT_SECS
     closed_count = 0
+    yes_prices = _fetch_market_prices([p.market_id for p in open_positions])
 
     for pos in open_positions:
-        yes_price = _fetch_market_price(pos.market_id)
+        yes_price = yes_prices.get(pos.market_id)
         if yes_price is None:
             continue
 
@@ -218,19 +334,17 @@ def check_exits() -> int:
 
         # Check exit conditions
         if current >= pos.target_price:
-            _close_position(pos, current, "TAKE_PROFIT")
+            _close_position(pos, current, "TAKE_PROFIT", now)
             closed_count += 1
         elif current <= pos.stop_loss:
-            _close_position(pos, current, "STOP_LOSS")
+            _close_position(pos, current, "STOP_LOSS", now)
             closed_count += 1
         else:
             # Timeout check
-            entry_dt = datetime.fromisoformat(pos.entry_time)
-            age = now - entry_dt
-            if age > timedelta(hours=TIMEOUT_HOURS):
+            if pos.entry_ts is not None and pos.entry_ts < timeout_cutoff:
                 move = abs(current - pos.entry_price)
                 if move < TIMEOUT_MOVE_THRESHOLD:
-                    _close_position(pos, current, "TIMEOUT")
+                    _close_position(pos, current, "TIMEOUT", now)
                     closed_count += 1
 
     _save_positions(positions)
@@ -265,7 +379,7 @@ def display_positions(bankroll: float = 1000.0):
     """Rich display of current positions and summary."""
     summary = get_summary(bankroll)
     open_pos = summary["open_positions"]
-    now = datetime.now(timezone.utc)
+    now_ts = time.time()
 
     console.print()
     console.print(f"[bold]📊 Open Positions ({summary['open_count']}/{summary['max_positions']})[/bold]")
@@ -281,8 +395,9 @@ def display_positions(bankroll: float = 1000.0):
         table.add_column("PnL", justify="right")
         table.add_column("Age", justify="right")
 
+        yes_prices = _fetch_market_prices([p.market_id for p in open_pos])
         for pos in open_pos:
-            yes_price = _fetch_market_price(pos.market_id)
+            yes_price = yes_prices.get(pos.market_id)
             if pos.direction == "BUY_YES":
                 current = yes_price or pos.entry_price
             else:
@@ -291,9 +406,11 @@ def display_positions(bankroll: float = 1000.0):
             pnl_pct = (current - pos.entry_price) / pos.entry_price * 100 if pos.entry_price > 0 else 0
             pnl_color = "green" if pnl_pct >= 0 else "red"
 
-            entry_dt = datetime.fromisoformat(pos.entry_time)
-            age = now - entry_dt
-            age_str = f"{int(age.total_seconds()//3600)}h{int((age.total_seconds()%3600)//60)}m"
+            if pos.entry_ts is None:
+                age_str = "?"
+            else:
+                age_s = now_ts - pos.entry_ts
+                age_str = f"{int(age_s//3600)}h{int((age_s%3600)//60)}m"
 
             table.add_row(
                 pos.question[:30],
@@ -309,10 +426,10 @@ def display_positions(bankroll: float = 1000.0):
     else:
         console.print("  [dim]No open positions[/dim]")
 
-    # Closed today
-    today = now.date()
+    # Closed today (UTC day — epoch seconds are aligned to UTC midnight)
+    today_start = now_ts - now_ts % 86400
     closed_today = [p for p in summary["closed_positions"]
-                    if p.exit_time and datetime.fromisoformat(p.exit_time).date() == today]
+                    if p.exit_ts and today_start <= p.exit_ts < today_start + 86400]
     today_pnl = sum(p.pnl or 0 for p in closed_today)
     today_winners = len([p for p in closed_today if (p.pnl or 0) > 0])
     today_wr = today_winners / len(closed_today) * 100 if closed_today else 0
@@ -1,8 +1,9 @@
 """Multi-signal probability estimation with directional logic and aggregation."""
 
-import math
 from dataclasses import dataclass
 
+import numpy as np
+
 # Source credibility weights (0-1 scale)
 SOURCE_WEIGHTS = {
     "Reuters": 1.0, "AP": 1.0, "Bloomberg": 1.0,
@@ -20,8 +21,17 @@ IMPORTANCE_SHIFT = {
     5: 0.18,  # Major breaking news (Fed decision, war, etc.)
 }
 
+# Int-keyed forms of the tables above. Sources are resolved to an id once per news item
+# (see event_parser.parse_news_item); unknown sources get the trailing 0.3 slot.
+SOURCE_ID = {name: i for i, name in enumerate(SOURCE_WEIGHTS)}
+UNKNOWN_SOURCE_ID = len(SOURCE_WEIGHTS)
+SRC_W = tuple(SOURCE_WEIGHTS.values()) + (0.3,)
+# Indexed by importance; slot 0 holds the 0.04 default for out-of-range values
+IMP_TABLE = (0.04,) + tuple(IMPORTANCE_SHIFT[i] for i in range(1, 6))
+_IMP_TABLE = np.array(IMP_TABLE)
+
 
-@dataclass
+@dataclass(slots=True)
 class ProbEstimate:
     market_id: str
     question: str
@@ -55,7 +65,7 @@ def estimate_single_signal(
     sentiment: float,
     match_score: float,
     importance: int,
-    source: str,
+    source_id: int,
     is_breaking: bool,
     yes_means_up: bool | None,
     question_type: str,
@@ -69,12 +79,12 @@ def estimate_single_signal(
     direction = compute_directional_shift(sentiment, yes_means_up, question_type)
 
     # Magnitude based on importance
-    max_shift = IMPORTANCE_SHIFT.get(importance, 0.04)
+    max_shift = IMP_TABLE[importance if 1 <= importance <= 5 else 0]
     if is_breaking:
         max_shift *= 1.5
 
     # Source credibility
-    cred = SOURCE_WEIGHTS.get(source, 0.3)
+    cred = SRC_W[source_id]
 
     # Match quality
     match_quality = match_score / 100.0
@@ -82,130 +92,228 @@ def estimate_single_signal(
     # Recency decay
     recency = max(0.1, 1.0 / (1.0 + news_age_hours / 4.0))
 
-    # The shift this signal suggests
-    shift = direction * max_shift * cred * match_quality * recency
+    # The shift this signal suggests. Grouped as two independent products so the
+    # same shape in the JIT kernel can pair them; match_quality * recency is shared.
+    quality = match_quality * recency
+    shift = direction * (max_shift * cred) * quality
 
     # Weight for aggregation
-    weight = cred * match_quality * recency * (1.5 if is_breaking else 1.0)
+    weight = cred * quality * (1.5 if is_breaking else 1.0)
 
     return shift, weight
 
 
-def aggregate_signals(
-    current_price: float,
-    signal_data: list[dict],
-    volume: float,
-) -> tuple[float, float]:
+def _signal_shifts(
+    sentiment: np.ndarray,
+    match_score: np.ndarray,
+    importance: np.ndarray,
+    cred: np.ndarray,
+    is_breaking: np.ndarray,
+    yes_sign: np.ndarray,
+    news_age_hours: float | np.ndarray = 1.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Array form of estimate_single_signal: (shift, weight) for every signal at once."""
+    direction = sentiment * yes_sign
+    imp = np.where((importance >= 1) & (importance <= 5), importance, 0)
+    breaking_mult = np.where(is_breaking, 1.5, 1.0)
+    max_shift = _IMP_TABLE[imp] * breaking_mult
+    match_quality = match_score / 100.0
+    recency = np.maximum(0.1, 1.0 / (1.0 + news_age_hours / 4.0))
+    quality = match_quality * recency
+    shift = direction * (max_shift * cred) * quality
+    weight = cred * quality * breaking_mult
+    return shift, weight
+
+
+def _signal_totals_numpy(market_idx, signal_idx, match_score, yes_sign,
+                         sentiment, importance, cred, is_breaking):
+    """
+    Per-market sums over the (signal, market) rows.
+    Rows carry market_idx/signal_idx/match_score; yes_sign is per market, the rest per signal.
+    Returns (n_signals, total_shift, total_weight, total_abs_shift, total_match, total_cred).
     """
-    Aggregate multiple news signals for a single market.
-    Returns (estimated_probability, confidence).
+    n_markets = yes_sign.shape[0]
+    row_cred = cred[signal_idx]
+    shift, weight = _signal_shifts(
+        sentiment[signal_idx], match_score, importance[signal_idx], row_cred,
+        is_breaking[signal_idx], yes_sign[market_idx],
+    )
+    return (
+        np.bincount(market_idx, minlength=n_markets).astype(np.float64),
+        np.bincount(market_idx, weights=shift * weight, minlength=n_markets),
+        np.bincount(market_idx, weights=weight, minlength=n_markets),
+        np.bincount(market_idx, weights=np.abs(shift), minlength=n_markets),
+        np.bincount(market_idx, weights=match_score, minlength=n_markets),
+        np.bincount(market_idx, weights=row_cred, minlength=n_markets),
+    )
+
+
+def _signal_totals_loop(market_idx, signal_idx, match_score, yes_sign,
+                        sentiment, importance, cred, is_breaking):
+    """Single-pass loop form of _signal_totals_numpy, for numba to compile without temporaries."""
+    n_markets = yes_sign.shape[0]
+    n_signals = np.zeros(n_markets)
+    total_shift = np.zeros(n_markets)
+    total_weight = np.zeros(n_markets)
+    total_abs_shift = np.zeros(n_markets)
+    total_match = np.zeros(n_markets)
+    total_cred = np.zeros(n_markets)
+    recency = max(0.1, 1.0 / (1.0 + 1.0 / 4.0))  # news_age_hours = 1.0
+    for i in range(market_idx.shape[0]):
+        m = market_idx[i]
+        j = signal_idx[i]
+        imp = importance[j]
+        breaking_mult = 1.5 if is_breaking[j] else 1.0
+        max_shift = _IMP_TABLE[imp if 1 <= imp <= 5 else 0] * breaking_mult
+        match_quality = match_score[i] / 100.0
+        quality = match_quality * recency
+        shift = sentiment[j] * yes_sign[m] * (max_shift * cred[j]) * quality
+        weight = cred[j] * quality * breaking_mult
+        n_signals[m] += 1.0
+        total_shift[m] += shift * weight
+        total_weight[m] += weight
+        total_abs_shift[m] += abs(shift)
+        total_match[m] += match_score[i]
+        total_cred[m] += cred[j]
+    return n_signals, total_shift, total_weight, total_abs_shift, total_match, total_cred
+
+
+_signal_totals_kernel = None  # set by _signal_totals() on first use
+
+
+def _signal_totals(*arrays):
+    """Run the numba-compiled _signal_totals_loop, or _signal_totals_numpy without numba.
+
+    The kernel is resolved on the first call so importing the package doesn't
+    pay for importing numba or the JIT compile.
     """
-    if not signal_data:
-        return current_price, 0.0
-
-    total_shift = 0.0
-    total_weight = 0.0
-
-    for sig in signal_data:
-        shift, weight = estimate_single_signal(
-            sentiment=sig["sentiment"],
-            match_score=sig["match_score"],
-            importance=sig["importance"],
-            source=sig["source"],
-            is_breaking=sig["is_breaking"],
-            yes_means_up=sig.get("yes_means_up"),
-            question_type=sig.get("question_type", "binary_event"),
-        )
-        total_shift += shift * weight
-        total_weight += weight
-
-    if total_weight == 0:
-        return current_price, 0.0
-
-    # Weighted average shift
-    net_shift = total_shift / total_weight
+    global _signal_totals_kernel
+    if _signal_totals_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional — compute_estimates falls back to plain NumPy
+            _signal_totals_kernel = _signal_totals_numpy
+        else:
+            # "contract" lets LLVM fuse multiply-adds into FMA; unlike full fastmath it does not
+            # reassociate, so results differ from the NumPy path by at most an ulp per fused op
+            _signal_totals_kernel = njit(cache=True, fastmath={"contract"})(_signal_totals_loop)
+    return _signal_totals_kernel(*arrays)
+
+
+def _aggregate_markets(current_price, volume, n_signals, total_shift, total_weight,
+                       total_abs_shift, total_match, total_cred):
+    """
+    Weighted-average shift, volume dampening and confidence for every market at once,
+    from _signal_totals' sums.
+    Returns (estimated_probability, confidence, has_weight); rounding is left to the caller.
+    """
+    has_weight = total_weight != 0
+    net_shift = total_shift / np.where(has_weight, total_weight, 1.0)
 
     # Volume dampening: high volume markets are harder to move
-    if volume > 1_000_000:
-        net_shift *= 0.4
-    elif volume > 100_000:
-        net_shift *= 0.65
+    net_shift *= np.where(volume > 1_000_000, 0.4, np.where(volume > 100_000, 0.65, 1.0))
 
-    # Apply shift
     estimated = current_price + net_shift
-    estimated = max(0.02, min(0.98, estimated))
-
-    # Confidence based on signal count, quality, and agreement
-    n_signals = len(signal_data)
-    signal_agreement = abs(net_shift) / (sum(abs(s) for s, _ in [
-        estimate_single_signal(
-            sig["sentiment"], sig["match_score"], sig["importance"],
-            sig["source"], sig["is_breaking"], sig.get("yes_means_up"),
-            sig.get("question_type", "binary_event"),
-        ) for sig in signal_data
-    ]) / max(1, n_signals) + 0.001) if n_signals > 0 else 0
-
-    avg_match = sum(s["match_score"] for s in signal_data) / n_signals
-    avg_cred = sum(SOURCE_WEIGHTS.get(s["source"], 0.3) for s in signal_data) / n_signals
-
-    confidence = min(0.90, (
-        (avg_match / 100.0) * 0.3 +
-        avg_cred * 0.3 +
-        min(1.0, n_signals / 3.0) * 0.2 +
-        min(1.0, signal_agreement) * 0.2
+    np.clip(estimated, 0.02, 0.98, out=estimated)
+    # np.clip passes NaN through (e.g. from a NaN price); report those as no estimate
+    has_weight &= ~np.isnan(estimated)
+
+    signal_agreement = np.abs(net_shift) / (total_abs_shift / n_signals + 0.001)
+    confidence = np.minimum(0.90, (
+        (total_match / n_signals / 100.0) * 0.3 +
+        (total_cred / n_signals) * 0.3 +
+        np.minimum(1.0, n_signals / 3.0) * 0.2 +
+        np.minimum(1.0, signal_agreement) * 0.2
     ))
+    return estimated, confidence, has_weight
 
-    return round(estimated, 4), round(confidence, 4)
 
+def compute_estimates(signals, markets_by_id: dict | None = None) -> list[ProbEstimate]:
+    """Aggregate ALL news signals per market, then compute probability.
 
-def compute_estimates(signals, markets_by_id: dict) -> list[ProbEstimate]:
-    """Aggregate ALL news signals per market, then compute probability."""
-    # Group signals by market
-    market_signals: dict[str, dict] = {}  # market_id -> {market_info, signal_data: [...]}
+    markets_by_id is unused (match dicts carry the market data) and kept only
+    so existing callers that pass it keep working.
+    """
+    # Group signals by market. Per-signal fields are stored once per signal and
+    # per-market fields once per market; each (signal, market) match only adds a row.
+    market_pos: dict[str, int] = {}
+    markets: list[dict] = []  # {market_id, question, current_yes, volume, market_meta, news_titles}
+    news_titles: list[list[str]] = []  # per market, aliases markets[pos]["news_titles"]
+    yes_sign: list[float] = []  # per market
+    sentiment: list[float] = []  # per signal
+    importance: list[int] = []
+    cred: list[float] = []
+    is_breaking: list[bool] = []
+    market_idx: list[int] = []  # per (signal, market) row
+    signal_idx: list[int] = []
+    match_score: list[float] = []
 
     for signal in signals:
+        if not signal.matched_markets:
+            continue
+        j = len(sentiment)
+        sentiment.append(signal.sentiment)
+        importance.append(signal.importance)
+        cred.append(SRC_W[signal.source_id])
+        is_breaking.append(signal.is_breaking)
         for match in signal.matched_markets:
             mid = match["market_id"]
-            if mid not in market_signals:
+            pos = market_pos.setdefault(mid, len(markets))  # one dict op per match
+            if pos == len(markets):
                 prices = match.get("outcomePrices", [])
-                market_signals[mid] = {
+                meta = match.get("market_meta", {})
+                titles: list[str] = []
+                markets.append({
+                    "market_id": mid,
                     "question": match["question"],
                     "current_yes": prices[0] if prices else 0.5,
                     "volume": match.get("volume", 0),
-                    "market_meta": match.get("market_meta", {}),
-                    "signal_data": [],
-                    "news_titles": [],
-                }
-
-            market_signals[mid]["signal_data"].append({
-                "sentiment": signal.sentiment,
-                "match_score": match["match_score"],
-                "importance": signal.importance,
-                "source": signal.news_source,
-                "is_breaking": signal.is_breaking,
-                "yes_means_up": match.get("market_meta", {}).get("yes_means_up"),
-                "question_type": match.get("market_meta", {}).get("question_type", "binary_event"),
-            })
-            market_signals[mid]["news_titles"].append(signal.news_title)
+                    "market_meta": meta,
+                    "news_titles": titles,
+                })
+                news_titles.append(titles)
+                # compute_directional_shift: only yes_means_up=False flips the sentiment
+                yes_sign.append(-1.0 if meta.get("yes_means_up") is False else 1.0)
+
+            market_idx.append(pos)
+            signal_idx.append(j)
+            match_score.append(match["match_score"])
+            news_titles[pos].append(signal.news_title)
+
+    if not markets:
+        return []
+
+    idx = np.array(market_idx, dtype=np.intp)
+    sig_idx = np.array(signal_idx, dtype=np.intp)
+    imp_arr = np.array(importance, dtype=np.int64)
+    totals = _signal_totals(
+        idx, sig_idx, np.array(match_score, dtype=float), np.array(yes_sign),
+        np.array(sentiment, dtype=float), imp_arr, np.array(cred, dtype=float),
+        np.array(is_breaking, dtype=bool),
+    )
+    current = np.array([m["current_yes"] for m in markets], dtype=float)
+    volume = np.array([m["volume"] for m in markets], dtype=float)
+    estimated, confidence, has_weight = _aggregate_markets(current, volume, *totals)
+    counts = totals[0]
+    imp_sums = np.bincount(idx, weights=imp_arr[sig_idx], minlength=len(markets))
 
     estimates = []
-    for mid, data in market_signals.items():
-        prob, conf = aggregate_signals(
-            current_price=data["current_yes"],
-            signal_data=data["signal_data"],
-            volume=data["volume"],
-        )
+    for i, data in enumerate(markets):
+        if has_weight[i]:
+            prob, conf = round(float(estimated[i]), 4), round(float(confidence[i]), 4)
+        else:
+            prob, conf = data["current_yes"], 0.0
 
         estimates.append(ProbEstimate(
-            market_id=mid,
+            market_id=data["market_id"],
             question=data["question"],
             current_price=data["current_yes"],
             ai_probability=prob,
             confidence=conf,
             signals={
-                "n_signals": len(data["signal_data"]),
+                "n_signals": int(counts[i]),
                 "news_titles": data["news_titles"],
-                "avg_importance": round(sum(s["importance"] for s in data["signal_data"]) / len(data["signal_data"]), 1),
+                "avg_importance": round(float(imp_sums[i] / counts[i]), 1),
                 "market_meta": data["market_meta"],
             },
         ))
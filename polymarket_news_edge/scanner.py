@@ -1,19 +1,23 @@
 #!/usr/bin/env python3
 """Polyclaw — main orchestrator."""
 
+import heapq
 import json
+import os
 import time
 import argparse
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timezone
 from dataclasses import asdict
 
+import orjson
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich import box
 
-from .news_ingestion import ingest
+from .news_ingestion import ingest_with_feed
 from .market_cache import get_markets
 from .event_parser import parse_all, parse_with_llm
 from .probability_engine import compute_estimates, merge_llm_estimates
@@ -21,16 +25,17 @@ from .edge_calculator import find_edges, TradeSignal
 from .position_manager import open_position, check_exits, display_positions
 
 console = Console()
-SIGNALS_LOG = Path(__file__).parent / "signals_log.json"
+SIGNALS_LOG = Path(__file__).parent / "signals_log.jsonl"  # one scan per line, newest last
+LEGACY_SIGNALS_LOG = Path(__file__).parent / "signals_log.json"
+SIGNALS_LOG_KEEP = 100  # scans kept after a trim; the file may grow to 2x this between trims
+_signals_log_lines: int | None = None  # line count of SIGNALS_LOG, counted on first use
 
 
 def run_scan(min_edge: float = 0.03, bankroll: float = 1000.0, use_llm: bool = False, llm_only: bool = False) -> list[TradeSignal]:
     """Execute a single scan cycle."""
     # 1. Ingest news
     console.print("\n[bold cyan]📰 Fetching news feeds...[/bold cyan]")
-    new_items = ingest()
-    news_file = Path(__file__).parent / "news_feed.json"
-    all_news = json.loads(news_file.read_text()) if news_file.exists() else []
+    new_items, all_news = ingest_with_feed()
     console.print(f"  {len(new_items)} new items, {len(all_news)} total in cache")
 
     # 2. Fetch markets
@@ -49,8 +54,7 @@ def run_scan(min_edge: float = 0.03, bankroll: float = 1000.0, use_llm: bool = F
 
     # 4. Compute probabilities (aggregated per market)
     console.print("[bold cyan]🧮 Computing probability estimates...[/bold cyan]")
-    markets_by_id = {m["id"]: m for m in markets}
-    estimates = compute_estimates(signals, markets_by_id) if signals else []
+    estimates = compute_estimates(signals) if signals else []
     console.print(f"  {len(estimates)} keyword estimates generated")
 
     # 4b. LLM analysis
@@ -115,8 +119,28 @@ def reliability_icon(r: str) -> str:
     return {"high": "🟢", "medium": "🟡", "low": "🔴"}.get(r, "⚪")
 
 
+def print_compact(trade_signals: list[TradeSignal], estimates, news, markets):
+    """Plain tab-separated results for non-interactive runs (cron, redirected stdout)."""
+    print(f"news={len(news)}\tmarkets={len(markets)}\testimates={len(estimates)}\tsignals={len(trade_signals)}")
+    for sig in trade_signals:
+        print("\t".join((
+            sig.direction,
+            f"{sig.edge:+.3f}",
+            f"{sig.current_price:.3f}",
+            f"{sig.ai_probability:.3f}",
+            f"{sig.confidence:.2f}",
+            f"{sig.position_size:.0f}",
+            str(sig.market_id),
+            sig.question[:80],
+        )))
+
+
 def display_results(trade_signals: list[TradeSignal], estimates, news, markets):
     """Display scan results grouped by market with color coding."""
+    if not console.is_terminal and not console.is_jupyter:
+        print_compact(trade_signals, estimates, news, markets)
+        return
+
     console.print()
 
     summary = (
@@ -140,7 +164,7 @@ def display_results(trade_signals: list[TradeSignal], estimates, news, markets):
             table.add_column("#News", justify="right")
             table.add_column("Trigger", max_width=40)
 
-            for est in sorted(estimates, key=lambda e: abs(e.ai_probability - e.current_price), reverse=True)[:8]:
+            for est in heapq.nlargest(8, estimates, key=lambda e: abs(e.ai_probability - e.current_price)):
                 diff = est.ai_probability - est.current_price
                 dc = "green" if diff > 0 else "red" if diff < 0 else "white"
                 titles = est.signals.get("news_titles", [])
@@ -192,22 +216,51 @@ def display_results(trade_signals: list[TradeSignal], estimates, news, markets):
     console.print(table)
 
 
-def save_signals(trade_signals: list[TradeSignal]):
-    existing = []
-    if SIGNALS_LOG.exists():
+def _migrate_legacy_signals_log():
+    """One-time conversion of the old signals_log.json array to JSON Lines."""
+    if not LEGACY_SIGNALS_LOG.exists():
+        return
+    try:
+        entries = orjson.loads(LEGACY_SIGNALS_LOG.read_bytes())
+    except Exception:
+        entries = []
+    with SIGNALS_LOG.open("ab") as f:
+        for entry in entries[-SIGNALS_LOG_KEEP:]:
+            f.write(orjson.dumps(entry) + b"\n")
+    LEGACY_SIGNALS_LOG.unlink()
+
+
+def _append_signals_log(entry: dict):
+    """Append one scan to signals_log.jsonl, trimming to the last SIGNALS_LOG_KEEP scans
+    only once the file has doubled past it."""
+    global _signals_log_lines
+    _migrate_legacy_signals_log()
+    if _signals_log_lines is None:
         try:
-            existing = json.loads(SIGNALS_LOG.read_text())
-        except Exception:
-            existing = []
+            with SIGNALS_LOG.open("rb") as f:
+                _signals_log_lines = sum(1 for _ in f)
+        except FileNotFoundError:
+            _signals_log_lines = 0
+
+    with SIGNALS_LOG.open("ab") as f:
+        f.write(orjson.dumps(entry) + b"\n")
+    _signals_log_lines += 1
+
+    if _signals_log_lines >= 2 * SIGNALS_LOG_KEEP:
+        with SIGNALS_LOG.open("rb") as f:
+            tail = deque(f, maxlen=SIGNALS_LOG_KEEP)
+        tmp = SIGNALS_LOG.with_suffix(".jsonl.tmp")
+        tmp.write_bytes(b"".join(tail))
+        os.replace(tmp, SIGNALS_LOG)
+        _signals_log_lines = len(tail)
 
-    entry = {
+
+def save_signals(trade_signals: list[TradeSignal]):
+    _append_signals_log({
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "signals_count": len(trade_signals),
         "signals": [asdict(s) for s in trade_signals],
-    }
-    existing.append(entry)
-    existing = existing[-100:]
-    SIGNALS_LOG.write_text(json.dumps(existing, indent=2))
+    })
 
     # Write alert file when signals found — cron job picks this up
     alert_file = Path(__file__).parent / "ALERT.json"
@@ -10,7 +10,12 @@ setup(
         "rich",
         "pandas",
         "rapidfuzz",
+        "orjson",
+        "numpy",
     ],
+    extras_require={
+        "fast": ["numba", "h2"],
+    },
     entry_points={
         "console_scripts": [
             "polyclaw=polymarket_news_edge.scanner:main",
@@ -1,32 +1,58 @@
 """ACLED armed conflict data source — requires free account (OAuth token auth)."""
-import json
+import atexit
 import hashlib
+import heapq
+import importlib.util
 import time
 from datetime import datetime, timezone, timedelta
 
 import httpx
+import orjson
 
 from .config import get_config
+from .fileio import atomic_write_bytes
 
 MIN_INTERVAL = 3600  # 1 hour
 TOKEN_URL = "https://acleddata.com/oauth/token"
 API_URL = "https://api.acleddata.com/acled/read"
+EVENT_LIMIT = 50  # events requested per fetch
+
+# One pooled client for token + data requests so the TLS session to ACLED is
+# reused. HTTP/2 is only enabled when the optional h2 package is installed.
+_CLIENT = httpx.Client(
+    http2=importlib.util.find_spec("h2") is not None,
+    timeout=15,
+    limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+)
+atexit.register(_CLIENT.close)
 
 
 def _state_file():
     return get_config()._data_path / "acled_state.json"
 
 
+# State (last_fetch, seen_ids, OAuth token) kept in memory after the first
+# read, so throttled calls and cached-token checks never touch disk
+_STATE_CACHE = {"path": None, "state": None}
+
+
 def _load_state():
+    path = _state_file()
+    if _STATE_CACHE["path"] == path:
+        return _STATE_CACHE["state"]
     try:
-        return json.loads(_state_file().read_text())
+        state = orjson.loads(path.read_bytes())
     except Exception:
-        return {"last_fetch": 0, "seen_ids": [], "access_token": "", "token_expires": 0}
+        state = {"last_fetch": 0, "seen_ids": [], "access_token": "", "token_expires": 0}
+    _STATE_CACHE["path"], _STATE_CACHE["state"] = path, state
+    return state
 
 
 def _save_state(state):
     state["seen_ids"] = state.get("seen_ids", [])[-300:]
-    _state_file().write_text(json.dumps(state))
+    path = _state_file()
+    atomic_write_bytes(path, orjson.dumps(state))
+    _STATE_CACHE["path"], _STATE_CACHE["state"] = path, state
 
 
 def _fatalities_importance(fatalities: int) -> int:
@@ -49,7 +75,7 @@ def _get_access_token(email: str, password: str, state: dict) -> str:
     if cached_token and now < token_expires - 3600:
         return cached_token
 
-    resp = httpx.post(
+    resp = _CLIENT.post(
         TOKEN_URL,
         data={
             "username": email,
@@ -57,12 +83,11 @@ def _get_access_token(email: str, password: str, state: dict) -> str:
             "grant_type": "password",
             "client_id": "acled",
         },
-        timeout=15,
     )
     if resp.status_code != 200:
         return ""
 
-    data = resp.json()
+    data = orjson.loads(resp.content)
     token = data.get("access_token", "")
     expires_in = int(data.get("expires_in", 86400))  # default 24h
 
@@ -101,30 +126,29 @@ def fetch_acled() -> list[dict]:
     date_to = today.strftime("%Y-%m-%d")
 
     try:
-        resp = httpx.get(
+        resp = _CLIENT.get(
             API_URL,
             params={
                 "event_date": f"{date_from}|{date_to}",
                 "event_date_where": "BETWEEN",
-                "limit": "50",
+                "limit": str(EVENT_LIMIT),
                 "fields": "event_id_cnty|event_date|event_type|sub_event_type|country|location|fatalities|source",
             },
             headers={"Authorization": f"Bearer {token}"},
-            timeout=15,
         )
         if resp.status_code != 200:
             return []
 
-        data = resp.json()
-        events = data.get("data", [])
+        data = orjson.loads(resp.content)
 
-        # Sort by fatalities descending
-        events.sort(key=lambda e: int(e.get("fatalities", 0)), reverse=True)
+        # Drop already-seen events before ranking, then take the deadliest first
+        unseen = [e for e in data.get("data", []) if e.get("event_id_cnty") and e["event_id_cnty"] not in seen]
+        events = heapq.nlargest(EVENT_LIMIT, unseen, key=lambda e: int(e.get("fatalities", 0)))
 
         for event in events:
-            eid = event.get("event_id_cnty", "")
-            if not eid or eid in seen:
-                continue
+            eid = event["event_id_cnty"]
+            if eid in seen:
+                continue  # duplicate within this response
             seen.add(eid)
 
             fatalities = int(event.get("fatalities", 0))
@@ -136,6 +160,7 @@ def fetch_acled() -> list[dict]:
             title = f"{event_type} in {location}, {country}{fat_str}"
 
             items.append({
+                # Hashed form kept so ids match items already stored in the news cache
                 "id": f"acled-{hashlib.sha256(eid.encode()).hexdigest()[:16]}",
                 "title": title,
                 "summary": f"{event.get('sub_event_type', '')} on {event.get('event_date', '')}",
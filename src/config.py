@@ -13,21 +13,101 @@ Optional config.yaml (non-secret strategy params):
   max_order_size, daily_loss_limit, max_positions, max_exposure_pct, min_edge, strategy
 """
 
+import copy
+import dataclasses
+import json
+import math
 import os
 import re
 import sys
+import threading
 from pathlib import Path
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
-import yaml
-from dotenv import load_dotenv
-
-# Load .env file if present (no-op if missing)
-load_dotenv()
-
-
-@dataclass
+# PyYAML and python-dotenv are imported on first use (see load_env and
+# load_config), so importing this module stays cheap
+_env_loaded = False
+_env_lock = threading.Lock()
+
+# Config search locations fixed at import (cwd is still checked per call)
+_MODULE_DIR = Path(__file__).resolve().parent
+_REPO_ROOT = _MODULE_DIR.parent
+_HOME_CFG = Path.home() / ".config" / "polyclaw" / "config.yaml"
+
+# Env vars that feed Config — part of the load_config memo key
+_ENV_PREFIXES = (
+    "POLYMARKET_", "LLM_", "DISCORD_", "TWITTER_", "ACLED_", "EIA_",
+    "POLYGON_", "INITIAL_", "DATA_",
+)
+
+# Non-secret fields allowed from yaml (explicitly whitelisted)
+_YAML_ALLOWED: frozenset[str] = frozenset({
+    "strategy", "data_dir", "max_order_size", "daily_loss_limit",
+    "max_positions", "max_exposure_pct", "min_edge", "bankroll",
+    # Position sizing
+    "max_position_pct", "cooldown_hours", "timeout_hours", "timeout_move_threshold",
+    "kelly_fraction", "fee_rate",
+    # Exit strategy
+    "tp_ratio", "high_conf_tp_ratio", "low_conf_tp_ratio",
+    "sl_ratio", "wide_sl_ratio", "tight_sl_ratio",
+    "trailing_stop_activation", "trailing_stop_distance",
+    # Live exit
+    "live_timeout_hours", "stale_order_hours", "price_drift_threshold",
+    # Edge calculator
+    "min_edge_threshold", "max_kelly_fraction", "min_shares",
+    # Order execution
+    "max_spread", "price_bump_fallback", "balance_reserve_pct",
+    # Signal dedup
+    "signal_cooldown_hours", "max_alerts_per_hour",
+    # WorldMonitor
+    "rss_feeds_per_cycle",
+    # LLM
+    "ai_estimate_discount", "llm_provider", "llm_base_url", "llm_model",
+    "llm_row_batch", "llm_parallelism",
+    # Arena
+    "active_strategies", "strategy_overrides",
+})
+
+# Strings save_config can write unquoted (no YAML indicators, not numeric;
+# a leading "." is excluded because ".5" / ".inf" / ".nan" resolve to floats)
+_YAML_PLAIN_RE = re.compile(r"[A-Za-z_/][A-Za-z0-9_./-]*")
+_YAML_RESERVED = frozenset({"true", "false", "yes", "no", "on", "off", "null", "y", "n"})
+
+_PRIVKEY_RE = re.compile(r'0x[0-9a-fA-F]{64}')
+
+# Config path properties → file names under data_dir
+_DATA_FILES = {
+    "positions_file": "positions.json",
+    "history_file": "trade_history.json",
+    "news_cache_file": "news_feed.json",
+    "market_cache_file": "market_cache.json",
+    "price_history_file": "price_history.json",
+    "signals_log_file": "signals_log.json",
+    "live_positions_file": "live_positions.json",
+    "live_history_file": "live_trade_history.json",
+    "db_path": "polyclaw.db",
+    "arena_dir": "arena",
+}
+_VALID_STRATEGIES = frozenset({"sniper", "baseline", "conservative", "aggressive", "trend_follower"})
+
+# Numeric field constraints checked by Config.validate: (field, predicate, error)
+_FIELD_RULES = (
+    ("bankroll", lambda v: v > 0, "bankroll must be positive"),
+    ("max_order_size", lambda v: v > 0, "max_order_size must be positive"),
+    ("min_edge", lambda v: 0 < v < 1, "min_edge must be between 0 and 1"),
+    ("max_exposure_pct", lambda v: 0 < v <= 2, "max_exposure_pct must be between 0 and 2"),
+    ("llm_row_batch", lambda v: 1 <= v <= 15, "llm_row_batch must be between 1 and 15"),
+    ("llm_parallelism", lambda v: v >= 1, "llm_parallelism must be at least 1"),
+)
+
+
+# Config fields holding containers; load_config copies them out of the memoized instance
+_MUTABLE_FIELDS = ("active_strategies", "strategy_overrides", "twitter_rapidapi_keys")
+
+
+@dataclass(slots=True)
 class Config:
     """All configuration for the Polyclaw bot."""
 
@@ -94,6 +174,8 @@ class Config:
     llm_base_url: str = ""           # e.g. "http://127.0.0.1:8045/v1" for local proxy
     llm_api_key: str = ""            # from env var LLM_API_KEY
     llm_model: str = ""              # e.g. "gemini-2.0-flash", "gpt-4o-mini"
+    llm_row_batch: int = 15          # news items per prompt (max 15)
+    llm_parallelism: int = 1         # prompts in flight per scan
 
     # Arena — which strategies to run
     active_strategies: list[str] = field(default_factory=lambda: ["baseline"])
@@ -122,79 +204,76 @@ class Config:
     # Derived paths (set after loading)
     _config_dir: Path = field(default_factory=Path, repr=False)
     _data_path: Path = field(default_factory=Path, repr=False)
+    _paths: dict = field(default_factory=dict, init=False, repr=False)
 
     def __post_init__(self):
         """Resolve relative paths and validate."""
         data_path = Path(self.data_dir)
         if not data_path.is_absolute() and self._config_dir:
             data_path = self._config_dir / data_path
-        self._data_path = data_path.resolve()
-        self._data_path.mkdir(parents=True, exist_ok=True)
+        # abspath is pure string work; resolve() would stat every component
+        # to follow symlinks, which nothing here needs
+        abs_path = os.path.abspath(data_path)
+        os.makedirs(abs_path, exist_ok=True)
+        self._data_path = Path(abs_path)
+
+        # Build every derived path once; the properties below just look them up
+        self._paths = {name: self._data_path / filename for name, filename in _DATA_FILES.items()}
+        self._paths["arena_dir"].mkdir(exist_ok=True)
 
     @property
     def positions_file(self) -> Path:
-        return self._data_path / "positions.json"
+        return self._paths["positions_file"]
 
     @property
     def history_file(self) -> Path:
-        return self._data_path / "trade_history.json"
+        return self._paths["history_file"]
 
     @property
     def news_cache_file(self) -> Path:
-        return self._data_path / "news_feed.json"
+        return self._paths["news_cache_file"]
 
     @property
     def market_cache_file(self) -> Path:
-        return self._data_path / "market_cache.json"
+        return self._paths["market_cache_file"]
 
     @property
     def price_history_file(self) -> Path:
-        return self._data_path / "price_history.json"
+        return self._paths["price_history_file"]
 
     @property
     def signals_log_file(self) -> Path:
-        return self._data_path / "signals_log.json"
+        return self._paths["signals_log_file"]
 
     @property
     def live_positions_file(self) -> Path:
-        return self._data_path / "live_positions.json"
+        return self._paths["live_positions_file"]
 
     @property
     def live_history_file(self) -> Path:
-        return self._data_path / "live_trade_history.json"
+        return self._paths["live_history_file"]
 
     @property
     def db_path(self) -> Path:
-        return self._data_path / "polyclaw.db"
+        return self._paths["db_path"]
 
     @property
     def arena_dir(self) -> Path:
-        d = self._data_path / "arena"
-        d.mkdir(exist_ok=True)
-        return d
+        return self._paths["arena_dir"]
 
     def validate(self) -> list[str]:
         """Validate config and return list of errors."""
         errors = []
 
-        if not self.private_key or not re.fullmatch(r'0x[0-9a-fA-F]{64}', self.private_key):
+        if not self.private_key or not _PRIVKEY_RE.fullmatch(self.private_key):
             errors.append("POLYMARKET_PRIVATE_KEY must be 0x followed by 64 hex characters")
 
-        if self.bankroll <= 0:
-            errors.append("bankroll must be positive")
-
-        if self.max_order_size <= 0:
-            errors.append("max_order_size must be positive")
-
-        if not (0 < self.min_edge < 1):
-            errors.append("min_edge must be between 0 and 1")
+        for name, ok, message in _FIELD_RULES:
+            if not ok(getattr(self, name)):
+                errors.append(message)
 
-        if not (0 < self.max_exposure_pct <= 2):
-            errors.append("max_exposure_pct must be between 0 and 2")
-
-        valid_strategies = {"sniper", "baseline", "conservative", "aggressive", "trend_follower"}
-        if self.strategy not in valid_strategies:
-            errors.append(f"strategy must be one of: {valid_strategies}")
+        if self.strategy not in _VALID_STRATEGIES:
+            errors.append(f"strategy must be one of: {set(_VALID_STRATEGIES)}")
 
         return errors
 
@@ -205,7 +284,51 @@ _config: Optional[Config] = None
 
 def _parse_twitter_keys(raw: str) -> list[str]:
     """Parse comma-separated Twitter RapidAPI keys from env var."""
-    return [k.strip() for k in raw.split(",") if k.strip()]
+    if "," not in raw:  # common case: a single key
+        s = raw.strip()
+        return [s] if s else []
+    return [k for k in (p.strip() for p in raw.split(",")) if k]
+
+
+def load_env():
+    """Load the .env file into os.environ once per process (no-op if missing).
+
+    Existing environment variables win. load_config() calls this; modules that
+    read os.environ directly must call it first.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    with _env_lock:  # news sources may call this from worker threads
+        if _env_loaded:
+            return
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+
+def _yaml_io():
+    """Import PyYAML lazily; prefer the libyaml-backed loader/dumper."""
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, loader, dumper
+
+
+def _resolve_config_path(config_path: Optional[Path]) -> Optional[Path]:
+    """Return the config.yaml to read, or None if there isn't one."""
+    if config_path is None:
+        # An explicit POLYMARKET_CONFIG wins without probing anything else
+        env_path = os.environ.get("POLYMARKET_CONFIG")
+        if env_path and os.path.isfile(env_path):
+            return Path(env_path)
+        # Look for config.yaml in standard locations (optional)
+        candidates = [Path.cwd() / "config.yaml", _REPO_ROOT / "config.yaml", _HOME_CFG]
+        for p in candidates:
+            if os.path.isfile(p):
+                return p
+        return None
+    return config_path
 
 
 def load_config(config_path: Optional[Path] = None) -> Config:
@@ -213,92 +336,81 @@ def load_config(config_path: Optional[Path] = None) -> Config:
 
     Secrets always come from environment variables.
     Non-secret strategy params can optionally be overridden via config.yaml.
+
+    Parsing is memoized on the config file's mtime/size and the relevant
+    env vars, so repeated calls are cheap until either changes; each call
+    still returns its own Config.
     """
     global _config
+    load_env()
+    config_path = _resolve_config_path(config_path)
+
+    file_sig = None
+    if config_path and os.path.isfile(config_path):
+        st = os.stat(config_path)
+        file_sig = (st.st_mtime_ns, st.st_size)
+    env_sig = tuple(sorted(
+        (k, v) for k, v in os.environ.items() if k.startswith(_ENV_PREFIXES)
+    ))
+    # Hand out a copy: callers may mutate their Config (including its list and
+    # dict fields), and re-running __post_init__ recreates the data directories
+    cached = _build_config(
+        str(config_path) if config_path else None, file_sig, env_sig, os.getcwd(),
+    )
+    _config = dataclasses.replace(cached, **{
+        name: copy.deepcopy(getattr(cached, name)) for name in _MUTABLE_FIELDS
+    })
+    return _config
+
+
+@lru_cache(maxsize=4)
+def _build_config(config_path: Optional[str], file_sig, env_sig, cwd: str) -> Config:
+    """Parse config.yaml + env into a validated Config (see load_config)."""
+    getenv = os.environ.get  # bound once for the ~15 lookups below
 
     # --- Non-secret strategy params from optional config.yaml ---
     yaml_data: dict = {}
-    if config_path is None:
-        # Look for config.yaml in standard locations (optional)
-        candidates = [
-            Path.cwd() / "config.yaml",
-            Path(__file__).parent.parent / "config.yaml",
-            Path.home() / ".config" / "polyclaw" / "config.yaml",
-        ]
-        env_path = os.environ.get("POLYMARKET_CONFIG")
-        if env_path:
-            candidates.insert(0, Path(env_path))
-        for p in candidates:
-            if p.exists():
-                config_path = p
-                break
-
-    if config_path and Path(config_path).exists():
+    if file_sig is not None:
+        yaml, loader, _ = _yaml_io()
         with open(config_path) as f:
-            yaml_data = yaml.safe_load(f) or {}
-
-    # Non-secret fields allowed from yaml (explicitly whitelisted)
-    YAML_ALLOWED = {
-        "strategy", "data_dir", "max_order_size", "daily_loss_limit",
-        "max_positions", "max_exposure_pct", "min_edge", "bankroll",
-        # Position sizing
-        "max_position_pct", "cooldown_hours", "timeout_hours", "timeout_move_threshold",
-        "kelly_fraction", "fee_rate",
-        # Exit strategy
-        "tp_ratio", "high_conf_tp_ratio", "low_conf_tp_ratio",
-        "sl_ratio", "wide_sl_ratio", "tight_sl_ratio",
-        "trailing_stop_activation", "trailing_stop_distance",
-        # Live exit
-        "live_timeout_hours", "stale_order_hours", "price_drift_threshold",
-        # Edge calculator
-        "min_edge_threshold", "max_kelly_fraction", "min_shares",
-        # Order execution
-        "max_spread", "price_bump_fallback", "balance_reserve_pct",
-        # Signal dedup
-        "signal_cooldown_hours", "max_alerts_per_hour",
-        # WorldMonitor
-        "rss_feeds_per_cycle",
-        # LLM
-        "ai_estimate_discount", "llm_provider", "llm_base_url", "llm_model",
-        # Arena
-        "active_strategies", "strategy_overrides",
-    }
-    strategy_params = {k: v for k, v in yaml_data.items() if k in YAML_ALLOWED}
+            yaml_data = yaml.load(f, Loader=loader) or {}
+
+    strategy_params = {k: yaml_data[k] for k in yaml_data.keys() & _YAML_ALLOWED}
 
     # --- Secrets always from env vars ---
-    twitter_keys_raw = os.environ.get("TWITTER_RAPIDAPI_KEYS", "")
+    twitter_keys_raw = getenv("TWITTER_RAPIDAPI_KEYS")
     twitter_keys = _parse_twitter_keys(twitter_keys_raw) if twitter_keys_raw else []
 
-    _config = Config(
+    cfg = Config(
         # Secrets from env
-        private_key=os.environ.get("POLYMARKET_PRIVATE_KEY", ""),
-        wallet_address=os.environ.get("POLYMARKET_WALLET_ADDRESS", ""),
-        clob_api_key=os.environ.get("POLYMARKET_CLOB_API_KEY", ""),
-        clob_api_secret=os.environ.get("POLYMARKET_CLOB_API_SECRET", ""),
-        clob_api_passphrase=os.environ.get("POLYMARKET_CLOB_API_PASSPHRASE", ""),
-        discord_webhook=os.environ.get("DISCORD_WEBHOOK_URL", ""),
+        private_key=getenv("POLYMARKET_PRIVATE_KEY", ""),
+        wallet_address=getenv("POLYMARKET_WALLET_ADDRESS", ""),
+        clob_api_key=getenv("POLYMARKET_CLOB_API_KEY", ""),
+        clob_api_secret=getenv("POLYMARKET_CLOB_API_SECRET", ""),
+        clob_api_passphrase=getenv("POLYMARKET_CLOB_API_PASSPHRASE", ""),
+        discord_webhook=getenv("DISCORD_WEBHOOK_URL", ""),
         twitter_rapidapi_keys=twitter_keys,
-        acled_email=os.environ.get("ACLED_EMAIL", ""),
-        acled_password=os.environ.get("ACLED_PASSWORD", ""),
-        eia_api_key=os.environ.get("EIA_API_KEY", ""),
-        rpc_url=os.environ.get("POLYGON_RPC_URL", "https://polygon-bor-rpc.publicnode.com"),
-        llm_api_key=os.environ.get("LLM_API_KEY", ""),
-        llm_base_url=os.environ.get("LLM_BASE_URL", ""),
-        bankroll=float(os.environ.get("INITIAL_BANKROLL", strategy_params.pop("bankroll", 1000.0))),
-        data_dir=os.environ.get("DATA_DIR", strategy_params.pop("data_dir", "./data")),
-        _config_dir=Path(config_path).parent if config_path else Path.cwd(),
+        acled_email=getenv("ACLED_EMAIL", ""),
+        acled_password=getenv("ACLED_PASSWORD", ""),
+        eia_api_key=getenv("EIA_API_KEY", ""),
+        rpc_url=getenv("POLYGON_RPC_URL", "https://polygon-bor-rpc.publicnode.com"),
+        llm_api_key=getenv("LLM_API_KEY", ""),
+        llm_base_url=getenv("LLM_BASE_URL", ""),
+        bankroll=float(getenv("INITIAL_BANKROLL", strategy_params.pop("bankroll", 1000.0))),
+        data_dir=getenv("DATA_DIR", strategy_params.pop("data_dir", "./data")),
+        _config_dir=Path(config_path).parent if config_path else Path(cwd),
         # Non-secret strategy params from yaml (with defaults)
         **strategy_params,
     )
 
-    errors = _config.validate()
+    errors = cfg.validate()
     if errors:
         print("Config validation errors:", file=sys.stderr)
         for e in errors:
             print(f"  - {e}", file=sys.stderr)
         sys.exit(1)
 
-    return _config
+    return cfg
 
 
 def get_config() -> Config:
@@ -309,6 +421,27 @@ def get_config() -> Config:
     return _config
 
 
+def _yaml_scalar(value) -> Optional[str]:
+    """Render a scalar as YAML, or None if it needs the full dumper."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return None
+        text = repr(value)
+        # YAML 1.1 only resolves exponent floats with a "." ("1e-05" loads as a str)
+        if "e" in text and "." not in text:
+            text = text.replace("e", ".0e", 1)
+        return text
+    if isinstance(value, str):
+        if _YAML_PLAIN_RE.fullmatch(value) and value.lower() not in _YAML_RESERVED:
+            return value
+        return json.dumps(value)  # a JSON string is a valid double-quoted YAML scalar
+    return None
+
+
 def save_config(config: Config, config_path: Path):
     """Save non-secret strategy params back to a YAML file.
 
@@ -324,5 +457,13 @@ def save_config(config: Config, config_path: Path):
         "min_edge": config.min_edge,
     }
 
+    lines = [_yaml_scalar(v) for v in data.values()]
+    if None in lines:
+        # A value the fast path can't express — let PyYAML handle it
+        yaml, _, dumper = _yaml_io()
+        with open(config_path, "w") as f:
+            yaml.dump(data, f, Dumper=dumper, default_flow_style=False, sort_keys=False)
+        return
+
     with open(config_path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        f.write("".join(f"{k}: {v}\n" for k, v in zip(data, lines)))
@@ -7,36 +7,152 @@ WAL mode enables concurrent reads during writes.
 import json
 import sqlite3
 import threading
-from datetime import datetime, timezone
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Iterator
 
 from .config import get_config
 
 _local = threading.local()
 
+# Compact encoder for JSON stored in TEXT columns (never shown to humans raw)
+_dumps = partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
+
+# UPDATE/INSERT ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def _tune(conn: sqlite3.Connection, db_path: Path):
+    """Per-connection settings that are safe under WAL: fsync only at
+    checkpoints, wait on writer locks, 64MB page cache, in-memory temp tables."""
+    conn.row_factory = sqlite3.Row
+    conn.executescript(
+        "PRAGMA foreign_keys=ON;"
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA busy_timeout=5000;"
+        "PRAGMA cache_size=-65536;"
+        "PRAGMA temp_store=MEMORY;"
+    )
+    if str(db_path) != ":memory:":
+        conn.execute("PRAGMA mmap_size=268435456")
+
 
 def get_db() -> sqlite3.Connection:
-    """Get a thread-local singleton connection with WAL mode."""
+    """Get the thread-local write connection (WAL mode, owns the schema)."""
     conn = getattr(_local, "conn", None)
     if conn is not None:
         return conn
 
     db_path = get_config().db_path
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path), check_same_thread=False)
-    conn.row_factory = sqlite3.Row
+    # Implicit transactions start with BEGIN IMMEDIATE: claim the write lock
+    # up front rather than failing to upgrade a read lock mid-transaction
+    conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level="IMMEDIATE")
     conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
+    _tune(conn, db_path)
     _local.conn = conn
     init_db(conn)
     return conn
 
 
+def get_read_db() -> sqlite3.Connection:
+    """Get a thread-local read-only connection for SELECTs.
+
+    Under WAL a reader never waits on the writer, so reports and dashboards
+    keep going while another connection holds the write lock. Opened
+    alongside (and after) the write connection so the schema exists.
+    While this thread has uncommitted writes, reads go through the write
+    connection so they see them.
+    """
+    write_conn = get_db()
+    if write_conn.in_transaction:
+        return write_conn
+    conn = getattr(_local, "read_conn", None)
+    if conn is not None:
+        if _local.read_for is write_conn:
+            return conn
+        conn.close()  # write connection was replaced; don't leak the old reader
+
+    db_path = get_config().db_path
+    if str(db_path) == ":memory:":
+        return write_conn  # a second connection would see a different database
+    conn = sqlite3.connect(
+        f"{db_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False,
+    )
+    _tune(conn, db_path)
+    _local.read_conn = conn
+    _local.read_for = write_conn
+    return conn
+
+
+@contextmanager
+def transaction():
+    """Group several writes into one commit.
+
+    Takes the write lock up front (BEGIN IMMEDIATE) so a reader can't deadlock
+    trying to upgrade mid-transaction. Pass commit=False to the mutators used
+    inside the block. Nested use joins the outer transaction.
+    """
+    conn = get_db()
+    if conn.in_transaction:
+        yield conn
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
 def init_db(conn: sqlite3.Connection | None = None):
     """Create tables if they don't exist."""
     if conn is None:
         conn = get_db()
     conn.executescript(_SCHEMA)
+    _migrate(conn)
+    # Refresh planner statistics only where they are stale (cheap, unlike ANALYZE)
+    conn.execute("PRAGMA optimize")
+
+
+def _migrate(conn: sqlite3.Connection):
+    """Bring databases created by older versions up to the current schema."""
+    cols = {r["name"] for r in conn.execute("PRAGMA table_info(signal_cooldowns)")}
+    if "last_alert_ts" not in cols:
+        # Unix-seconds copy of last_alert so pruning can use an index range scan
+        conn.execute("ALTER TABLE signal_cooldowns ADD COLUMN last_alert_ts INTEGER")
+        conn.execute(
+            "UPDATE signal_cooldowns SET last_alert_ts = CAST(strftime('%s', last_alert) AS INTEGER)"
+        )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_cooldowns_ts ON signal_cooldowns(last_alert_ts)"
+    )
+
+    cols = {r["name"] for r in conn.execute("PRAGMA table_xinfo(decisions)")}
+    for name, decl in _DECISION_SUMMARY_COLUMNS.items():
+        if name not in cols:
+            conn.execute(f"ALTER TABLE decisions ADD COLUMN {name} {decl}")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_decisions_pnl ON decisions(settlement_pnl)"
+    )
+    conn.commit()
+
+
+# Summary fields pulled out of the decision JSON blobs by SQLite itself, so
+# reports can read them without json.loads-ing every blob. VIRTUAL because
+# ALTER TABLE can't add STORED generated columns; the pnl index stores it.
+_DECISION_SUMMARY_COLUMNS = {
+    "settlement_pnl": "REAL AS (json_extract(settlement_data, '$.pnl')) VIRTUAL",
+    "settlement_exit_reason": "TEXT AS (json_extract(settlement_data, '$.exit_reason')) VIRTUAL",
+    "settlement_duration_hours": "REAL AS (json_extract(settlement_data, '$.duration_hours')) VIRTUAL",
+    "order_cost": "REAL AS (json_extract(order_data, '$.cost')) VIRTUAL",
+    "order_price": "REAL AS (json_extract(order_data, '$.price')) VIRTUAL",
+    "signal_trigger_news": "TEXT AS (json_extract(signal_data, '$.trigger_news')) VIRTUAL",
+}
 
 
 _SCHEMA = """
@@ -115,7 +231,8 @@ CREATE TABLE IF NOT EXISTS signals (
 
 CREATE TABLE IF NOT EXISTS signal_cooldowns (
     key TEXT PRIMARY KEY,
-    last_alert TEXT NOT NULL
+    last_alert TEXT NOT NULL,
+    last_alert_ts INTEGER
 );
 
 CREATE TABLE IF NOT EXISTS notifications (
@@ -141,17 +258,45 @@ CREATE TABLE IF NOT EXISTS decisions (
     created_at TEXT DEFAULT (datetime('now')),
     updated_at TEXT DEFAULT (datetime('now'))
 );
+
+-- Indexes matching the filters + ORDER BY of the read helpers below
+CREATE INDEX IF NOT EXISTS idx_positions_mode_strategy_status_created
+    ON positions(mode, strategy, status, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_trades_mode_strategy_created
+    ON trades(mode, strategy, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_trades_mode_exit ON trades(mode, exit_time);
+CREATE INDEX IF NOT EXISTS idx_decisions_status_updated ON decisions(status, updated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_decisions_created ON decisions(created_at);
+CREATE INDEX IF NOT EXISTS idx_notifications_consumed_created
+    ON notifications(consumed, created_at);
 """
 
 
+def _iter_dicts(cols: tuple, sql: str, params=()) -> Iterator[dict]:
+    """Run a SELECT of `cols` and yield plain dicts from tuple rows.
+
+    Skips the connection's sqlite3.Row factory: zipping a fixed column tuple
+    avoids a Row object and per-column name lookups for every result row.
+    Rows are pulled from the cursor lazily, so nothing is materialised twice.
+    """
+    cur = get_read_db().cursor()
+    cur.row_factory = None
+    cur.execute(sql, params)
+    for r in cur:
+        yield dict(zip(cols, r))
+
+
+def _select_dicts(cols: tuple, sql: str, params=()) -> list[dict]:
+    return list(_iter_dicts(cols, sql, params))
+
+
 # ═══════════════════════════════════════════════════
 # Positions CRUD
 # ═══════════════════════════════════════════════════
 
 def get_positions(mode: str = "live", strategy: str = "", status: str | None = None) -> list[dict]:
     """Get positions filtered by mode, strategy, and optional status."""
-    conn = get_db()
-    sql = "SELECT * FROM positions WHERE mode = ?"
+    sql = f"SELECT {_POSITION_SELECT} FROM positions WHERE mode = ?"
     params: list = [mode]
     if strategy:
         sql += " AND strategy = ?"
@@ -160,38 +305,103 @@ def get_positions(mode: str = "live", strategy: str = "", status: str | None = N
         sql += " AND status = ?"
         params.append(status)
     sql += " ORDER BY created_at DESC"
-    return [dict(r) for r in conn.execute(sql, params).fetchall()]
+    return _select_dicts(_POSITION_READ_COLS, sql, params)
+
+
+def count_positions(mode: str = "live", strategy: str = "", status: str | None = None) -> int:
+    """Count positions with the same filters as get_positions, without fetching rows."""
+    conn = get_read_db()
+    sql = "SELECT COUNT(*) FROM positions WHERE mode = ?"
+    params: list = [mode]
+    if strategy:
+        sql += " AND strategy = ?"
+        params.append(strategy)
+    if status:
+        sql += " AND status = ?"
+        params.append(status)
+    return conn.execute(sql, params).fetchone()[0]
+
+
+_POSITION_COLS = (
+    "id", "trade_id", "mode", "strategy", "market_id", "token_id",
+    "question", "direction", "entry_price", "shares", "filled_shares",
+    "cost", "target_price", "stop_loss", "confidence", "status",
+    "order_id", "entry_time", "exit_price", "exit_time", "exit_reason",
+    "pnl", "trigger_news", "neg_risk", "peak_price",
+)
+_POSITION_READ_COLS = _POSITION_COLS + ("created_at",)
+_POSITION_SELECT = ", ".join(_POSITION_READ_COLS)
+_POSITION_UPSERT_TAIL = "ON CONFLICT(id) DO UPDATE SET " + ", ".join(
+    f"{c} = excluded.{c}" for c in _POSITION_COLS if c != "id"
+)
+
+# Stay under SQLite's historical 999 bound-parameter limit per statement
+_MAX_PARAMS = 900
+
+
+@lru_cache(maxsize=64)
+def _upsert_sql(table: str, cols: tuple, tail: str, nrows: int) -> str:
+    """INSERT ... ON CONFLICT text for `nrows` rows, built once per shape."""
+    row_ph = "(" + ", ".join(["?"] * len(cols)) + ")"
+    return (
+        f"INSERT INTO {table} ({', '.join(cols)}) VALUES "
+        + ", ".join([row_ph] * nrows) + " " + tail
+    )
 
 
-def upsert_position(pos: dict):
-    """Insert or update a position row."""
+def _upsert_many(table: str, cols: tuple, tail: str, rows: list[list]):
+    """Run one multi-row INSERT ... ON CONFLICT per parameter-limit chunk."""
     conn = get_db()
-    cols = [
-        "id", "trade_id", "mode", "strategy", "market_id", "token_id",
-        "question", "direction", "entry_price", "shares", "filled_shares",
-        "cost", "target_price", "stop_loss", "confidence", "status",
-        "order_id", "entry_time", "exit_price", "exit_time", "exit_reason",
-        "pnl", "trigger_news", "neg_risk", "peak_price",
-    ]
-    vals = [pos.get(c) for c in cols]
-    placeholders = ", ".join(["?"] * len(cols))
-    col_names = ", ".join(cols)
-    updates = ", ".join(f"{c} = excluded.{c}" for c in cols if c != "id")
-    conn.execute(
-        f"INSERT INTO positions ({col_names}) VALUES ({placeholders}) "
-        f"ON CONFLICT(id) DO UPDATE SET {updates}",
-        vals,
+    step = max(1, _MAX_PARAMS // len(cols))
+    for i in range(0, len(rows), step):
+        chunk = rows[i:i + step]
+        conn.execute(
+            _upsert_sql(table, cols, tail, len(chunk)),
+            [v for row in chunk for v in row],
+        )
+
+
+def _upsert_returning(table: str, cols: tuple, tail: str, row: list, commit: bool) -> dict | None:
+    """Single-row upsert that hands back the stored row (None before SQLite 3.35)."""
+    conn = get_db()
+    if _HAS_RETURNING:
+        rows = conn.execute(_upsert_sql(table, cols, tail, 1) + " RETURNING *", row).fetchall()
+    else:
+        conn.execute(_upsert_sql(table, cols, tail, 1), row)
+        rows = [None]
+    if commit:
+        conn.commit()
+    return dict(rows[0]) if rows[0] is not None else None
+
+
+def upsert_position(pos: dict, commit: bool = True) -> dict | None:
+    """Insert or update a position row; returns the row as stored."""
+    return _upsert_returning(
+        "positions", _POSITION_COLS, _POSITION_UPSERT_TAIL,
+        [pos.get(c) for c in _POSITION_COLS], commit,
     )
-    conn.commit()
 
 
-def delete_position(position_id: str):
+def upsert_positions_many(positions: list[dict], commit: bool = True):
+    """Insert or update several position rows in one statement per chunk."""
+    if not positions:
+        return
+    _upsert_many(
+        "positions", _POSITION_COLS, _POSITION_UPSERT_TAIL,
+        [[p.get(c) for c in _POSITION_COLS] for p in positions],
+    )
+    if commit:
+        get_db().commit()
+
+
+def delete_position(position_id: str, commit: bool = True):
     conn = get_db()
     conn.execute("DELETE FROM positions WHERE id = ?", (position_id,))
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
-def delete_positions_by_status(mode: str, status: str, strategy: str = ""):
+def delete_positions_by_status(mode: str, status: str, strategy: str = "", commit: bool = True):
     """Delete positions matching mode+status (e.g. remove cancelled)."""
     conn = get_db()
     sql = "DELETE FROM positions WHERE mode = ? AND status = ?"
@@ -200,56 +410,85 @@ def delete_positions_by_status(mode: str, status: str, strategy: str = ""):
         sql += " AND strategy = ?"
         params.append(strategy)
     conn.execute(sql, params)
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 # ═══════════════════════════════════════════════════
 # Trades (history) CRUD
 # ═══════════════════════════════════════════════════
 
-def insert_trade(trade: dict):
+_TRADE_COLS = (
+    "position_id", "mode", "strategy", "market_id", "question",
+    "direction", "entry_price", "exit_price", "shares", "cost",
+    "pnl", "fees", "entry_time", "exit_time", "exit_reason",
+    "trigger_news", "confidence", "hold_hours",
+)
+_TRADE_READ_COLS = ("id",) + _TRADE_COLS + ("created_at",)
+_TRADE_SELECT = ", ".join(_TRADE_READ_COLS)
+_INSERT_TRADE_SQL = (
+    f"INSERT INTO trades ({', '.join(_TRADE_COLS)}) "
+    f"VALUES ({', '.join(['?'] * len(_TRADE_COLS))})"
+)
+
+
+def insert_trade(trade: dict, commit: bool = True):
     """Insert a closed trade into the history table."""
+    insert_trades_many([trade], commit=commit)
+
+
+def insert_trades_many(trades: list[dict], commit: bool = True):
+    """Insert several closed trades with one prepared statement and one commit."""
+    if not trades:
+        return
     conn = get_db()
-    cols = [
-        "position_id", "mode", "strategy", "market_id", "question",
-        "direction", "entry_price", "exit_price", "shares", "cost",
-        "pnl", "fees", "entry_time", "exit_time", "exit_reason",
-        "trigger_news", "confidence", "hold_hours",
-    ]
-    vals = [trade.get(c) for c in cols]
-    placeholders = ", ".join(["?"] * len(cols))
-    col_names = ", ".join(cols)
-    conn.execute(f"INSERT INTO trades ({col_names}) VALUES ({placeholders})", vals)
-    conn.commit()
+    conn.executemany(_INSERT_TRADE_SQL, [[t.get(c) for c in _TRADE_COLS] for t in trades])
+    if commit:
+        conn.commit()
 
 
 def get_trades(mode: str = "live", strategy: str = "", limit: int = 200) -> list[dict]:
-    conn = get_db()
-    sql = "SELECT * FROM trades WHERE mode = ?"
+    return list(iter_trades(mode, strategy, limit))
+
+
+def iter_trades(mode: str = "live", strategy: str = "", limit: int = 200) -> Iterator[dict]:
+    """Like get_trades, but yields rows as they are read."""
+    sql = f"SELECT {_TRADE_SELECT} FROM trades WHERE mode = ?"
     params: list = [mode]
     if strategy:
         sql += " AND strategy = ?"
         params.append(strategy)
     sql += " ORDER BY created_at DESC LIMIT ?"
     params.append(limit)
-    return [dict(r) for r in conn.execute(sql, params).fetchall()]
+    return _iter_dicts(_TRADE_READ_COLS, sql, params)
+
+
+def _utc_day_bounds() -> tuple[str, str]:
+    """Today's and tomorrow's UTC dates as ISO strings.
+
+    exit_time is an ISO timestamp, so `exit_time >= today AND exit_time <
+    tomorrow` selects the same rows as `LIKE 'today%'` but can use an index.
+    """
+    today = datetime.now(timezone.utc).date()
+    return today.isoformat(), (today + timedelta(days=1)).isoformat()
 
 
 def get_daily_pnl(mode: str = "live") -> float:
     """Sum of PnL for trades closed today."""
-    conn = get_db()
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    conn = get_read_db()
+    start, end = _utc_day_bounds()
     row = conn.execute(
-        "SELECT COALESCE(SUM(pnl), 0) as total FROM trades WHERE mode = ? AND exit_time LIKE ?",
-        (mode, f"{today}%"),
+        "SELECT COALESCE(SUM(pnl), 0) as total FROM trades "
+        "WHERE mode = ? AND exit_time >= ? AND exit_time < ?",
+        (mode, start, end),
     ).fetchone()
     return float(row["total"]) if row else 0.0
 
 
 def get_portfolio_summary(mode: str = "paper") -> dict:
     """Build a portfolio summary for notifications."""
-    conn = get_db()
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    conn = get_read_db()
+    start, end = _utc_day_bounds()
 
     open_positions = conn.execute(
         "SELECT COUNT(*) as cnt FROM positions WHERE mode = ? AND status = 'open'",
@@ -261,8 +500,8 @@ def get_portfolio_summary(mode: str = "paper") -> dict:
         "COALESCE(SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END), 0) as wins, "
         "COALESCE(SUM(CASE WHEN pnl <= 0 THEN 1 ELSE 0 END), 0) as losses, "
         "COALESCE(SUM(pnl), 0) as total_pnl "
-        "FROM trades WHERE mode = ? AND exit_time LIKE ?",
-        (mode, f"{today}%"),
+        "FROM trades WHERE mode = ? AND exit_time >= ? AND exit_time < ?",
+        (mode, start, end),
     ).fetchone()
 
     all_time = conn.execute(
@@ -286,33 +525,56 @@ def get_portfolio_summary(mode: str = "paper") -> dict:
 # Signals CRUD
 # ═══════════════════════════════════════════════════
 
-def insert_signal(sig: dict):
-    """Insert a signal log entry."""
-    conn = get_db()
-    cols = [
-        "timestamp", "market_id", "question", "direction", "current_price",
-        "ai_probability", "edge", "raw_edge", "fee_estimate", "confidence",
-        "position_size", "reliability", "news_titles", "llm_reasoning",
-        "filter_reason", "cooldown_age_hours",
-    ]
+_SIGNAL_COLS = (
+    "timestamp", "market_id", "question", "direction", "current_price",
+    "ai_probability", "edge", "raw_edge", "fee_estimate", "confidence",
+    "position_size", "reliability", "news_titles", "llm_reasoning",
+    "filter_reason", "cooldown_age_hours",
+)
+_SIGNAL_READ_COLS = ("id",) + _SIGNAL_COLS + ("created_at",)
+_SIGNAL_SELECT = ", ".join(_SIGNAL_READ_COLS)
+_INSERT_SIGNAL_SQL = (
+    f"INSERT INTO signals ({', '.join(_SIGNAL_COLS)}) "
+    f"VALUES ({', '.join(['?'] * len(_SIGNAL_COLS))})"
+)
+
+
+def _signal_values(sig: dict) -> list:
     vals = []
-    for c in cols:
+    for c in _SIGNAL_COLS:
         v = sig.get(c)
         if isinstance(v, (list, dict)):
-            v = json.dumps(v, ensure_ascii=False)
+            v = _dumps(v)
         vals.append(v)
-    placeholders = ", ".join(["?"] * len(cols))
-    col_names = ", ".join(cols)
-    conn.execute(f"INSERT INTO signals ({col_names}) VALUES ({placeholders})", vals)
-    conn.commit()
+    return vals
 
 
-def get_signals(limit: int = 100) -> list[dict]:
+def insert_signal(sig: dict, commit: bool = True):
+    """Insert a signal log entry."""
+    insert_signals_many([sig], commit=commit)
+
+
+def insert_signals_many(sigs: list[dict], commit: bool = True):
+    """Insert several signal log entries with one prepared statement and one commit."""
+    if not sigs:
+        return
     conn = get_db()
-    rows = conn.execute(
-        "SELECT * FROM signals ORDER BY created_at DESC LIMIT ?", (limit,)
-    ).fetchall()
-    return [dict(r) for r in rows]
+    conn.executemany(_INSERT_SIGNAL_SQL, [_signal_values(s) for s in sigs])
+    if commit:
+        conn.commit()
+
+
+def get_signals(limit: int = 100) -> list[dict]:
+    return list(iter_signals(limit))
+
+
+def iter_signals(limit: int = 100) -> Iterator[dict]:
+    """Like get_signals, but yields rows as they are read."""
+    return _iter_dicts(
+        _SIGNAL_READ_COLS,
+        f"SELECT {_SIGNAL_SELECT} FROM signals ORDER BY created_at DESC LIMIT ?",
+        (limit,),
+    )
 
 
 # ═══════════════════════════════════════════════════
@@ -320,34 +582,81 @@ def get_signals(limit: int = 100) -> list[dict]:
 # ═══════════════════════════════════════════════════
 
 def get_cooldown(key: str) -> str | None:
-    conn = get_db()
+    conn = get_read_db()
     row = conn.execute("SELECT last_alert FROM signal_cooldowns WHERE key = ?", (key,)).fetchone()
     return row["last_alert"] if row else None
 
 
-def set_cooldown(key: str, ts: str):
+def get_cooldown_ages(keys: list[str]) -> dict[str, float]:
+    """Hours since the last alert for each key that has a cooldown row.
+
+    Ages come straight from the integer last_alert_ts column, so callers get
+    a float back instead of parsing one datetime per key.
+    """
+    if not keys:
+        return {}
+    conn = get_read_db()
+    now = time.time()
+    keys = list(dict.fromkeys(keys))
+    ages = {}
+    step = _MAX_PARAMS - 1  # one slot for the timestamp
+    for i in range(0, len(keys), step):
+        chunk = keys[i:i + step]
+        placeholders = ", ".join(["?"] * len(chunk))
+        rows = conn.execute(
+            "SELECT key, (? - last_alert_ts) / 3600.0 AS age_hours "
+            f"FROM signal_cooldowns WHERE key IN ({placeholders})",
+            [now, *chunk],
+        ).fetchall()
+        ages.update((r["key"], r["age_hours"]) for r in rows if r["age_hours"] is not None)
+    return ages
+
+
+_SET_COOLDOWN_SQL = (
+    "INSERT INTO signal_cooldowns (key, last_alert, last_alert_ts) VALUES (?, ?, ?) "
+    "ON CONFLICT(key) DO UPDATE SET "
+    "last_alert = excluded.last_alert, last_alert_ts = excluded.last_alert_ts"
+)
+
+
+def _iso_to_epoch(ts: str) -> int:
+    dt = datetime.fromisoformat(ts)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def set_cooldown(key: str, ts: str, commit: bool = True):
     conn = get_db()
-    conn.execute(
-        "INSERT INTO signal_cooldowns (key, last_alert) VALUES (?, ?) "
-        "ON CONFLICT(key) DO UPDATE SET last_alert = excluded.last_alert",
-        (key, ts),
-    )
-    conn.commit()
+    conn.execute(_SET_COOLDOWN_SQL, (key, ts, _iso_to_epoch(ts)))
+    if commit:
+        conn.commit()
 
 
-def prune_cooldowns(cutoff_ts: float):
+def set_cooldowns(keys: list[str], ts: str, commit: bool = True):
+    """Stamp several cooldown keys with the same alert time in one commit."""
+    if not keys:
+        return
+    conn = get_db()
+    epoch = _iso_to_epoch(ts)
+    conn.executemany(_SET_COOLDOWN_SQL, [(key, ts, epoch) for key in keys])
+    if commit:
+        conn.commit()
+
+
+def prune_cooldowns(cutoff_ts: float, commit: bool = True):
     """Delete cooldowns older than cutoff (unix timestamp)."""
     conn = get_db()
-    # We store ISO timestamps, so convert and compare
     conn.execute(
-        "DELETE FROM signal_cooldowns WHERE strftime('%s', last_alert) < ?",
-        (str(int(cutoff_ts)),),
+        "DELETE FROM signal_cooldowns WHERE last_alert_ts < ?",
+        (int(cutoff_ts),),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def get_all_cooldowns() -> dict[str, str]:
-    conn = get_db()
+    conn = get_read_db()
     rows = conn.execute("SELECT key, last_alert FROM signal_cooldowns").fetchall()
     return {r["key"]: r["last_alert"] for r in rows}
 
@@ -356,71 +665,89 @@ def get_all_cooldowns() -> dict[str, str]:
 # Notifications CRUD
 # ═══════════════════════════════════════════════════
 
-def add_notification(message: str, action: str = ""):
+def add_notification(message: str, action: str = "", commit: bool = True):
     conn = get_db()
     conn.execute(
         "INSERT INTO notifications (message, action) VALUES (?, ?)",
         (message, action),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
+
+
+_NOTIFICATION_COLS = ("id", "message", "action", "consumed", "created_at")
 
 
 def get_pending_notifications() -> list[dict]:
-    conn = get_db()
-    rows = conn.execute(
-        "SELECT * FROM notifications WHERE consumed = 0 ORDER BY created_at"
-    ).fetchall()
-    return [dict(r) for r in rows]
+    return _select_dicts(
+        _NOTIFICATION_COLS,
+        "SELECT id, message, action, consumed, created_at "
+        "FROM notifications WHERE consumed = 0 ORDER BY created_at",
+    )
 
 
-def mark_notifications_consumed(ids: list[int]):
+def mark_notifications_consumed(ids: list[int], commit: bool = True):
     if not ids:
         return
     ids = [int(i) for i in ids]  # enforce integer type
     conn = get_db()
     placeholders = ", ".join(["?"] * len(ids))
     conn.execute(f"UPDATE notifications SET consumed = 1 WHERE id IN ({placeholders})", ids)
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 # ═══════════════════════════════════════════════════
 # Decisions CRUD
 # ═══════════════════════════════════════════════════
 
-def upsert_decision(dec: dict):
-    """Insert or update a decision record."""
-    conn = get_db()
-    # Serialize JSON fields
-    for field in ("signal_data", "decision_data", "order_data", "fill_data", "settlement_data", "events"):
-        if field in dec and not isinstance(dec[field], str):
-            dec[field] = json.dumps(dec[field], ensure_ascii=False) if dec[field] is not None else None
-
-    cols = [
-        "trade_id", "status", "market_id", "question", "direction",
-        "signal_data", "decision_data", "order_data", "fill_data",
-        "settlement_data", "events",
-    ]
-    vals = [dec.get(c) for c in cols]
-    placeholders = ", ".join(["?"] * len(cols))
-    col_names = ", ".join(cols)
-    updates = ", ".join(f"{c} = excluded.{c}" for c in cols if c != "trade_id")
-    updates += ", updated_at = datetime('now')"
-    conn.execute(
-        f"INSERT INTO decisions ({col_names}) VALUES ({placeholders}) "
-        f"ON CONFLICT(trade_id) DO UPDATE SET {updates}",
-        vals,
+_DECISION_COLS = (
+    "trade_id", "status", "market_id", "question", "direction",
+    "signal_data", "decision_data", "order_data", "fill_data",
+    "settlement_data", "events",
+)
+# Decision columns holding JSON text; encoded on write, decoded on read
+_DECISION_JSON_FIELDS = ("signal_data", "decision_data", "order_data", "fill_data", "settlement_data", "events")
+_DECISION_UPSERT_TAIL = "ON CONFLICT(trade_id) DO UPDATE SET " + ", ".join(
+    f"{c} = excluded.{c}" for c in _DECISION_COLS if c != "trade_id"
+) + ", updated_at = datetime('now')"
+
+
+def upsert_decision(dec: dict, commit: bool = True) -> dict | None:
+    """Insert or update a decision record; returns it as stored, JSON decoded."""
+    _encode_decision(dec)
+    row = _upsert_returning(
+        "decisions", _DECISION_COLS, _DECISION_UPSERT_TAIL,
+        [dec.get(c) for c in _DECISION_COLS], commit,
     )
-    conn.commit()
+    return _decode_decision(row) if row is not None else None
 
 
-def get_decision(trade_id: str) -> dict | None:
-    conn = get_db()
-    row = conn.execute("SELECT * FROM decisions WHERE trade_id = ?", (trade_id,)).fetchone()
-    if not row:
-        return None
-    d = dict(row)
-    # Deserialize JSON fields
-    for field in ("signal_data", "decision_data", "order_data", "fill_data", "settlement_data", "events"):
+def _encode_decision(dec: dict):
+    """Serialize a decision's JSON fields in place."""
+    for field in _DECISION_JSON_FIELDS:
+        v = dec.get(field)
+        if v is not None and not isinstance(v, str):
+            dec[field] = _dumps(v)
+
+
+def upsert_decisions_many(decs: list[dict], commit: bool = True):
+    """Insert or update several decision records in one statement per chunk."""
+    if not decs:
+        return
+    for dec in decs:
+        _encode_decision(dec)
+    _upsert_many(
+        "decisions", _DECISION_COLS, _DECISION_UPSERT_TAIL,
+        [[d.get(c) for c in _DECISION_COLS] for d in decs],
+    )
+    if commit:
+        get_db().commit()
+
+
+def _decode_decision(d: dict) -> dict:
+    """Deserialize a decision row's JSON fields in place."""
+    for field in _DECISION_JSON_FIELDS:
         if d.get(field) and isinstance(d[field], str):
             try:
                 d[field] = json.loads(d[field])
@@ -429,25 +756,121 @@ def get_decision(trade_id: str) -> dict | None:
     return d
 
 
-def get_decisions(status: str | None = None, limit: int = 100) -> list[dict]:
-    conn = get_db()
+def advance_decision(
+    trade_id: str,
+    event: dict,
+    status: str | None = None,
+    stage: str | None = None,
+    stage_data: dict | None = None,
+    commit: bool = True,
+) -> dict | None:
+    """Append one timeline event (and optionally set status + a stage blob) in place.
+
+    SQLite appends to the events array itself via json_insert, so a lifecycle
+    step costs one UPDATE instead of reading, decoding, re-encoding and
+    rewriting every JSON blob of the decision. Returns the updated decision,
+    or None if trade_id has no record.
+    """
+    sets = [
+        "events = json_insert(COALESCE(events, '[]'), '$[#]', json(?))",
+        "updated_at = datetime('now')",
+    ]
+    params: list = [_dumps(event)]
     if status:
-        rows = conn.execute(
-            "SELECT * FROM decisions WHERE status = ? ORDER BY updated_at DESC LIMIT ?",
-            (status, limit),
-        ).fetchall()
+        sets.append("status = ?")
+        params.append(status)
+    if stage:
+        if stage not in _DECISION_JSON_FIELDS:
+            raise ValueError(f"unknown decision stage: {stage}")
+        sets.append(f"{stage} = ?")
+        params.append(_dumps(stage_data))
+    params.append(trade_id)
+
+    conn = get_db()
+    sql = f"UPDATE decisions SET {', '.join(sets)} WHERE trade_id = ?"
+    if _HAS_RETURNING:
+        rows = conn.execute(sql + " RETURNING *", params).fetchall()
     else:
-        rows = conn.execute(
-            "SELECT * FROM decisions ORDER BY updated_at DESC LIMIT ?", (limit,)
-        ).fetchall()
-    results = []
-    for row in rows:
-        d = dict(row)
-        for field in ("signal_data", "decision_data", "order_data", "fill_data", "settlement_data", "events"):
-            if d.get(field) and isinstance(d[field], str):
-                try:
-                    d[field] = json.loads(d[field])
-                except (json.JSONDecodeError, TypeError):
-                    pass
-        results.append(d)
-    return results
+        rows = [None] if conn.execute(sql, params).rowcount else []
+    if commit:
+        conn.commit()
+    if not rows:
+        return None
+    return _decode_decision(dict(rows[0])) if rows[0] is not None else get_decision(trade_id)
+
+
+def get_decision_stats(limit: int = 200, since: str | None = None) -> dict[str, dict]:
+    """Per-status counts and settled P&L over the `limit` most recently updated decisions.
+
+    Returns {status: {"count", "wins", "losses", "pnl"}}; a missing pnl
+    counts as 0 (a loss), matching how the review report has always scored it.
+    """
+    where, params = _decision_filter(None, since)
+    rows = get_read_db().execute(
+        "SELECT status, COUNT(*) AS count, "
+        "SUM(CASE WHEN COALESCE(settlement_pnl, 0) > 0 THEN 1 ELSE 0 END) AS wins, "
+        "SUM(CASE WHEN COALESCE(settlement_pnl, 0) <= 0 THEN 1 ELSE 0 END) AS losses, "
+        "COALESCE(SUM(settlement_pnl), 0) AS pnl "
+        f"FROM (SELECT status, settlement_pnl FROM decisions {where}"
+        "ORDER BY updated_at DESC LIMIT ?) "
+        "GROUP BY status",
+        params + [limit],
+    ).fetchall()
+    return {r["status"]: {k: r[k] for k in ("count", "wins", "losses", "pnl")} for r in rows}
+
+
+def get_decision(trade_id: str) -> dict | None:
+    conn = get_read_db()
+    row = conn.execute("SELECT * FROM decisions WHERE trade_id = ?", (trade_id,)).fetchone()
+    if not row:
+        return None
+    return _decode_decision(dict(row))
+
+
+_DECISION_SUMMARY_READ_COLS = (
+    "trade_id", "status", "market_id", "question", "direction",
+    *_DECISION_SUMMARY_COLUMNS, "created_at", "updated_at",
+)
+_DECISION_SUMMARY_SELECT = ", ".join(_DECISION_SUMMARY_READ_COLS)
+
+
+def _decision_filter(status: str | None, since: str | None) -> tuple[str, list]:
+    clauses, params = [], []
+    if status:
+        clauses.append("status = ?")
+        params.append(status)
+    if since:
+        clauses.append("created_at >= ?")
+        params.append(since)
+    return (f"WHERE {' AND '.join(clauses)} " if clauses else ""), params
+
+
+def get_decisions(status: str | None = None, limit: int = 100,
+                  summary_only: bool = False, since: str | None = None) -> list[dict]:
+    return list(iter_decisions(status, limit, summary_only, since))
+
+
+def iter_decisions(status: str | None = None, limit: int = 100,
+                   summary_only: bool = False, since: str | None = None) -> Iterator[dict]:
+    """Like get_decisions, but decodes and yields one row at a time.
+
+    summary_only=True returns the plain columns plus the json_extract'ed
+    summary fields, skipping the JSON blobs (and their decoding) entirely.
+    since limits rows to created_at >= since (SQLite "YYYY-MM-DD HH:MM:SS").
+    """
+    where, params = _decision_filter(status, since)
+    params.append(limit)
+    if summary_only:
+        yield from _iter_dicts(
+            _DECISION_SUMMARY_READ_COLS,
+            f"SELECT {_DECISION_SUMMARY_SELECT} FROM decisions {where}"
+            "ORDER BY updated_at DESC LIMIT ?",
+            params,
+        )
+        return
+
+    cur = get_read_db().execute(
+        f"SELECT * FROM decisions {where}ORDER BY updated_at DESC LIMIT ?", params,
+    )
+    for row in cur:
+        yield _decode_decision(dict(row))
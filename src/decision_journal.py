@@ -4,11 +4,18 @@ Each trade gets a single row in the decisions table that accumulates events
 from signal → settlement. Designed for post-mortem review and future UI display.
 """
 
-import json
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from .db import upsert_decision, get_decision, get_decisions
+from .db import (
+    upsert_decision, advance_decision, get_decisions, get_decision_stats, iter_decisions,
+)
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO text — taken once per step and shared by its blob and event."""
+    return datetime.fromtimestamp(time.time(), timezone.utc).isoformat()
 
 
 # ═══════════════════════════════════════════
@@ -30,7 +37,7 @@ def record_signal(
     extra: dict = None,
 ) -> dict:
     """Step 1: Signal discovered. Creates the decision record."""
-    now = datetime.now(timezone.utc).isoformat()
+    now = _now_iso()
     signal_data = {
         "time": now,
         "direction": direction,
@@ -60,8 +67,8 @@ def record_signal(
         "settlement_data": None,
         "events": events,
     }
-    upsert_decision(decision)
-    return decision
+    # RETURNING hands back the stored row, so no follow-up get_decision
+    return upsert_decision(decision) or decision
 
 
 def record_decision(
@@ -75,13 +82,8 @@ def record_decision(
     reason: str = "",
 ) -> Optional[dict]:
     """Step 2: Decision to open (or skip). Updates the decision record."""
-    decision = get_decision(trade_id)
-    if not decision:
-        return None
-
-    now = datetime.now(timezone.utc).isoformat()
-    decision["status"] = "decided"
-    decision["decision_data"] = {
+    now = _now_iso()
+    decision_data = {
         "time": now,
         "action": action,
         "size_usd": round(size_usd, 2),
@@ -91,17 +93,12 @@ def record_decision(
         "stop_loss": round(stop_loss, 4),
         "reason": reason,
     }
-    events = decision.get("events") or []
-    if isinstance(events, str):
-        events = json.loads(events)
-    events.append({
+    event = {
         "time": now,
         "type": f"decision_{action}",
         "detail": f"${size_usd:.2f} @ {price:.4f} ({shares} shares)" if action == "open" else reason,
-    })
-    decision["events"] = events
-    upsert_decision(decision)
-    return decision
+    }
+    return advance_decision(trade_id, event, "decided", "decision_data", decision_data)
 
 
 def record_order(
@@ -115,13 +112,8 @@ def record_order(
     neg_risk: bool = False,
 ) -> Optional[dict]:
     """Step 3: Order placed on CLOB. Records order details."""
-    decision = get_decision(trade_id)
-    if not decision:
-        return None
-
-    now = datetime.now(timezone.utc).isoformat()
-    decision["status"] = "ordered"
-    decision["order_data"] = {
+    now = _now_iso()
+    order_data = {
         "time": now,
         "order_id": order_id,
         "token_id": token_id,
@@ -131,17 +123,12 @@ def record_order(
         "cost": round(cost, 2),
         "neg_risk": neg_risk,
     }
-    events = decision.get("events") or []
-    if isinstance(events, str):
-        events = json.loads(events)
-    events.append({
+    event = {
         "time": now,
         "type": "order_placed",
         "detail": f"{side} {shares}x @ {price:.4f} = ${cost:.2f} (order {order_id[:12]})",
-    })
-    decision["events"] = events
-    upsert_decision(decision)
-    return decision
+    }
+    return advance_decision(trade_id, event, "ordered", "order_data", order_data)
 
 
 def record_fill(
@@ -152,13 +139,8 @@ def record_fill(
     partial: bool = False,
 ) -> Optional[dict]:
     """Step 4: Order filled (fully or partially)."""
-    decision = get_decision(trade_id)
-    if not decision:
-        return None
-
-    now = datetime.now(timezone.utc).isoformat()
-    decision["status"] = "filled" if not partial else "partial_fill"
-    decision["fill_data"] = {
+    now = _now_iso()
+    fill_data = {
         "time": now,
         "fill_price": round(fill_price, 4),
         "fill_shares": fill_shares,
@@ -166,17 +148,13 @@ def record_fill(
         "partial": partial,
     }
     label = "partial_fill" if partial else "order_filled"
-    events = decision.get("events") or []
-    if isinstance(events, str):
-        events = json.loads(events)
-    events.append({
+    event = {
         "time": now,
         "type": label,
         "detail": f"{fill_shares}x @ {fill_price:.4f} = ${fill_cost:.2f}",
-    })
-    decision["events"] = events
-    upsert_decision(decision)
-    return decision
+    }
+    status = "filled" if not partial else "partial_fill"
+    return advance_decision(trade_id, event, status, "fill_data", fill_data)
 
 
 def record_settlement(
@@ -189,13 +167,8 @@ def record_settlement(
     tx_hash: str = "",
 ) -> Optional[dict]:
     """Step 5: Position closed or redeemed — final settlement."""
-    decision = get_decision(trade_id)
-    if not decision:
-        return None
-
-    now = datetime.now(timezone.utc).isoformat()
-    decision["status"] = "settled"
-    decision["settlement_data"] = {
+    now = _now_iso()
+    settlement_data = {
         "time": now,
         "exit_price": round(exit_price, 4),
         "exit_reason": exit_reason,
@@ -206,96 +179,91 @@ def record_settlement(
         "tx_hash": tx_hash,
     }
     icon = "✅" if pnl >= 0 else "❌"
-    events = decision.get("events") or []
-    if isinstance(events, str):
-        events = json.loads(events)
-    events.append({
+    event = {
         "time": now,
         "type": "settled",
         "detail": f"{icon} {exit_reason}: ${pnl:+.2f} (fees ${fees:.2f}, net ${pnl - fees:+.2f}) after {duration_hours:.1f}h",
-    })
-    decision["events"] = events
-    upsert_decision(decision)
-    return decision
+    }
+    return advance_decision(trade_id, event, "settled", "settlement_data", settlement_data)
 
 
 def add_event(trade_id: str, event_type: str, detail: str) -> Optional[dict]:
     """Add a custom event to the timeline (e.g., price updates, rebalance checks)."""
-    decision = get_decision(trade_id)
-    if not decision:
-        return None
-
-    now = datetime.now(timezone.utc).isoformat()
-    events = decision.get("events") or []
-    if isinstance(events, str):
-        events = json.loads(events)
-    events.append({"time": now, "type": event_type, "detail": detail})
-    decision["events"] = events
-    upsert_decision(decision)
-    return decision
+    now = _now_iso()
+    return advance_decision(trade_id, {"time": now, "type": event_type, "detail": detail})
 
 
 # ═══════════════════════════════════════════
 # Reporting
 # ═══════════════════════════════════════════
 
+_ACTIVE_STATUSES = ("ordered", "filled")
+
+def _since(days: int) -> str:
+    """Cutoff `days` ago in the format SQLite's datetime('now') stores created_at."""
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+
+
 def get_recent_decisions(days: int = 7, status: str = None) -> list[dict]:
-    """Get recent decisions for review. Optionally filter by status."""
-    return get_decisions(status=status, limit=200)
+    """Get decisions created in the last `days` days. Optionally filter by status."""
+    return get_decisions(status=status, limit=200, since=_since(days))
 
 
 def generate_review_report(days: int = 7) -> str:
     """Generate a markdown review report of recent decisions."""
-    decisions = get_recent_decisions(days)
-    if not decisions:
+    # Totals come from one GROUP BY; rows are only walked for the detail lists
+    since = _since(days)
+    stats = get_decision_stats(limit=200, since=since)
+    if not stats:
         return "No decisions in the last {} days.".format(days)
 
-    settled = [d for d in decisions if d.get("status") == "settled"]
-    active = [d for d in decisions if d.get("status") in ("ordered", "filled")]
-    signals_only = [d for d in decisions if d.get("status") in ("signal", "decided")]
+    empty = {"count": 0, "wins": 0, "losses": 0, "pnl": 0}
+    settled_stats = stats.get("settled", empty)
+    active_count = sum(stats.get(st, empty)["count"] for st in _ACTIVE_STATUSES)
+    signals_count = sum(stats.get(st, empty)["count"] for st in ("signal", "decided"))
 
-    total_pnl = sum((d.get("settlement_data") or {}).get("pnl", 0) for d in settled)
-    wins = sum(1 for d in settled if (d.get("settlement_data") or {}).get("pnl", 0) > 0)
-    losses = sum(1 for d in settled if (d.get("settlement_data") or {}).get("pnl", 0) <= 0)
+    total_pnl = settled_stats["pnl"]
+    wins, losses = settled_stats["wins"], settled_stats["losses"]
     win_rate = f"{wins/(wins+losses)*100:.0f}%" if (wins + losses) > 0 else "N/A"
 
     lines = [
         f"# 决策复盘 — 最近 {days} 天",
         f"",
         f"## 总览",
-        f"- 已结算: {len(settled)} 笔 (胜率 {win_rate}, {wins}W/{losses}L)",
+        f"- 已结算: {settled_stats['count']} 笔 (胜率 {win_rate}, {wins}W/{losses}L)",
         f"- 总 P&L: ${total_pnl:+.2f}",
-        f"- 活跃: {len(active)} 笔",
-        f"- 仅信号: {len(signals_only)} 笔",
+        f"- 活跃: {active_count} 笔",
+        f"- 仅信号: {signals_count} 笔",
         f"",
     ]
 
-    if settled:
-        lines.append("## 已结算交易")
-        for d in settled:
-            s = d.get("settlement_data") or {}
-            sig = d.get("signal_data") or {}
-            q = (d.get("question") or "?")[:60]
-            icon = "🟢" if s.get("pnl", 0) >= 0 else "🔴"
-            lines.append(
-                f"- {icon} **{q}** | {sig.get('direction','')} | "
-                f"${s.get('pnl',0):+.2f} | {s.get('exit_reason','')} | "
-                f"{s.get('duration_hours',0):.1f}h"
+    settled_lines, active_lines = [], []
+    for d in iter_decisions(limit=200, summary_only=True, since=since):
+        q = (d.get("question") or "?")[:60]
+        if d["status"] == "settled":
+            pnl = d.get("settlement_pnl") or 0
+            icon = "🟢" if pnl >= 0 else "🔴"
+            settled_lines.append(
+                f"- {icon} **{q}** | {d.get('direction') or ''} | "
+                f"${pnl:+.2f} | {d.get('settlement_exit_reason') or ''} | "
+                f"{d.get('settlement_duration_hours') or 0:.1f}h"
             )
-            news = sig.get("trigger_news", "")[:80]
+            news = (d.get("signal_trigger_news") or "")[:80]
             if news:
-                lines.append(f"  触发: {news}")
+                settled_lines.append(f"  触发: {news}")
+        elif d["status"] in _ACTIVE_STATUSES:
+            active_lines.append(
+                f"- ⏳ **{q}** | {d.get('direction') or ''} | "
+                f"${d.get('order_cost') or 0:.2f} @ {d.get('order_price') or 0:.4f}"
+            )
+
+    if settled_lines:
+        lines.append("## 已结算交易")
+        lines.extend(settled_lines)
 
-    if active:
+    if active_lines:
         lines.append("")
         lines.append("## 活跃持仓")
-        for d in active:
-            sig = d.get("signal_data") or {}
-            o = d.get("order_data") or {}
-            q = (d.get("question") or "?")[:60]
-            lines.append(
-                f"- ⏳ **{q}** | {sig.get('direction','')} | "
-                f"${o.get('cost',0):.2f} @ {o.get('price',0):.4f}"
-            )
+        lines.extend(active_lines)
 
     return "\n".join(lines)
@@ -8,6 +8,7 @@ from datetime import datetime, timezone, timedelta
 import httpx
 
 from .config import get_config
+from .fileio import atomic_write_bytes
 
 CALENDAR_URLS = [
     "https://nfs.faireconomy.media/ff_calendar_thisweek.json",
@@ -37,7 +38,7 @@ def _load_cache():
 
 
 def _save_cache(cache):
-    _get_cache_file().write_text(json.dumps(cache, indent=2))
+    atomic_write_bytes(_get_cache_file(), json.dumps(cache, separators=(",", ":")).encode())
 
 
 def fetch_calendar() -> list[dict]:
@@ -1,16 +1,26 @@
 """Edge detection with proper fee modeling and Kelly criterion sizing."""
 
+import atexit
 import json
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from .probability_engine import ProbEstimate
 from .config import get_config
 from .db import add_notification
+from .fileio import atomic_write_bytes
 
 FILTERED_LOG = Path(__file__).parent / "filtered_signals.json"
 _MAX_FILTERED_ENTRIES = 500  # Keep last 500
 
+# Filtered entries are kept in memory after the first read and the file is
+# rewritten every few entries (and at exit) instead of on every filter
+_FILTERED_FLUSH_EVERY = 20
+_FILTERED_FLUSH_SECS = 30.0
+_FILTERED = {"path": None, "entries": None, "pending": 0, "flushed_at": float("-inf")}
+
 # Human-readable filter reasons
 _FILTER_LABELS = {
     "expiring_<1h": "Expiring in <1h",
@@ -24,6 +34,33 @@ _FILTER_LABELS = {
 }
 
 
+def _filtered_entries() -> deque:
+    if _FILTERED["path"] != FILTERED_LOG:
+        flush_filtered_log()  # don't drop entries buffered for the old path
+        try:
+            entries = json.loads(FILTERED_LOG.read_text()) if FILTERED_LOG.exists() else []
+        except (json.JSONDecodeError, OSError):
+            entries = []
+        _FILTERED.update(path=FILTERED_LOG, pending=0, flushed_at=float("-inf"),
+                         entries=deque(entries, maxlen=_MAX_FILTERED_ENTRIES))
+    return _FILTERED["entries"]
+
+
+def flush_filtered_log():
+    """Write any buffered filtered-signal entries to FILTERED_LOG."""
+    if not _FILTERED["pending"]:
+        return
+    atomic_write_bytes(
+        _FILTERED["path"],
+        json.dumps(list(_FILTERED["entries"]), ensure_ascii=False, separators=(",", ":")).encode(),
+    )
+    _FILTERED["pending"] = 0
+    _FILTERED["flushed_at"] = time.monotonic()
+
+
+atexit.register(flush_filtered_log)
+
+
 def _log_filtered(estimate: ProbEstimate, reason: str, details: dict = None):
     """Log a signal that was discovered but filtered out."""
     entry = {
@@ -37,13 +74,11 @@ def _log_filtered(estimate: ProbEstimate, reason: str, details: dict = None):
         "reason": reason,
         **(details or {}),
     }
-    try:
-        entries = json.loads(FILTERED_LOG.read_text()) if FILTERED_LOG.exists() else []
-    except (json.JSONDecodeError, OSError):
-        entries = []
-    entries.append(entry)
-    entries = entries[-_MAX_FILTERED_ENTRIES:]
-    FILTERED_LOG.write_text(json.dumps(entries, indent=2, ensure_ascii=False))
+    _filtered_entries().append(entry)
+    _FILTERED["pending"] += 1
+    if (_FILTERED["pending"] >= _FILTERED_FLUSH_EVERY
+            or time.monotonic() - _FILTERED["flushed_at"] >= _FILTERED_FLUSH_SECS):
+        flush_filtered_log()
 
     # Write to notifications for OpenClaw consumption
     label = _FILTER_LABELS.get(reason, reason)
@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 import httpx
 
 from .config import get_config
+from .fileio import atomic_write_bytes
 
 MIN_INTERVAL = 3600  # 1 hour
 
@@ -29,7 +30,7 @@ def _load_state():
 
 
 def _save_state(state):
-    _state_file().write_text(json.dumps(state))
+    atomic_write_bytes(_state_file(), json.dumps(state).encode())
 
 
 def _change_importance(pct_change: float) -> int:
@@ -263,17 +263,46 @@ def extract_entities(text: str) -> list[str]:
 
 # ── Market matching ─────────────────────────────────────────────────────────
 
+def build_market_index(markets: list[dict]) -> dict[str, list[tuple[dict, MarketMeta]]]:
+    """Parse every market once and group (market, meta) pairs by news category.
+
+    Each category maps to the markets that pass the category gate for news of
+    that category (same category or unknown), in original market order;
+    "unknown" maps to all markets.
+    """
+    index: dict[str, list[tuple[dict, MarketMeta]]] = {cat: [] for cat in CATEGORIES}
+    index["unknown"] = []
+    for market in markets:
+        entry = (market, detect_market_meta(market))
+        index["unknown"].append(entry)
+        if entry[1].category == "unknown":
+            for cat in CATEGORIES:
+                index[cat].append(entry)
+        else:
+            index[entry[1].category].append(entry)
+    return index
+
+
 def match_markets(
     news_entities: list[str],
     news_category: str,
     markets: list[dict],
     threshold: int = 75,
+    market_index: dict[str, list[tuple[dict, MarketMeta]]] | None = None,
 ) -> list[dict]:
-    """Match news to markets with category filtering and entity requirements."""
+    """Match news to markets with category filtering and entity requirements.
+
+    Pass ``market_index`` (from build_market_index) to reuse parsed market
+    metadata and only visit markets in the news item's category.
+    """
+    if market_index is not None:
+        candidates = market_index.get(news_category, market_index["unknown"])
+    else:
+        candidates = ((m, detect_market_meta(m)) for m in markets)
+
     matches = []
-    for market in markets:
+    for market, meta in candidates:
         q = market["question"].lower()
-        meta = detect_market_meta(market)
 
         # CATEGORY GATE: only match same category (or unknown)
         if news_category != "unknown" and meta.category != "unknown":
@@ -411,7 +440,8 @@ def deduplicate_news(news_items: list[dict], threshold: int = 80) -> list[dict]:
 
 # ── Main parsing ────────────────────────────────────────────────────────────
 
-def parse_news_item(news_item: dict, markets: list[dict]) -> NewsSignal | None:
+def parse_news_item(news_item: dict, markets: list[dict],
+                    market_index: dict | None = None) -> NewsSignal | None:
     """Analyze a single news item against available markets."""
     text = f"{news_item['title']} {news_item.get('summary', '')}"
     entities = extract_entities(text)
@@ -424,7 +454,7 @@ def parse_news_item(news_item: dict, markets: list[dict]) -> NewsSignal | None:
     importance = score_importance(news_item["title"], source)
     breaking = is_breaking(news_item["title"])
 
-    matched = match_markets(entities, category, markets, threshold=75)
+    matched = match_markets(entities, category, markets, threshold=75, market_index=market_index)
     if not matched:
         return None
 
@@ -445,24 +475,30 @@ def parse_news_item(news_item: dict, markets: list[dict]) -> NewsSignal | None:
 def parse_all(news_items: list[dict], markets: list[dict]) -> list[NewsSignal]:
     """Parse all news, deduplicate first, return signals."""
     deduped = deduplicate_news(news_items)
+    market_index = build_market_index(markets)
     signals = []
     for item in deduped:
-        sig = parse_news_item(item, markets)
+        sig = parse_news_item(item, markets, market_index)
         if sig:
             signals.append(sig)
     return signals
 
 
-def parse_with_llm(news_items: list[dict], markets: list[dict]) -> list[dict]:
+def parse_with_llm(news_items: list[dict], markets: list[dict],
+                   row_batch: int = 15, parallelism: int = 1) -> list[dict]:
     """Run LLM analysis and return LLM signals as enriched dicts.
     
+    ``row_batch`` news items go into each prompt and up to ``parallelism``
+    prompts run concurrently (see analyze_news_batch).
+
     Returns list of dicts with keys: market_id, question, estimated_probability,
     confidence, direction, reasoning, news_title, source (='LLM').
     """
     from .llm_analyzer import analyze_news_batch
 
     try:
-        llm_signals = analyze_news_batch(news_items, markets)
+        llm_signals = analyze_news_batch(news_items, markets,
+                                         row_batch=row_batch, parallelism=parallelism)
     except Exception as e:
         print(f"[LLM] Analysis failed, falling back to keywords: {e}")
         return []
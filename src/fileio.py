@@ -0,0 +1,15 @@
+"""File helpers shared by modules that persist JSON state to disk."""
+import os
+from pathlib import Path
+
+
+def atomic_write_bytes(path: str | Path, data: bytes):
+    """Write data to path via a sibling .tmp file and os.replace.
+
+    A crash mid-write leaves the previous file intact instead of truncated
+    JSON, and readers never observe a partial file.
+    """
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
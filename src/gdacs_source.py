@@ -8,6 +8,7 @@ import feedparser
 import httpx
 
 from .config import get_config
+from .fileio import atomic_write_bytes
 
 MIN_INTERVAL = 1800  # 30 minutes
 GDACS_RSS = "https://www.gdacs.org/xml/rss.xml"
@@ -26,7 +27,7 @@ def _load_state():
 
 def _save_state(state):
     state["seen_ids"] = state.get("seen_ids", [])[-200:]
-    _state_file().write_text(json.dumps(state))
+    atomic_write_bytes(_state_file(), json.dumps(state).encode())
 
 
 def _parse_alert_level(entry) -> str:
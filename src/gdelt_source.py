@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 import httpx
 
 from .config import get_config
+from .fileio import atomic_write_bytes
 
 MIN_INTERVAL = 900  # 15 minutes
 MAX_SEEN = 500
@@ -41,7 +42,7 @@ def _load_state():
 
 def _save_state(state):
     state["seen_ids"] = state.get("seen_ids", [])[-MAX_SEEN:]
-    _state_file().write_text(json.dumps(state))
+    atomic_write_bytes(_state_file(), json.dumps(state).encode())
 
 
 def _domain_importance(url: str) -> int:
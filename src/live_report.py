@@ -9,7 +9,7 @@ from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import ApiCreds, BalanceAllowanceParams
 
 from .config import get_config
-from .db import get_db
+from .db import get_read_db
 
 
 def _wallet_balance() -> float | None:
@@ -54,7 +54,7 @@ def generate_report() -> str:
     """Generate report from Polyclaw DB positions only."""
     cfg = get_config()
     now = datetime.now(timezone.utc)
-    db = get_db()
+    db = get_read_db()
 
     # Wallet
     usdc_e = _wallet_balance()
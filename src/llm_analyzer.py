@@ -2,10 +2,13 @@
 
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from .config import get_config
 
+MAX_PROMPT_NEWS = 15  # news items shown per prompt
+
 
 @dataclass
 class LLMSignal:
@@ -24,7 +27,7 @@ def build_prompt(news_items: list[dict], markets: list[dict],
                  matched_market_ids: set[str] | None = None) -> str:
     news_section = "\n".join(
         f"  [{i}] {item.get('title', 'N/A')} (source: {item.get('source', 'unknown')})"
-        for i, item in enumerate(news_items[:15])
+        for i, item in enumerate(news_items[:MAX_PROMPT_NEWS])
     )
 
     # Prioritize markets with keyword matches, cap at 12
@@ -68,14 +71,33 @@ def _yes_price(market: dict) -> str:
 
 
 def analyze_news_batch(news_items: list[dict], markets: list[dict],
-                       matched_market_ids: set[str] | None = None) -> list[LLMSignal]:
-    """Analyze news via LLM API call."""
+                       matched_market_ids: set[str] | None = None,
+                       row_batch: int = 15, parallelism: int = 1) -> list[LLMSignal]:
+    """Analyze news via LLM API call.
+
+    News is split into prompts of ``row_batch`` items (clamped to
+    MAX_PROMPT_NEWS, the most one prompt shows), and up to ``parallelism`` prompts are sent concurrently.
+    The defaults reproduce the single-prompt behaviour.
+    """
     cfg = get_config()
     if not news_items or not markets:
         return []
 
     if cfg.llm_provider in ("openai", "gemini", "anthropic"):
-        return _call_api(news_items, markets, matched_market_ids, cfg)
+        step = max(1, min(row_batch, MAX_PROMPT_NEWS))
+        offsets = range(0, min(len(news_items), step * max(1, parallelism)), step)
+        if len(offsets) == 1:
+            return _call_api(news_items[:step], markets, matched_market_ids, cfg)
+
+        def run(offset: int) -> list[LLMSignal]:
+            batch = _call_api(news_items[offset:offset + step], markets, matched_market_ids, cfg)
+            for sig in batch:
+                sig.news_index += offset
+            return batch
+
+        # Latency-bound HTTP calls; map() keeps results in batch order
+        with ThreadPoolExecutor(max_workers=len(offsets)) as pool:
+            return [sig for batch in pool.map(run, offsets) for sig in batch]
 
     if cfg.llm_provider:
         print(f"[LLM] Unknown provider: {cfg.llm_provider}")
@@ -7,6 +7,8 @@ from datetime import datetime, timezone
 
 import httpx
 
+from .fileio import atomic_write_bytes
+
 DATA_DIR = Path(__file__).parent
 CACHE_FILE = DATA_DIR / "market_cache.json"
 CACHE_TTL = 300  # 5 minutes
@@ -79,11 +81,11 @@ def get_markets(force_refresh: bool = False) -> list[dict]:
             pass
 
     markets = fetch_markets()
-    CACHE_FILE.write_text(json.dumps({
+    atomic_write_bytes(CACHE_FILE, json.dumps({
         "fetched_at": time.time(),
         "count": len(markets),
         "markets": markets,
-    }, indent=2))
+    }, separators=(",", ":")).encode())
     return markets
 
 
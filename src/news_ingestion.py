@@ -14,14 +14,17 @@ import json
 import random
 import re
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 
 import feedparser
 import httpx
 
 from .config import get_config
+from .fileio import atomic_write_bytes
 
 MAX_ITEMS = 100
+RSS_WORKERS = 8  # concurrent RSS feed fetches
 
 # === Tier 1: High-quality news sources ===
 RSS_FEEDS = {
@@ -128,26 +131,37 @@ def fetch_rss() -> list[dict]:
 
     all_feeds = {**primary_feeds, **sampled_extended}
 
-    for source, url in all_feeds.items():
-        try:
-            with httpx.Client(timeout=5, follow_redirects=True, headers={"User-Agent": "Mozilla/5.0"}) as client:
-                resp = client.get(url)
-                feed = feedparser.parse(resp.text)
-                for entry in feed.entries[:10]:
-                    title = entry.get("title", "")
-                    summary = entry.get("summary", entry.get("description", ""))[:500]
-                    published = entry.get("published", "")
-                    items.append({
-                        "id": _item_id(title, source),
-                        "source": source,
-                        "title": title,
-                        "summary": _strip_html(summary),
-                        "published": published,
-                        "fetched_at": datetime.now(timezone.utc).isoformat(),
-                        "url": entry.get("link", ""),
-                    })
-        except Exception as e:
-            print(f"  [warn] {source}: {e}")
+    # Feeds are independent and network-bound: fetch them side by side over
+    # one pooled client; map() keeps the per-feed order of the results.
+    with httpx.Client(timeout=5, follow_redirects=True, headers={"User-Agent": "Mozilla/5.0"},
+                      limits=httpx.Limits(max_connections=RSS_WORKERS)) as client:
+        with ThreadPoolExecutor(max_workers=RSS_WORKERS) as pool:
+            for feed_items in pool.map(lambda kv: _fetch_feed(client, *kv), all_feeds.items()):
+                items.extend(feed_items)
+    return items
+
+
+def _fetch_feed(client: httpx.Client, source: str, url: str) -> list[dict]:
+    """Fetch and parse one RSS feed; failures are logged and yield no items."""
+    items = []
+    try:
+        resp = client.get(url)
+        feed = feedparser.parse(resp.text)
+        for entry in feed.entries[:10]:
+            title = entry.get("title", "")
+            summary = entry.get("summary", entry.get("description", ""))[:500]
+            published = entry.get("published", "")
+            items.append({
+                "id": _item_id(title, source),
+                "source": source,
+                "title": title,
+                "summary": _strip_html(summary),
+                "published": published,
+                "fetched_at": datetime.now(timezone.utc).isoformat(),
+                "url": entry.get("link", ""),
+            })
+    except Exception as e:
+        print(f"  [warn] {source}: {e}")
     return items
 
 
@@ -306,8 +320,11 @@ def ingest() -> list[dict]:
             new_items.append(item)
             seen_ids.add(item["id"])
 
+    if not new_items and news_file.exists():
+        return new_items  # feed unchanged — leave the file (and its mtime) alone
+
     combined = (new_items + existing)[:MAX_ITEMS]
-    news_file.write_text(json.dumps(combined, indent=2))
+    atomic_write_bytes(news_file, json.dumps(combined, separators=(",", ":")).encode())
     return new_items
 
 
@@ -12,7 +12,7 @@ from rich.table import Table
 from rich import box
 
 from .config import get_config
-from .db import get_positions, upsert_position, insert_trade, get_trades
+from .db import get_positions, upsert_position, upsert_positions_many, insert_trade, get_trades
 
 console = Console()
 
@@ -103,8 +103,7 @@ def _load_positions() -> list[Position]:
 
 
 def _save_positions(positions: list[Position]):
-    for p in positions:
-        upsert_position(p.to_db_dict())
+    upsert_positions_many([p.to_db_dict() for p in positions])
 
 
 def _append_history(position: Position):
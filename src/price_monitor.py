@@ -5,6 +5,7 @@ import hashlib
 from datetime import datetime, timezone
 
 from .config import get_config
+from .fileio import atomic_write_bytes
 
 # Thresholds
 JUMP_THRESHOLD_5MIN = 0.05    # 5% move in 5 min = anomaly
@@ -37,7 +38,7 @@ def save_price_history(history: dict):
     trimmed = {}
     for mid, entries in history.items():
         trimmed[mid] = entries[-100:]
-    config.price_history_file.write_text(json.dumps(trimmed))
+    atomic_write_bytes(config.price_history_file, json.dumps(trimmed).encode())
 
 
 def record_and_detect(markets: list[dict]) -> list[dict]:
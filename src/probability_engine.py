@@ -291,7 +291,7 @@ def aggregate_signals(
     return round(estimated, 4), round(confidence, 4)
 
 
-def compute_estimates(signals, markets_by_id: dict) -> list[ProbEstimate]:
+def compute_estimates(signals) -> list[ProbEstimate]:
     """Aggregate ALL news signals per market, then compute probability."""
     # Group signals by market
     market_signals: dict[str, dict] = {}  # market_id -> {market_info, signal_data: [...]}
@@ -5,6 +5,8 @@ import os
 import time
 from datetime import datetime, timezone
 
+from .fileio import atomic_write_bytes
+
 SUBREDDITS = ["wallstreetbets", "politics", "cryptocurrency", "worldnews", "sports"]
 STATE_FILE = os.path.join(os.path.dirname(__file__), "reddit_state.json")
 HEADERS = {"User-Agent": "PolymarketBot/1.0"}
@@ -22,8 +24,7 @@ def _load_state(state_file):
 
 def _save_state(state, state_file):
     state["seen_ids"] = state.get("seen_ids", [])[-500:]
-    with open(state_file, "w") as f:
-        json.dump(state, f)
+    atomic_write_bytes(state_file, json.dumps(state).encode())
 
 
 def _calc_importance(score: int, comments: int) -> int:
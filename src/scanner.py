@@ -1,19 +1,22 @@
 #!/usr/bin/env python3
 """Polyclaw — main orchestrator."""
 
-import json
 import os
 import sys
+import importlib
 import time
 import signal
 import argparse
 import traceback
 import fcntl
+import heapq
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-from dataclasses import asdict
 
-from rich.console import Console
+import orjson
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich import box
@@ -26,17 +29,25 @@ from .edge_calculator import find_edges, TradeSignal
 from .position_manager import open_position, check_exits, display_positions, _fetch_market_price
 from .price_monitor import record_and_detect
 from .strategy_arena import run_arena, check_arena_exits
-from .config import get_config
+from .config import get_config, load_env
 from .db import (
-    insert_signal, get_cooldown, set_cooldown, prune_cooldowns,
-    get_all_cooldowns, add_notification, get_portfolio_summary,
+    insert_signals_many, get_cooldown_ages, set_cooldowns, prune_cooldowns,
+    get_all_cooldowns, add_notification, get_portfolio_summary, transaction,
 )
+from .fileio import atomic_write_bytes
 
 console = Console()
 
 # Module-level start time — set once when monitor starts
 _started_at = None
 
+# Parsed news feed, reused while the file's (path, mtime, size) is unchanged
+_NEWS_CACHE = {"key": None, "data": []}
+
+# Cooldown rows expire after 24h; sweeping them hourly is plenty
+COOLDOWN_PRUNE_INTERVAL = 3600
+_last_cooldown_prune = 0.0
+
 
 def _write_status(data_dir: Path, consecutive_errors: int, status: str = "running"):
     """Write status.json for orchestrator health monitoring."""
@@ -53,15 +64,31 @@ def _write_status(data_dir: Path, consecutive_errors: int, status: str = "runnin
             "today_pnl": round(get_daily_pnl(mode="paper"), 2),
         }
         data_dir.mkdir(parents=True, exist_ok=True)
-        (data_dir / "status.json").write_text(json.dumps(status_data, indent=2))
+        atomic_write_bytes(data_dir / "status.json", orjson.dumps(status_data, option=orjson.OPT_INDENT_2))
     except Exception:
         pass  # Status file write failure must not affect main loop
 
 
-def _log_dedup(sig, age_hours: float):
-    """Log a signal filtered by cooldown dedup — stored in signals table."""
-    insert_signal({
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+def _load_news_feed(news_file: Path) -> list[dict]:
+    """Return the parsed news feed, re-reading it only when the file changed.
+
+    The list is shared between scans — build new lists instead of mutating it.
+    """
+    try:
+        st = news_file.stat()
+    except FileNotFoundError:
+        return []
+    key = (str(news_file), st.st_mtime_ns, st.st_size)
+    if _NEWS_CACHE["key"] != key:
+        _NEWS_CACHE["data"] = orjson.loads(news_file.read_bytes())
+        _NEWS_CACHE["key"] = key
+    return _NEWS_CACHE["data"]
+
+
+def _dedup_row(sig, age_hours: float, timestamp: str) -> dict:
+    """Signals-table row for a signal filtered by cooldown dedup."""
+    return {
+        "timestamp": timestamp,
         "market_id": sig.market_id,
         "question": sig.question[:80],
         "direction": sig.direction,
@@ -77,148 +104,109 @@ def _log_dedup(sig, age_hours: float):
         "llm_reasoning": getattr(sig, "signals", {}).get("llm_reasoning", ""),
         "filter_reason": "cooldown_dedup",
         "cooldown_age_hours": round(age_hours, 2),
-    })
+    }
+
+
+# Extra news sources polled each scan: (label, module, fetch function, summary message)
+_NEWS_SOURCES = (
+    ("Twitter", ".twitter_source", "fetch_all", "🐦 {n} tweets fetched"),
+    ("EconCal", ".economic_calendar", "fetch_calendar", "📅 {n} upcoming economic events"),
+    ("VolMon", ".volume_monitor", "detect_volume_spikes", "🔊 {n} volume spikes detected!"),
+    ("Reddit", ".reddit_source", "fetch_reddit", "🔴 {n} Reddit posts fetched"),
+    ("Weather", ".weather_source", "fetch_weather", "🌡️ {n} weather updates"),
+    ("Sports odds", ".sports_odds", "fetch_sports_odds", "🏀 {n} sports odds fetched"),
+    ("GDELT", ".gdelt_source", "fetch_gdelt", "🌍 {n} GDELT articles"),
+    ("GDACS", ".gdacs_source", "fetch_gdacs", "🌋 {n} disaster alerts"),
+    ("ACLED", ".acled_source", "fetch_acled", "⚔️ {n} conflict events"),
+    ("EIA", ".eia_source", "fetch_eia", "🛢️ {n} energy data points"),
+    ("Telegram", ".telegram_source", "fetch_telegram", "📡 {n} Telegram messages"),
+)
+
+
+def _fetch_source(module: str, func: str) -> list[dict]:
+    """Import a news source lazily (optional deps stay optional) and fetch from it."""
+    return getattr(importlib.import_module(module, __package__), func)()
 
 
 def dedup_signals(signals: list) -> list:
     """Filter out signals that were already alerted within cooldown window."""
+    global _last_cooldown_prune
+    if not signals:
+        return []
+
     cfg = get_config()
     now = datetime.now(timezone.utc)
     fresh = []
-
-    for sig in signals:
-        key = f"{sig.market_id}::{sig.direction}"
-        last_alert = get_cooldown(key)
-        if last_alert:
-            try:
-                last_dt = datetime.fromisoformat(last_alert)
-                age_hours = (now - last_dt).total_seconds() / 3600
-                if age_hours < cfg.signal_cooldown_hours:
-                    _log_dedup(sig, age_hours)
-                    continue  # Still in cooldown
-            except Exception:
-                pass
+    fresh_keys = []
+    filtered_rows = []
+
+    now_iso = now.isoformat()
+    keys = [f"{sig.market_id}::{sig.direction}" for sig in signals]
+    ages = get_cooldown_ages(keys)
+    accepted = set()
+
+    for sig, key in zip(signals, keys):
+        age_hours = ages.get(key)
+        if age_hours is not None and age_hours < cfg.signal_cooldown_hours:
+            filtered_rows.append(_dedup_row(sig, age_hours, now_iso))
+            continue  # Still in cooldown
+        if key in accepted:
+            # Same market/direction already alerted in this batch — log it like a cooldown hit
+            filtered_rows.append(_dedup_row(sig, 0.0, now_iso))
+            continue
+        accepted.add(key)
         fresh.append(sig)
-        set_cooldown(key, now.isoformat())
+        fresh_keys.append(key)
+
+    insert_signals_many(filtered_rows)
 
-    # Prune cooldowns older than 24h
-    cutoff = now.timestamp() - 86400
-    prune_cooldowns(cutoff)
+    # One upsert batch per scan instead of a commit per alerted signal
+    set_cooldowns(fresh_keys, now_iso)
+
+    # Prune cooldowns older than 24h (at most once per interval)
+    now_ts = now.timestamp()
+    if now_ts - _last_cooldown_prune >= COOLDOWN_PRUNE_INTERVAL:
+        prune_cooldowns(now_ts - 86400)
+        _last_cooldown_prune = now_ts
 
     # Rate limit: max N per hour
     if len(fresh) > cfg.max_alerts_per_hour:
-        fresh = sorted(fresh, key=lambda s: abs(s.edge), reverse=True)[:cfg.max_alerts_per_hour]
+        fresh = heapq.nlargest(cfg.max_alerts_per_hour, fresh, key=lambda s: abs(s.edge))
 
     return fresh
 
 
 def run_scan(min_edge: float = 0.03, bankroll: float = 1000.0, use_llm: bool = False, llm_only: bool = False) -> list[TradeSignal]:
     """Execute a single scan cycle."""
-    # 1. Ingest news (RSS + Twitter)
+    # 1. Ingest news (RSS + extra sources). Every source is an independent,
+    # network-bound fetch, so they all run side by side; results are reported
+    # in the fixed _NEWS_SOURCES order regardless of which finishes first.
     console.print("\n[bold cyan]📰 Fetching news feeds...[/bold cyan]")
-    new_items = ingest()
-    # Twitter/X via RapidAPI
-    try:
-        from .twitter_source import fetch_all as fetch_tweets
-        tweets = fetch_tweets()
-        if tweets:
-            new_items.extend(tweets)
-            console.print(f"  🐦 {len(tweets)} tweets fetched")
-    except Exception as e:
-        console.print(f"  [dim]Twitter: {e}[/dim]")
-    # Economic calendar
-    try:
-        from .economic_calendar import fetch_calendar
-        econ = fetch_calendar()
-        if econ:
-            new_items.extend(econ)
-            console.print(f"  📅 {len(econ)} upcoming economic events")
-    except Exception as e:
-        console.print(f"  [dim]EconCal: {e}[/dim]")
-    # Polymarket volume spikes
-    try:
-        from .volume_monitor import detect_volume_spikes
-        spikes = detect_volume_spikes()
-        if spikes:
-            new_items.extend(spikes)
-            console.print(f"  🔊 {len(spikes)} volume spikes detected!")
-    except Exception as e:
-        console.print(f"  [dim]VolMon: {e}[/dim]")
-    # Reddit
-    try:
-        from .reddit_source import fetch_reddit
-        reddit_items = fetch_reddit()
-        if reddit_items:
-            new_items.extend(reddit_items)
-            console.print(f"  🔴 {len(reddit_items)} Reddit posts fetched")
-    except Exception as e:
-        console.print(f"  [dim]Reddit: {e}[/dim]")
-    # Weather
-    try:
-        from .weather_source import fetch_weather
-        weather_items = fetch_weather()
-        if weather_items:
-            new_items.extend(weather_items)
-            console.print(f"  🌡️ {len(weather_items)} weather updates")
-    except Exception as e:
-        console.print(f"  [dim]Weather: {e}[/dim]")
-    # Sports Odds
-    try:
-        from .sports_odds import fetch_sports_odds
-        odds_items = fetch_sports_odds()
-        if odds_items:
-            new_items.extend(odds_items)
-            console.print(f"  🏀 {len(odds_items)} sports odds fetched")
-    except Exception as e:
-        console.print(f"  [dim]Sports odds: {e}[/dim]")
-    # GDELT global news
+    # Shut the pool down without waiting: a scan-timeout SIGALRM raised while
+    # blocked on a result must not then hang on the remaining fetches.
+    pool = ThreadPoolExecutor(max_workers=len(_NEWS_SOURCES) + 1)
     try:
-        from .gdelt_source import fetch_gdelt
-        gdelt_items = fetch_gdelt()
-        if gdelt_items:
-            new_items.extend(gdelt_items)
-            console.print(f"  🌍 {len(gdelt_items)} GDELT articles")
-    except Exception as e:
-        console.print(f"  [dim]GDELT: {e}[/dim]")
-    # GDACS disaster alerts
-    try:
-        from .gdacs_source import fetch_gdacs
-        gdacs_items = fetch_gdacs()
-        if gdacs_items:
-            new_items.extend(gdacs_items)
-            console.print(f"  🌋 {len(gdacs_items)} disaster alerts")
-    except Exception as e:
-        console.print(f"  [dim]GDACS: {e}[/dim]")
-    # ACLED conflict data
-    try:
-        from .acled_source import fetch_acled
-        acled_items = fetch_acled()
-        if acled_items:
-            new_items.extend(acled_items)
-            console.print(f"  ⚔️ {len(acled_items)} conflict events")
-    except Exception as e:
-        console.print(f"  [dim]ACLED: {e}[/dim]")
-    # EIA energy data
-    try:
-        from .eia_source import fetch_eia
-        eia_items = fetch_eia()
-        if eia_items:
-            new_items.extend(eia_items)
-            console.print(f"  🛢️ {len(eia_items)} energy data points")
-    except Exception as e:
-        console.print(f"  [dim]EIA: {e}[/dim]")
-    # Telegram OSINT channels
-    try:
-        from .telegram_source import fetch_telegram
-        tg_items = fetch_telegram()
-        if tg_items:
-            new_items.extend(tg_items)
-            console.print(f"  📡 {len(tg_items)} Telegram messages")
-    except Exception as e:
-        console.print(f"  [dim]Telegram: {e}[/dim]")
-    news_file = Path(__file__).parent / "news_feed.json"
-    all_news = json.loads(news_file.read_text()) if news_file.exists() else []
-    console.print(f"  {len(new_items)} new items, {len(all_news)} total in cache")
+        ingest_future = pool.submit(ingest)
+        source_futures = [
+            (label, message, pool.submit(_fetch_source, module, func))
+            for label, module, func, message in _NEWS_SOURCES
+        ]
+        new_items = ingest_future.result()
+        report = []
+        for label, message, future in source_futures:
+            try:
+                items = future.result()
+            except Exception as e:
+                report.append(f"  [dim]{label}: {e}[/dim]")
+                continue
+            if items:
+                new_items.extend(items)
+                report.append(f"  {message.format(n=len(items))}")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    all_news = _load_news_feed(get_config().news_cache_file)
+    report.append(f"  {len(new_items)} new items, {len(all_news)} total in cache")
+    console.print(Group(*report))
 
     # 2. Fetch markets
     console.print("[bold cyan]📊 Loading Polymarket markets...[/bold cyan]")
@@ -250,8 +238,7 @@ def run_scan(min_edge: float = 0.03, bankroll: float = 1000.0, use_llm: bool = F
 
     # 4. Compute probabilities (aggregated per market)
     console.print("[bold cyan]🧮 Computing probability estimates...[/bold cyan]")
-    markets_by_id = {m["id"]: m for m in markets}
-    estimates = compute_estimates(signals, markets_by_id) if signals else []
+    estimates = compute_estimates(signals) if signals else []
     console.print(f"  {len(estimates)} keyword estimates generated")
 
     # 4b. LLM analysis
@@ -266,7 +253,10 @@ def run_scan(min_edge: float = 0.03, bankroll: float = 1000.0, use_llm: bool = F
             console.print("  [dim]🤖 LLM skipped (no keyword matches, no breaking news)[/dim]")
         else:
             console.print("[bold magenta]🤖 Running LLM analysis...[/bold magenta]")
-            llm_signals = parse_with_llm(all_news, markets)
+            cfg = get_config()
+            llm_signals = parse_with_llm(all_news, markets,
+                                         row_batch=cfg.llm_row_batch,
+                                         parallelism=cfg.llm_parallelism)
             console.print(f"  {len(llm_signals)} LLM signals found")
             if llm_signals:
                 for s in llm_signals[:5]:
@@ -290,7 +280,9 @@ def run_scan(min_edge: float = 0.03, bankroll: float = 1000.0, use_llm: bool = F
 
     save_signals(fresh_signals)
 
-    # Position management — only open positions for fresh signals
+    # Position management — only open positions for fresh signals.
+    # Kept sequential on purpose: open_position is a local check-then-insert
+    # against max_positions / exposure limits, so parallel opens would race.
     for sig in fresh_signals:
         # Prefer LLM reasoning over keyword-matched news title
         llm_reasoning = sig.signals.get("llm_reasoning", "")
@@ -356,9 +348,8 @@ def run_scan(min_edge: float = 0.03, bankroll: float = 1000.0, use_llm: bool = F
         arena_closed = check_arena_exits(_fetch_market_price, bankroll)
 
         # Count open arena positions from db
-        from .db import get_positions as db_get_positions
-        arena_positions = db_get_positions(mode="arena", status="open")
-        arena_opens = len(arena_positions)
+        from .db import count_positions
+        arena_opens = count_positions(mode="arena", status="open")
         console.print(f"  Arena: {arena_opens} open positions, closed {arena_closed} this cycle")
     except Exception as e:
         console.print(f"  [dim red]Arena error: {e}[/dim red]")
@@ -368,23 +359,27 @@ def run_scan(min_edge: float = 0.03, bankroll: float = 1000.0, use_llm: bool = F
     return trade_signals
 
 
+# Edge colour bands: below 3% white, 3–5% yellow, 5–8% green, 8%+ bold green
+_EDGE_THRESHOLDS = (0.03, 0.05, 0.08)
+_EDGE_COLORS = ("white", "yellow", "green", "bold green")
+_RELIABILITY_ICONS = {"high": "🟢", "medium": "🟡", "low": "🔴"}
+
+
 def edge_color(edge: float) -> str:
-    if edge >= 0.08:
-        return "bold green"
-    elif edge >= 0.05:
-        return "green"
-    elif edge >= 0.03:
-        return "yellow"
-    return "white"
+    return _EDGE_COLORS[bisect_right(_EDGE_THRESHOLDS, edge)]
 
 
 def reliability_icon(r: str) -> str:
-    return {"high": "🟢", "medium": "🟡", "low": "🔴"}.get(r, "⚪")
+    return _RELIABILITY_ICONS.get(r, "⚪")
 
 
 def display_results(trade_signals: list[TradeSignal], estimates, news, markets):
-    """Display scan results grouped by market with color coding."""
-    console.print()
+    """Display scan results grouped by market with color coding.
+
+    Renderables are collected and printed as one Group, so the whole
+    section is a single console write.
+    """
+    out = [""]
 
     summary = (
         f"📰 News: {len(news)}  |  "
@@ -392,11 +387,11 @@ def display_results(trade_signals: list[TradeSignal], estimates, news, markets):
         f"🧮 Estimates: {len(estimates)}  |  "
         f"⚡ Signals: {len(trade_signals)}"
     )
-    console.print(Panel(summary, title="[bold]Scan Summary[/bold]", border_style="green"))
+    out.append(Panel(summary, title="[bold]Scan Summary[/bold]", border_style="green"))
 
     if not trade_signals:
-        console.print("\n[yellow]No actionable edges found after fee adjustment.[/yellow]")
-        console.print("[dim]This is expected — real edges are rare in liquid markets.[/dim]\n")
+        out.append("\n[yellow]No actionable edges found after fee adjustment.[/yellow]")
+        out.append("[dim]This is expected — real edges are rare in liquid markets.[/dim]\n")
 
         if estimates:
             table = Table(title="Top Estimates (no edge after fees)", box=box.SIMPLE)
@@ -407,7 +402,7 @@ def display_results(trade_signals: list[TradeSignal], estimates, news, markets):
             table.add_column("#News", justify="right")
             table.add_column("Trigger", max_width=40)
 
-            for est in sorted(estimates, key=lambda e: abs(e.ai_probability - e.current_price), reverse=True)[:8]:
+            for est in heapq.nlargest(8, estimates, key=lambda e: abs(e.ai_probability - e.current_price)):
                 diff = est.ai_probability - est.current_price
                 dc = "green" if diff > 0 else "red" if diff < 0 else "white"
                 titles = est.signals.get("news_titles", [])
@@ -420,7 +415,8 @@ def display_results(trade_signals: list[TradeSignal], estimates, news, markets):
                     str(est.signals.get("n_signals", 0)),
                     trigger,
                 )
-            console.print(table)
+            out.append(table)
+        console.print(Group(*out))
         return
 
     # Trade signals table — grouped, color-coded
@@ -456,45 +452,55 @@ def display_results(trade_signals: list[TradeSignal], estimates, news, markets):
             f"${sig.position_size:.0f}",
             trigger,
         )
-    console.print(table)
+    out.append(table)
+    console.print(Group(*out))
 
 
 def save_signals(trade_signals: list[TradeSignal]):
     """Save signals to db and write ALERT.json for external cron."""
     now = datetime.now(timezone.utc).isoformat()
 
+    # Read fields straight off the dataclass; asdict() would deep-copy
+    # the whole signals dict just to pick two keys out of it
+    rows = []
     for sig in trade_signals:
-        d = asdict(sig)
-        insert_signal({
+        extra = sig.signals or {}
+        rows.append({
             "timestamp": now,
-            "market_id": d.get("market_id"),
-            "question": d.get("question"),
-            "direction": d.get("direction"),
-            "current_price": d.get("current_price"),
-            "ai_probability": d.get("ai_probability"),
-            "edge": d.get("edge"),
-            "raw_edge": d.get("raw_edge"),
-            "fee_estimate": d.get("fee_estimate"),
-            "confidence": d.get("confidence"),
-            "position_size": d.get("position_size"),
-            "reliability": d.get("reliability"),
-            "news_titles": d.get("signals", {}).get("news_titles", []),
-            "llm_reasoning": d.get("signals", {}).get("llm_reasoning", ""),
+            "market_id": sig.market_id,
+            "question": sig.question,
+            "direction": sig.direction,
+            "current_price": sig.current_price,
+            "ai_probability": sig.ai_probability,
+            "edge": sig.edge,
+            "raw_edge": sig.raw_edge,
+            "fee_estimate": sig.fee_estimate,
+            "confidence": sig.confidence,
+            "position_size": sig.position_size,
+            "reliability": sig.reliability,
+            "news_titles": extra.get("news_titles", []),
+            "llm_reasoning": extra.get("llm_reasoning", ""),
             "filter_reason": None,
             "cooldown_age_hours": None,
         })
 
-        # Notify OpenClaw about detected signal
-        try:
-            add_notification(
-                f"[Signal] {sig.question[:60]} | "
-                f"{sig.direction} | edge={sig.edge:+.1%} | "
-                f"AI={sig.ai_probability:.0%} vs Mkt={sig.current_price:.0%} | "
-                f"${sig.position_size:.0f} ({sig.reliability})",
-                "SIGNAL_DETECTED",
-            )
-        except Exception:
-            pass
+    # One commit for the whole batch of signal rows + notifications
+    with transaction():
+        insert_signals_many(rows, commit=False)
+
+        # Notify OpenClaw about detected signals
+        for sig in trade_signals:
+            try:
+                add_notification(
+                    f"[Signal] {sig.question[:60]} | "
+                    f"{sig.direction} | edge={sig.edge:+.1%} | "
+                    f"AI={sig.ai_probability:.0%} vs Mkt={sig.current_price:.0%} | "
+                    f"${sig.position_size:.0f} ({sig.reliability})",
+                    "SIGNAL_DETECTED",
+                    commit=False,
+                )
+            except Exception:
+                pass
 
     # Write alert file when signals found — cron job picks this up (keep as JSON)
     alert_file = Path(__file__).parent / "ALERT.json"
@@ -513,7 +519,7 @@ def save_signals(trade_signals: list[TradeSignal]):
                 for s in trade_signals[:5]
             ],
         }
-        alert_file.write_text(json.dumps(alert, indent=2, ensure_ascii=False))
+        atomic_write_bytes(alert_file, orjson.dumps(alert, option=orjson.OPT_INDENT_2))
     elif alert_file.exists():
         alert_file.unlink()
 
@@ -529,6 +535,7 @@ def main():
     parser.add_argument("--llm-only", action="store_true", help="Use only LLM analysis (skip keyword matching)")
     parser.add_argument("--positions", action="store_true", help="Show current positions and exit")
     args = parser.parse_args()
+    load_env()  # .env is no longer applied at import; load it before anything reads os.environ
 
     if args.positions:
         display_positions(args.bankroll)
@@ -569,8 +576,12 @@ def main():
         pid_file = data_dir / "scanner.pid"
         pid_file.write_text(str(os.getpid()))
 
-        # Heartbeat file
+        # Heartbeat file — kept open for the life of the monitor so each beat
+        # is a single pwrite rather than open/write/close. Beats are fixed width
+        # (timespec="microseconds"), so each one overwrites the last completely
+        # and a reader never sees a stale tail.
         heartbeat_file = data_dir / "scanner_heartbeat"
+        heartbeat_fd = os.open(heartbeat_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
 
         # ── SIGTERM handler for graceful shutdown ──
         _shutdown_requested = False
@@ -585,21 +596,30 @@ def main():
         # Portfolio summary timer — notify every 30 minutes
         _last_summary_time = 0.0
 
-        try:
-            while True:
-                try:
-                    heartbeat_file.write_text(datetime.now(timezone.utc).isoformat())
+        # Scan watchdog — handler installed once; each cycle only arms and
+        # disarms the alarm (SIGALRM is POSIX-only)
+        scan_timeout = max(args.interval * 3, 180)
+        has_alarm = hasattr(signal, "SIGALRM")
 
-                    scan_timeout = max(args.interval * 3, 180)
-                    def _timeout_handler(signum, frame):
-                        raise TimeoutError(f"Scan exceeded {scan_timeout}s timeout")
-                    old_handler = signal.signal(signal.SIGALRM, _timeout_handler)
-                    signal.alarm(scan_timeout)
+        def _timeout_handler(signum, frame):
+            raise TimeoutError(f"Scan exceeded {scan_timeout}s timeout")
 
-                    run_scan(min_edge=args.min_edge, bankroll=args.bankroll, use_llm=args.use_llm, llm_only=args.llm_only)
+        if has_alarm:
+            signal.signal(signal.SIGALRM, _timeout_handler)
 
-                    signal.alarm(0)
-                    signal.signal(signal.SIGALRM, old_handler)
+        try:
+            while True:
+                try:
+                    beat = datetime.now(timezone.utc).isoformat(timespec="microseconds").encode()
+                    os.pwrite(heartbeat_fd, beat, 0)
+
+                    if has_alarm:
+                        signal.alarm(scan_timeout)
+                    try:
+                        run_scan(min_edge=args.min_edge, bankroll=args.bankroll, use_llm=args.use_llm, llm_only=args.llm_only)
+                    finally:
+                        if has_alarm:
+                            signal.alarm(0)
                     consecutive_errors = 0
 
                     _write_status(data_dir, consecutive_errors, status="running")
@@ -626,7 +646,6 @@ def main():
                 except TimeoutError as e:
                     consecutive_errors += 1
                     console.print(f"\n[red]⏰ Scan timeout: {e}[/red] ({consecutive_errors}/{max_consecutive_errors})")
-                    signal.alarm(0)
                 except Exception as e:
                     consecutive_errors += 1
                     console.print(f"\n[red]Scan error ({consecutive_errors}/{max_consecutive_errors}): {e}[/red]")
@@ -647,6 +666,7 @@ def main():
             console.print("\n[yellow]Stopped.[/yellow]")
         finally:
             _write_status(data_dir, consecutive_errors, status="stopped")
+            os.close(heartbeat_fd)
             pid_file.unlink(missing_ok=True)
     else:
         run_scan(min_edge=args.min_edge, bankroll=args.bankroll, use_llm=args.use_llm, llm_only=args.llm_only)
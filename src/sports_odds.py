@@ -5,6 +5,9 @@ import os
 import time
 from datetime import datetime, timezone
 
+from .config import load_env
+from .fileio import atomic_write_bytes
+
 SPORTS = [
     "americanfootball_nfl",
     "basketball_nba",
@@ -33,8 +36,7 @@ def _load_state(state_file):
 
 def _save_state(state, state_file):
     state["seen_ids"] = state.get("seen_ids", [])[-200:]
-    with open(state_file, "w") as f:
-        json.dump(state, f)
+    atomic_write_bytes(state_file, json.dumps(state).encode())
 
 
 def _american_to_prob(odds: int) -> float:
@@ -47,6 +49,7 @@ def _american_to_prob(odds: int) -> float:
 
 def fetch_sports_odds(api_key: str | None = None, state_file: str = STATE_FILE) -> list[dict]:
     """Fetch sports odds. Requires ODDS_API_KEY env var or api_key param."""
+    load_env()  # ODDS_API_KEY may come from .env
     key = api_key or os.environ.get("ODDS_API_KEY", "")
     if not key:
         return []  # Skip silently if no key
@@ -9,6 +9,7 @@ import feedparser
 import httpx
 
 from .config import get_config
+from .fileio import atomic_write_bytes
 
 MIN_INTERVAL = 600  # 10 minutes
 MAX_PER_CHANNEL = 5
@@ -42,7 +43,7 @@ def _load_state():
 
 def _save_state(state):
     state["seen_ids"] = state.get("seen_ids", [])[-500:]
-    _state_file().write_text(json.dumps(state))
+    atomic_write_bytes(_state_file(), json.dumps(state).encode())
 
 
 def _strip_html(text: str) -> str:
@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 import httpx
 
 from .config import get_config
+from .fileio import atomic_write_bytes
 
 BASE_URL = "https://twitter-api45.p.rapidapi.com"
 
@@ -60,7 +61,7 @@ def _load_state():
 
 def _save_state(state):
     state["seen_ids"] = state.get("seen_ids", [])[-500:]
-    _get_state_file().write_text(json.dumps(state))
+    atomic_write_bytes(_get_state_file(), json.dumps(state).encode())
 
 
 def _get_headers():
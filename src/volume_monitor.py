@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 import httpx
 
 from .config import get_config
+from .fileio import atomic_write_bytes
 
 GAMMA_API = "https://gamma-api.polymarket.com"
 
@@ -34,7 +35,7 @@ def _load_state():
 def _save_state(state):
     now = time.time()
     state["alerted"] = {k: v for k, v in state.get("alerted", {}).items() if now - v < 86400}
-    _get_state_file().write_text(json.dumps(state))
+    atomic_write_bytes(_get_state_file(), json.dumps(state).encode())
 
 
 def detect_volume_spikes(top_n: int = 50) -> list[dict]:
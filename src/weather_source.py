@@ -5,6 +5,8 @@ import os
 import time
 from datetime import datetime, timezone
 
+from .fileio import atomic_write_bytes
+
 CITIES = {
     "NYC": (40.71, -74.01),
     "LA": (34.05, -118.24),
@@ -35,8 +37,7 @@ def _load_state(state_file):
 
 
 def _save_state(state, state_file):
-    with open(state_file, "w") as f:
-        json.dump(state, f)
+    atomic_write_bytes(state_file, json.dumps(state).encode())
 
 
 def fetch_weather(state_file: str = STATE_FILE) -> list[dict]:
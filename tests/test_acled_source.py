@@ -1,4 +1,5 @@
 """Tests for acled_source.py — ACLED armed conflict data (OAuth auth)."""
+import hashlib
 import json
 import pytest
 from unittest.mock import patch, MagicMock
@@ -70,27 +71,28 @@ class TestFetchAcled:
 
         token_resp = MagicMock()
         token_resp.status_code = 200
-        token_resp.json.return_value = MOCK_TOKEN_RESPONSE
+        token_resp.content = json.dumps(MOCK_TOKEN_RESPONSE).encode()
 
         data_resp = MagicMock()
         data_resp.status_code = 200
-        data_resp.json.return_value = MOCK_ACLED_RESPONSE
+        data_resp.content = json.dumps(MOCK_ACLED_RESPONSE).encode()
 
         def route(url_or_method, *args, **kwargs):
-            # httpx.post for token, httpx.get for data
+            # _CLIENT.post for token, _CLIENT.get for data
             if "oauth/token" in str(url_or_method):
                 return token_resp
             return data_resp
 
-        with patch("src.acled_source.httpx.post", return_value=token_resp), \
-             patch("src.acled_source.httpx.get", return_value=data_resp):
+        with patch("src.acled_source._CLIENT.post", return_value=token_resp), \
+             patch("src.acled_source._CLIENT.get", return_value=data_resp):
             items = fetch_acled()
 
         assert len(items) == 2
         # First item should be highest fatalities (sorted)
         assert "15 fatalities" in items[0]["title"]
         assert items[0]["source"] == "acled"
-        assert items[0]["id"].startswith("acled-")
+        # Same id derivation as earlier releases, so stored items aren't re-ingested
+        assert items[0]["id"] == "acled-" + hashlib.sha256(b"EVT001").hexdigest()[:16]
 
     def test_importance_based_on_fatalities(self, mock_config):
         mock_config.acled_email = "test@example.com"
@@ -98,14 +100,14 @@ class TestFetchAcled:
 
         token_resp = MagicMock()
         token_resp.status_code = 200
-        token_resp.json.return_value = MOCK_TOKEN_RESPONSE
+        token_resp.content = json.dumps(MOCK_TOKEN_RESPONSE).encode()
 
         data_resp = MagicMock()
         data_resp.status_code = 200
-        data_resp.json.return_value = MOCK_ACLED_RESPONSE
+        data_resp.content = json.dumps(MOCK_ACLED_RESPONSE).encode()
 
-        with patch("src.acled_source.httpx.post", return_value=token_resp), \
-             patch("src.acled_source.httpx.get", return_value=data_resp):
+        with patch("src.acled_source._CLIENT.post", return_value=token_resp), \
+             patch("src.acled_source._CLIENT.get", return_value=data_resp):
             items = fetch_acled()
 
         # 15 fatalities → importance 4
@@ -119,29 +121,50 @@ class TestFetchAcled:
 
         token_resp = MagicMock()
         token_resp.status_code = 200
-        token_resp.json.return_value = MOCK_TOKEN_RESPONSE
+        token_resp.content = json.dumps(MOCK_TOKEN_RESPONSE).encode()
 
         data_resp = MagicMock()
         data_resp.status_code = 200
-        data_resp.json.return_value = MOCK_ACLED_RESPONSE
+        data_resp.content = json.dumps(MOCK_ACLED_RESPONSE).encode()
 
-        with patch("src.acled_source.httpx.post", return_value=token_resp), \
-             patch("src.acled_source.httpx.get", return_value=data_resp):
+        with patch("src.acled_source._CLIENT.post", return_value=token_resp), \
+             patch("src.acled_source._CLIENT.get", return_value=data_resp):
             first = fetch_acled()
             second = fetch_acled()
 
         assert len(first) > 0
         assert second == []
 
+    def test_state_stays_in_memory_between_calls(self, mock_config):
+        """After the first fetch, throttled calls don't re-read the state file."""
+        mock_config.acled_email = "test@example.com"
+        mock_config.acled_password = "testpass"
+
+        token_resp = MagicMock()
+        token_resp.status_code = 200
+        token_resp.content = json.dumps(MOCK_TOKEN_RESPONSE).encode()
+
+        data_resp = MagicMock()
+        data_resp.status_code = 200
+        data_resp.content = json.dumps(MOCK_ACLED_RESPONSE).encode()
+
+        with patch("src.acled_source._CLIENT.post", return_value=token_resp), \
+             patch("src.acled_source._CLIENT.get", return_value=data_resp):
+            fetch_acled()
+
+        with patch("src.acled_source.orjson.loads") as mock_loads:
+            assert fetch_acled() == []
+        mock_loads.assert_not_called()
+
     def test_handles_token_failure(self, mock_config):
         mock_config.acled_email = "test@example.com"
         mock_config.acled_password = "badpass"
 
         token_resp = MagicMock()
         token_resp.status_code = 401
-        token_resp.json.return_value = {"error": "invalid_grant"}
+        token_resp.content = b'{"error": "invalid_grant"}'
 
-        with patch("src.acled_source.httpx.post", return_value=token_resp):
+        with patch("src.acled_source._CLIENT.post", return_value=token_resp):
             items = fetch_acled()
 
         assert items == []
@@ -105,7 +105,7 @@ def test_yaml_override_new_fields(tmp_path, monkeypatch):
 
 
 def test_yaml_allowed_whitelist(tmp_path, monkeypatch):
-    """Keys NOT in YAML_ALLOWED are silently ignored."""
+    """Keys NOT in _YAML_ALLOWED are silently ignored."""
     config_yaml = tmp_path / "config.yaml"
     config_yaml.write_text(
         "tp_ratio: 0.80\n"
@@ -187,3 +187,136 @@ def test_llm_provider_from_yaml(tmp_path, monkeypatch):
     cfg = load_config(config_path=config_yaml)
 
     assert cfg.llm_provider == "gemini"
+
+
+
+def test_load_config_memoized_until_file_or_env_changes(tmp_path, monkeypatch):
+    """Repeated load_config skips re-parsing until yaml or env changes."""
+    config_yaml = tmp_path / "config.yaml"
+    config_yaml.write_text("tp_ratio: 0.70\n")
+    monkeypatch.setenv("POLYMARKET_PRIVATE_KEY", "0x" + "b" * 64)
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / "data"))
+
+    first = load_config(config_path=config_yaml)
+    hits = config_module._build_config.cache_info().hits
+    assert load_config(config_path=config_yaml) == first
+    assert config_module._build_config.cache_info().hits == hits + 1
+
+    config_yaml.write_text("tp_ratio: 0.80\n")
+    second = load_config(config_path=config_yaml)
+    assert config_module._build_config.cache_info().hits == hits + 1
+    assert second.tp_ratio == 0.80
+
+    monkeypatch.setenv("LLM_API_KEY", "sk-new")
+    third = load_config(config_path=config_yaml)
+    assert config_module._build_config.cache_info().hits == hits + 1
+    assert third.llm_api_key == "sk-new"
+
+
+def test_load_config_memo_hit_returns_independent_copy(tmp_path, monkeypatch):
+    """Mutating one loaded Config doesn't leak into the next, and dirs are recreated."""
+    config_yaml = tmp_path / "config.yaml"
+    config_yaml.write_text("tp_ratio: 0.70\n")
+    monkeypatch.setenv("POLYMARKET_PRIVATE_KEY", "0x" + "b" * 64)
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / "data"))
+
+    first = load_config(config_path=config_yaml)
+    first.tp_ratio = 0.99
+    first.active_strategies.append("momentum")
+    first.strategy_overrides.setdefault("baseline", {})["min_edge"] = 0.5
+    (tmp_path / "data" / "arena").rmdir()
+
+    second = load_config(config_path=config_yaml)
+    assert second is not first
+    assert second.tp_ratio == 0.70
+    assert second.active_strategies == ["baseline"]
+    assert second.strategy_overrides == {}
+    assert second.arena_dir.is_dir()
+
+
+def test_load_env_reads_dotenv_once(monkeypatch):
+    """.env is loaded on the first load_env() call only, not at import."""
+    import dotenv
+    calls = []
+    monkeypatch.setattr(dotenv, "load_dotenv", lambda *a, **k: calls.append(1))
+    monkeypatch.setattr(config_module, "_env_loaded", False)
+
+    config_module.load_env()
+    config_module.load_env()
+
+    assert calls == [1]
+
+
+def test_validate_reports_field_rules(tmp_path):
+    """validate() collects one message per violated constraint."""
+    assert make_config(tmp_path).validate() == []
+
+    cfg = make_config(tmp_path, bankroll=0, min_edge=1.5, llm_row_batch=16, llm_parallelism=0)
+    errors = cfg.validate()
+
+    assert "bankroll must be positive" in errors
+    assert "min_edge must be between 0 and 1" in errors
+    assert "llm_row_batch must be between 1 and 15" in errors
+    assert "llm_parallelism must be at least 1" in errors
+    assert len(errors) == 4
+
+
+def test_save_config_round_trips_through_yaml(tmp_path):
+    """save_config's hand-written YAML parses back to the same values."""
+    import yaml
+    from src.config import save_config
+
+    cfg = Config(
+        private_key="0x" + "a" * 64,
+        _config_dir=tmp_path,
+        data_dir=str(tmp_path / "data: #weird"),
+        max_positions=7,
+        min_edge=0.125,
+    )
+    out = tmp_path / "saved.yaml"
+    save_config(cfg, out)
+
+    data = yaml.safe_load(out.read_text())
+    assert data["strategy"] == cfg.strategy
+    assert data["data_dir"] == cfg.data_dir
+    assert data["max_positions"] == 7
+    assert data["min_edge"] == 0.125
+    assert "private_key" not in data
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("k1", ["k1"]),
+    ("  k1  ", ["k1"]),
+    ("   ", []),
+    ("k1, k2,,k3 ", ["k1", "k2", "k3"]),
+])
+def test_parse_twitter_keys(raw, expected):
+    assert config_module._parse_twitter_keys(raw) == expected
+
+
+@pytest.mark.parametrize("value", [
+    1e-05, 1e16, -2.5e-07, 0.125, 3.0, 7, True,
+    ".5", ".inf", ".NaN", "yes", "Null", "1e3", "a: b", "#x", "-x", "", "/tmp/data_dir", "news-edge",
+])
+def test_yaml_scalar_round_trips(value):
+    """Every value the fast path writes loads back unchanged with PyYAML."""
+    import yaml
+    text = config_module._yaml_scalar(value)
+    assert text is not None
+    loaded = yaml.safe_load(f"k: {text}\n")["k"]
+    assert loaded == value and type(loaded) is type(value)
+
+
+def test_save_config_exponent_float_round_trips(tmp_path):
+    """Tiny/huge floats survive save_config as floats, not strings."""
+    import yaml
+    from src.config import save_config
+
+    cfg = Config(private_key="0x" + "a" * 64, _config_dir=tmp_path,
+                 data_dir=str(tmp_path / "data"), min_edge=1e-05, daily_loss_limit=1e16)
+    out = tmp_path / "saved.yaml"
+    save_config(cfg, out)
+
+    data = yaml.safe_load(out.read_text())
+    assert data["min_edge"] == 1e-05 and isinstance(data["min_edge"], float)
+    assert data["daily_loss_limit"] == 1e16 and isinstance(data["daily_loss_limit"], float)
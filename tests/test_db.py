@@ -0,0 +1,261 @@
+"""Tests for db.py — transactions and batched writes."""
+
+import pytest
+
+import src.db as db
+
+
+@pytest.fixture
+def fresh_db(mock_config):
+    """Point the thread-local connection at a new database under tmp_path."""
+    db._local.conn = db._local.read_conn = None
+    yield db.get_db()
+    for conn in (db._local.conn, db._local.read_conn):
+        if conn is not None:
+            conn.close()
+    db._local.conn = db._local.read_conn = None
+
+
+def _trade(pid: str, pnl: float = 1.0) -> dict:
+    return {"position_id": pid, "mode": "paper", "pnl": pnl}
+
+
+def test_transaction_commits_deferred_writes(fresh_db):
+    with db.transaction():
+        db.insert_trade(_trade("p1"), commit=False)
+        db.insert_trade(_trade("p2"), commit=False)
+        assert fresh_db.in_transaction
+
+    assert not fresh_db.in_transaction
+    assert len(db.get_trades(mode="paper")) == 2
+
+
+def test_transaction_rolls_back_on_error(fresh_db):
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.insert_trade(_trade("p1"), commit=False)
+            raise RuntimeError("boom")
+
+    assert db.get_trades(mode="paper") == []
+
+
+def test_insert_signals_many_serializes_lists(fresh_db):
+    db.insert_signals_many([
+        {"timestamp": "t1", "market_id": "m1", "news_titles": ["a", "b"]},
+        {"timestamp": "t2", "market_id": "m2", "news_titles": []},
+    ])
+
+    rows = {r["market_id"]: r for r in db.get_signals()}
+    assert set(rows) == {"m1", "m2"}
+    assert rows["m1"]["news_titles"] == '["a","b"]'
+
+
+def test_insert_trades_many_empty_is_noop(fresh_db):
+    db.insert_trades_many([])
+    assert db.get_trades(mode="paper") == []
+
+
+def test_upsert_positions_many_chunks_and_updates(fresh_db, monkeypatch):
+    monkeypatch.setattr(db, "_MAX_PARAMS", len(db._POSITION_COLS) * 2)  # 2 rows per statement
+    positions = [
+        {"id": f"p{i}", "mode": "paper", "market_id": f"m{i}", "status": "open"}
+        for i in range(5)
+    ]
+    db.upsert_positions_many(positions)
+    assert db.count_positions(mode="paper") == 5
+
+    positions[3]["status"] = "closed"
+    db.upsert_positions_many(positions)
+    assert db.count_positions(mode="paper", status="open") == 4
+    assert db.count_positions(mode="paper", status="closed") == 1
+
+
+def test_upsert_decision_updates_existing(fresh_db):
+    db.upsert_decision({"trade_id": "t1", "status": "signal", "signal_data": {"edge": 0.1}})
+    db.upsert_decision({"trade_id": "t1", "status": "filled", "signal_data": {"edge": 0.1}})
+
+    dec = db.get_decision("t1")
+    assert dec["status"] == "filled"
+    assert dec["signal_data"] == {"edge": 0.1}
+
+
+def test_cooldown_ages_and_prune_use_epoch_column(fresh_db):
+    from datetime import datetime, timedelta, timezone
+
+    now = datetime.now(timezone.utc)
+    db.set_cooldowns(["old"], (now - timedelta(hours=30)).isoformat())
+    db.set_cooldown("new", (now - timedelta(hours=1)).isoformat())
+
+    ages = db.get_cooldown_ages(["old", "new", "missing"])
+    assert set(ages) == {"old", "new"}
+    assert ages["new"] == pytest.approx(1.0, abs=0.01)
+
+    db.prune_cooldowns(now.timestamp() - 86400)
+    assert set(db.get_all_cooldowns()) == {"new"}
+
+
+def test_get_cooldown_ages_chunks_keys(fresh_db, monkeypatch):
+    from datetime import datetime, timezone
+
+    monkeypatch.setattr(db, "_MAX_PARAMS", 3)  # 2 keys per statement
+    now = datetime.now(timezone.utc).isoformat()
+    db.set_cooldowns([f"k{i}" for i in range(5)], now)
+
+    ages = db.get_cooldown_ages([f"k{i}" for i in range(6)])
+    assert set(ages) == {f"k{i}" for i in range(5)}
+
+
+def test_migrate_backfills_cooldown_epoch(fresh_db):
+    fresh_db.executescript(
+        "DROP TABLE signal_cooldowns;"
+        "CREATE TABLE signal_cooldowns (key TEXT PRIMARY KEY, last_alert TEXT NOT NULL);"
+        "INSERT INTO signal_cooldowns VALUES ('k', '2024-01-01T00:00:00+00:00');"
+    )
+    db.init_db(fresh_db)
+
+    row = fresh_db.execute("SELECT last_alert_ts FROM signal_cooldowns").fetchone()
+    assert row["last_alert_ts"] == 1704067200
+
+
+def test_daily_pnl_counts_only_today(fresh_db):
+    from datetime import datetime, timedelta, timezone
+
+    now = datetime.now(timezone.utc)
+    db.insert_trades_many([
+        {**_trade("p1", 2.5), "exit_time": now.isoformat()},
+        {**_trade("p2", -1.0), "exit_time": now.isoformat()},
+        {**_trade("p3", 100.0), "exit_time": (now - timedelta(days=1)).isoformat()},
+    ])
+
+    assert db.get_daily_pnl(mode="paper") == pytest.approx(1.5)
+    assert db.get_portfolio_summary(mode="paper")["today_trades"] == 2
+
+
+def test_read_helpers_return_every_column(fresh_db):
+    db.upsert_position({"id": "p1", "mode": "paper", "market_id": "m1"})
+    db.insert_trade(_trade("p1"))
+    db.insert_signal({"timestamp": "t", "market_id": "m1"})
+    db.add_notification("hello", "TEST")
+
+    for table, rows in (
+        ("positions", db.get_positions(mode="paper")),
+        ("trades", db.get_trades(mode="paper")),
+        ("signals", db.get_signals()),
+        ("notifications", db.get_pending_notifications()),
+    ):
+        schema_cols = [r[1] for r in fresh_db.execute(f"PRAGMA table_info({table})")]
+        assert len(rows) == 1
+        assert sorted(rows[0]) == sorted(schema_cols), table
+
+
+def test_iter_decisions_decodes_lazily(fresh_db):
+    db.upsert_decisions_many([
+        {"trade_id": "t1", "status": "signal", "events": [{"e": 1}]},
+        {"trade_id": "t2", "status": "signal", "events": []},
+    ])
+
+    it = db.iter_decisions(status="signal")
+    first = next(it)
+    assert isinstance(first["events"], list)
+    assert {first["trade_id"], *(d["trade_id"] for d in it)} == {"t1", "t2"}
+
+
+def test_reads_use_a_read_only_connection(fresh_db):
+    import sqlite3
+
+    db.insert_trade(_trade("p1"))
+    read_conn = db.get_read_db()
+
+    assert read_conn is not fresh_db
+    assert len(db.get_trades(mode="paper")) == 1
+    with pytest.raises(sqlite3.OperationalError):
+        read_conn.execute("DELETE FROM trades")
+
+
+def test_reads_inside_transaction_see_pending_writes(fresh_db):
+    db.insert_trade(_trade("p1"))
+    db.get_read_db()  # open the reader before the transaction
+
+    with db.transaction():
+        db.insert_trade(_trade("p2"), commit=False)
+        assert db.get_read_db() is fresh_db
+        assert len(db.get_trades(mode="paper")) == 2
+
+
+def test_advance_decision_in_transaction_returns_update(fresh_db, monkeypatch):
+    monkeypatch.setattr(db, "_HAS_RETURNING", False)  # pre-3.35 fallback re-reads
+    db.upsert_decision({"trade_id": "t1", "status": "signal"})
+
+    with db.transaction():
+        dec = db.advance_decision("t1", {"step": "filled"}, status="filled", commit=False)
+
+    assert dec["status"] == "filled"
+    assert dec["events"] == [{"step": "filled"}]
+
+
+def test_decision_summary_columns_skip_json(fresh_db):
+    db.upsert_decision({
+        "trade_id": "t1", "status": "settled", "question": "Q?",
+        "order_data": {"cost": 12.5},
+        "settlement_data": {"pnl": -3.25, "exit_reason": "STOP_LOSS", "duration_hours": 4.0},
+    })
+
+    (row,) = db.get_decisions(summary_only=True)
+    assert row["settlement_pnl"] == -3.25
+    assert row["settlement_exit_reason"] == "STOP_LOSS"
+    assert row["settlement_duration_hours"] == 4.0
+    assert row["order_cost"] == 12.5
+    assert "settlement_data" not in row
+
+
+def test_advance_decision_appends_event_in_place(fresh_db):
+    db.upsert_decision({"trade_id": "t1", "status": "signal", "events": [{"type": "signal_detected"}]})
+
+    dec = db.advance_decision(
+        "t1", {"type": "order_placed"}, status="ordered",
+        stage="order_data", stage_data={"cost": 5.0},
+    )
+
+    assert dec["status"] == "ordered"
+    assert dec["order_data"] == {"cost": 5.0}
+    assert [e["type"] for e in dec["events"]] == ["signal_detected", "order_placed"]
+    assert db.get_decision("t1")["events"] == dec["events"]
+
+
+def test_advance_decision_unknown_trade(fresh_db):
+    assert db.advance_decision("nope", {"type": "x"}) is None
+
+
+def test_decision_stats_group_by_status(fresh_db):
+    db.upsert_decisions_many([
+        {"trade_id": "t1", "status": "settled", "settlement_data": {"pnl": 4.0}},
+        {"trade_id": "t2", "status": "settled", "settlement_data": {"pnl": -1.5}},
+        {"trade_id": "t3", "status": "settled", "settlement_data": {}},
+        {"trade_id": "t4", "status": "ordered"},
+    ])
+
+    stats = db.get_decision_stats()
+    assert stats["settled"] == {"count": 3, "wins": 1, "losses": 2, "pnl": 2.5}
+    assert stats["ordered"]["count"] == 1
+
+
+def test_get_decisions_since_filters_on_created_at(fresh_db):
+    db.upsert_decisions_many([{"trade_id": "old"}, {"trade_id": "new"}])
+    fresh_db.execute(
+        "UPDATE decisions SET created_at = '2020-01-01 00:00:00' WHERE trade_id = 'old'"
+    )
+    fresh_db.commit()
+
+    rows = db.get_decisions(since="2024-01-01 00:00:00")
+    assert [r["trade_id"] for r in rows] == ["new"]
+    assert sum(v["count"] for v in db.get_decision_stats(since="2024-01-01 00:00:00").values()) == 1
+
+
+def test_upserts_return_stored_row(fresh_db):
+    pos = db.upsert_position({"id": "p1", "mode": "paper", "market_id": "m1"})
+    assert pos["id"] == "p1"
+    assert pos["created_at"]  # column default filled in by SQLite
+
+    dec = db.upsert_decision({"trade_id": "t1", "status": "signal", "events": [{"type": "x"}]})
+    assert dec["events"] == [{"type": "x"}]
+    assert dec["created_at"]
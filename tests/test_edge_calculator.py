@@ -1,5 +1,6 @@
 """Tests for edge_calculator.py — config-driven filters and Kelly sizing."""
 
+import json
 import pytest
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
@@ -117,3 +118,21 @@ def test_expiration_filter(tmp_path, monkeypatch):
 
     result = edge_calculator.calculate_edge(estimate, bankroll=10000)
     assert result is None
+
+
+def test_filtered_log_buffers_writes(tmp_path, monkeypatch):
+    """Filtered entries are batched in memory and flushed every N entries."""
+    log = tmp_path / "filtered.json"
+    monkeypatch.setattr(edge_calculator, "FILTERED_LOG", log)
+    monkeypatch.setattr(edge_calculator, "_FILTERED_FLUSH_EVERY", 3)
+    monkeypatch.setattr(edge_calculator, "_FILTERED_FLUSH_SECS", 3600.0)
+    monkeypatch.setattr(edge_calculator, "_FILTERED", {"path": None, "entries": None, "pending": 0, "flushed_at": float("-inf")})
+    monkeypatch.setattr(edge_calculator, "add_notification", lambda *a, **k: None)
+
+    edge_calculator._log_filtered(make_estimate(), "lottery_ticket")  # first entry flushes (stale timer)
+    edge_calculator._log_filtered(make_estimate(), "lottery_ticket")
+    assert len(json.loads(log.read_text())) == 1
+
+    edge_calculator._log_filtered(make_estimate(), "lottery_ticket")
+    edge_calculator._log_filtered(make_estimate(), "lottery_ticket")
+    assert len(json.loads(log.read_text())) == 4
@@ -0,0 +1,21 @@
+"""Tests for fileio.py — atomic state-file writes."""
+
+from src.fileio import atomic_write_bytes
+
+
+def test_atomic_write_replaces_content(tmp_path):
+    target = tmp_path / "state.json"
+    target.write_bytes(b'{"old": true}')
+
+    atomic_write_bytes(target, b'{"new": true}')
+
+    assert target.read_bytes() == b'{"new": true}'
+    assert not (tmp_path / "state.json.tmp").exists()
+
+
+def test_atomic_write_accepts_str_path(tmp_path):
+    target = tmp_path / "state.json"
+
+    atomic_write_bytes(str(target), b"[]")
+
+    assert target.read_bytes() == b"[]"
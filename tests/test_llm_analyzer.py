@@ -185,3 +185,47 @@ class TestAnalyzeRouting:
 
         assert result == []
         mock_post.assert_not_called()
+
+    def test_analyze_batches_news_across_prompts(self, mock_config):
+        """row_batch/parallelism split news into prompts; indices stay global."""
+        mock_config.llm_provider = "openai"
+        mock_config.llm_api_key = "sk-test"
+        mock_config.llm_model = ""
+        mock_config.llm_base_url = ""
+
+        resp_text = _valid_api_response()
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {
+            "choices": [{"message": {"content": resp_text}}]
+        }
+        mock_resp.raise_for_status = MagicMock()
+
+        with patch("httpx.post", return_value=mock_resp) as mock_post:
+            from src.llm_analyzer import analyze_news_batch
+            result = analyze_news_batch(_make_news(7), _make_markets(2),
+                                        row_batch=3, parallelism=2)
+
+        assert mock_post.call_count == 2
+        assert [s.news_index for s in result] == [0, 3]
+        assert [s.news_title for s in result] == ["News item 0", "News item 3"]
+
+    def test_analyze_clamps_row_batch_to_prompt_size(self, mock_config):
+        """row_batch above MAX_PROMPT_NEWS splits prompts rather than dropping news."""
+        mock_config.llm_provider = "openai"
+        mock_config.llm_api_key = "sk-test"
+        mock_config.llm_model = ""
+        mock_config.llm_base_url = ""
+
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {
+            "choices": [{"message": {"content": _valid_api_response()}}]
+        }
+        mock_resp.raise_for_status = MagicMock()
+
+        with patch("httpx.post", return_value=mock_resp) as mock_post:
+            from src.llm_analyzer import analyze_news_batch
+            result = analyze_news_batch(_make_news(20), _make_markets(2),
+                                        row_batch=20, parallelism=2)
+
+        assert mock_post.call_count == 2
+        assert [s.news_index for s in result] == [0, 15]
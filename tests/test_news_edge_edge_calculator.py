@@ -0,0 +1,57 @@
+"""Tests for polymarket_news_edge/edge_calculator.py — find_edges vs calculate_edge parity."""
+
+import random
+
+import pytest
+
+import polymarket_news_edge.edge_calculator as ec
+from polymarket_news_edge.probability_engine import ProbEstimate
+
+
+def _random_estimates(rng: random.Random, n: int = 200) -> list[ProbEstimate]:
+    return [
+        ProbEstimate(
+            market_id=f"m{i}",
+            question=f"Will event {i} happen?",
+            # Include prices at and beyond the 0.01/0.99 entry bounds
+            current_price=rng.choice([rng.uniform(0.0, 1.0), 0.005, 0.01, 0.99, 0.995]),
+            ai_probability=rng.uniform(0.02, 0.98),
+            confidence=rng.uniform(0.0, 0.9),
+            signals={"n_signals": rng.randint(1, 5), "avg_importance": rng.uniform(1, 5)},
+        )
+        for i in range(n)
+    ]
+
+
+def _reference_edges(estimates, bankroll, min_edge):
+    signals = [ec.calculate_edge(e, bankroll, min_edge) for e in estimates]
+    return sorted((s for s in signals if s is not None), key=lambda s: s.edge, reverse=True)
+
+
+@pytest.mark.parametrize("kernel", ["numpy", "loop", "jit"])
+def test_find_edges_matches_calculate_edge(monkeypatch, kernel):
+    """Every find_edges kernel returns exactly what mapping calculate_edge does."""
+    paths = {"numpy": ec._edges_numpy, "loop": ec._edges_loop}
+    if kernel == "jit":
+        pytest.importorskip("numba")
+        monkeypatch.setattr(ec, "_compute_edges_kernel", None)
+        assert ec._edges_kernel() is not ec._edges_loop
+    else:
+        monkeypatch.setattr(ec, "_compute_edges_kernel", paths[kernel])
+    for seed in range(5):
+        estimates = _random_estimates(random.Random(seed))
+        for bankroll, min_edge in ((1000.0, ec.MIN_EDGE_THRESHOLD), (250.0, 0.0), (5000.0, 0.1)):
+            expected = _reference_edges(estimates, bankroll, min_edge)
+            assert ec.find_edges(estimates, bankroll, min_edge) == expected
+
+
+def test_find_edges_fee_matches_estimate_fee():
+    est = ProbEstimate("m", "Q?", current_price=0.30, ai_probability=0.60,
+                       confidence=0.8, signals={})
+    (sig,) = ec.find_edges([est])
+    assert sig.direction == "BUY_YES"
+    assert sig.fee_estimate == round(ec.estimate_fee(0.30), 4)
+
+
+def test_find_edges_empty():
+    assert ec.find_edges([]) == []
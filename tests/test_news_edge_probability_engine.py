@@ -0,0 +1,145 @@
+"""Tests for polymarket_news_edge/probability_engine.py — vectorized aggregation parity."""
+
+import random
+
+import pytest
+
+import polymarket_news_edge.probability_engine as pe
+from polymarket_news_edge.event_parser import NewsSignal
+
+
+def _reference_estimates(signals) -> dict[str, tuple[float, float]]:
+    """Per-signal estimate_single_signal loop, aggregated one market at a time."""
+    by_market: dict[str, list] = {}
+    for sig in signals:
+        for match in sig.matched_markets:
+            by_market.setdefault(match["market_id"], []).append((sig, match))
+
+    out = {}
+    for mid, pairs in by_market.items():
+        first = pairs[0][1]
+        meta = first.get("market_meta", {})
+        prices = first.get("outcomePrices", [])
+        current = prices[0] if prices else 0.5
+        total_shift = total_weight = total_abs_shift = total_match = total_cred = 0.0
+        for sig, match in pairs:
+            shift, weight = pe.estimate_single_signal(
+                sentiment=sig.sentiment,
+                match_score=match["match_score"],
+                importance=sig.importance,
+                source_id=sig.source_id,
+                is_breaking=sig.is_breaking,
+                yes_means_up=meta.get("yes_means_up"),
+                question_type=meta.get("question_type", "binary_event"),
+            )
+            total_shift += shift * weight
+            total_weight += weight
+            total_abs_shift += abs(shift)
+            total_match += match["match_score"]
+            total_cred += pe.SRC_W[sig.source_id]
+
+        if total_weight == 0:
+            out[mid] = (current, 0.0)
+            continue
+        n = len(pairs)
+        net_shift = total_shift / total_weight
+        volume = first.get("volume", 0)
+        if volume > 1_000_000:
+            net_shift *= 0.4
+        elif volume > 100_000:
+            net_shift *= 0.65
+        estimated = min(max(current + net_shift, 0.02), 0.98)
+        agreement = abs(net_shift) / (total_abs_shift / n + 0.001)
+        confidence = min(0.90, (
+            (total_match / n / 100.0) * 0.3 +
+            (total_cred / n) * 0.3 +
+            min(1.0, n / 3.0) * 0.2 +
+            min(1.0, agreement) * 0.2
+        ))
+        out[mid] = (round(estimated, 4), round(confidence, 4))
+    return out
+
+
+def _random_signals(rng: random.Random, n_signals: int = 40, n_markets: int = 8) -> list[NewsSignal]:
+    markets = [
+        {
+            "market_id": f"m{i}",
+            "question": f"Will event {i} happen?",
+            "outcomePrices": [rng.uniform(0.01, 0.99)],
+            "volume": rng.choice([0, 50_000, 500_000, 5_000_000]),
+            "market_meta": {"yes_means_up": rng.choice([True, False, None])},
+        }
+        for i in range(n_markets)
+    ]
+    signals = []
+    for j in range(n_signals):
+        matched = [
+            {**m, "match_score": rng.uniform(50, 100)}
+            for m in rng.sample(markets, rng.randint(0, 3))
+        ]
+        signals.append(NewsSignal(
+            news_id=f"n{j}",
+            news_title=f"News {j}",
+            news_source="test",
+            entities=[],
+            category="crypto",
+            sentiment=rng.uniform(-1, 1),
+            importance=rng.randint(0, 6),  # 0 and 6 hit the out-of-range default
+            is_breaking=rng.random() < 0.3,
+            matched_markets=matched,
+            source_id=rng.randint(0, pe.UNKNOWN_SOURCE_ID),
+        ))
+    return signals
+
+
+_TOTALS_PATHS = {
+    "numpy": pe._signal_totals_numpy,
+    "loop": pe._signal_totals_loop,
+    "jit": None,  # resolved by _signal_totals(): the numba kernel when numba is installed
+}
+
+
+@pytest.mark.parametrize("path", sorted(_TOTALS_PATHS))
+@pytest.mark.parametrize("seed", range(5))
+def test_compute_estimates_matches_per_signal_loop(monkeypatch, path, seed):
+    """Every _signal_totals path reproduces the per-signal aggregation."""
+    if path == "jit":
+        pytest.importorskip("numba")
+    monkeypatch.setattr(pe, "_signal_totals_kernel", _TOTALS_PATHS[path])
+    signals = _random_signals(random.Random(seed))
+
+    expected = _reference_estimates(signals)
+    estimates = pe.compute_estimates(signals)
+
+    assert {e.market_id for e in estimates} == set(expected)
+    for e in estimates:
+        prob, conf = expected[e.market_id]
+        assert e.ai_probability == pytest.approx(prob, abs=1e-4)
+        assert e.confidence == pytest.approx(conf, abs=1e-4)
+
+
+def test_compute_estimates_skips_unmatched_signals():
+    signals = _random_signals(random.Random(0))
+    for s in signals:
+        s.matched_markets = []
+    assert pe.compute_estimates(signals) == []
+
+
+def test_compute_estimates_accepts_legacy_markets_by_id():
+    signals = _random_signals(random.Random(1))
+    assert pe.compute_estimates(signals, {}) == pe.compute_estimates(signals)
+
+
+def test_aggregate_markets_clamps_edge_values():
+    """Estimates clamp to [0.02, 0.98]; a NaN estimate is reported as no estimate."""
+    import numpy as np
+
+    price = np.array([0.5, 0.5, 0.5, 0.5, 0.5, float("nan")])
+    shift = np.array([-0.6, -0.48, 0.0, 0.48, 0.6, 0.1])
+    ones = np.ones(len(price))
+    estimated, _, has_weight = pe._aggregate_markets(
+        price, np.zeros(len(price)), ones, shift, ones, np.abs(shift), ones * 80, ones,
+    )
+
+    assert estimated[:5] == pytest.approx([0.02, 0.02, 0.5, 0.98, 0.98])
+    assert has_weight.tolist() == [True] * 5 + [False]
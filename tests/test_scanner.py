@@ -1,7 +1,6 @@
 """Tests for scanner.py — dedup_signals config-driven cooldown + LLM smart gate."""
 
 import pytest
-from datetime import datetime, timezone, timedelta
 from unittest.mock import MagicMock, patch
 from dataclasses import dataclass
 
@@ -44,13 +43,11 @@ class TestDedupCooldown:
         mock_config.max_alerts_per_hour = 100  # disable rate limit
 
         sig = MockSignal(market_id="mkt1", direction="BUY_YES", edge=0.10)
-        one_hour_ago = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
-
         with (
-            patch.object(scanner, "get_cooldown", return_value=one_hour_ago),
-            patch.object(scanner, "set_cooldown"),
+            patch.object(scanner, "get_cooldown_ages", return_value={"mkt1::BUY_YES": 1.0}),
+            patch.object(scanner, "set_cooldowns"),
             patch.object(scanner, "prune_cooldowns"),
-            patch.object(scanner, "insert_signal"),
+            patch.object(scanner, "insert_signals_many"),
         ):
             result = scanner.dedup_signals([sig])
 
@@ -62,13 +59,11 @@ class TestDedupCooldown:
         mock_config.max_alerts_per_hour = 100
 
         sig = MockSignal(market_id="mkt2", direction="BUY_YES", edge=0.10)
-        three_hours_ago = (datetime.now(timezone.utc) - timedelta(hours=3)).isoformat()
-
         with (
-            patch.object(scanner, "get_cooldown", return_value=three_hours_ago),
-            patch.object(scanner, "set_cooldown"),
+            patch.object(scanner, "get_cooldown_ages", return_value={"mkt2::BUY_YES": 3.0}),
+            patch.object(scanner, "set_cooldowns"),
             patch.object(scanner, "prune_cooldowns"),
-            patch.object(scanner, "insert_signal"),
+            patch.object(scanner, "insert_signals_many"),
         ):
             result = scanner.dedup_signals([sig])
 
@@ -85,10 +80,10 @@ class TestDedupCooldown:
         ]
 
         with (
-            patch.object(scanner, "get_cooldown", return_value=None),  # no prior alert
-            patch.object(scanner, "set_cooldown"),
+            patch.object(scanner, "get_cooldown_ages", return_value={}),  # no prior alert
+            patch.object(scanner, "set_cooldowns"),
             patch.object(scanner, "prune_cooldowns"),
-            patch.object(scanner, "insert_signal"),
+            patch.object(scanner, "insert_signals_many"),
         ):
             result = scanner.dedup_signals(signals)
 
@@ -98,6 +93,82 @@ class TestDedupCooldown:
         all_edges = sorted([s.edge for s in signals], reverse=True)
         assert result_edges == all_edges[:3]
 
+    def test_dedup_writes_fresh_cooldowns_in_one_batch(self, mock_config):
+        """Fresh signals are stamped with a single set_cooldowns call."""
+        mock_config.signal_cooldown_hours = 2.0
+        mock_config.max_alerts_per_hour = 100
+
+        signals = [
+            MockSignal(market_id="mkt1", direction="BUY_YES", edge=0.10),
+            MockSignal(market_id="mkt2", direction="BUY_NO", edge=0.08),
+        ]
+
+        with (
+            patch.object(scanner, "get_cooldown_ages", return_value={}),
+            patch.object(scanner, "set_cooldowns") as mock_set,
+            patch.object(scanner, "prune_cooldowns"),
+            patch.object(scanner, "insert_signals_many"),
+        ):
+            scanner.dedup_signals(signals)
+
+        mock_set.assert_called_once()
+        assert mock_set.call_args[0][0] == ["mkt1::BUY_YES", "mkt2::BUY_NO"]
+
+    def test_dedup_drops_duplicate_keys_in_batch(self, mock_config):
+        """Two signals for the same market/direction in one batch alert once."""
+        mock_config.signal_cooldown_hours = 2.0
+        mock_config.max_alerts_per_hour = 100
+
+        signals = [
+            MockSignal(market_id="mkt1", direction="BUY_YES", edge=0.10),
+            MockSignal(market_id="mkt1", direction="BUY_YES", edge=0.12),
+        ]
+
+        with (
+            patch.object(scanner, "get_cooldown_ages", return_value={}),
+            patch.object(scanner, "set_cooldowns") as mock_set,
+            patch.object(scanner, "prune_cooldowns"),
+            patch.object(scanner, "insert_signals_many") as mock_insert,
+        ):
+            result = scanner.dedup_signals(signals)
+
+        assert result == signals[:1]
+        assert mock_set.call_args[0][0] == ["mkt1::BUY_YES"]
+        (rows,) = mock_insert.call_args[0]
+        assert len(rows) == 1
+        assert rows[0]["edge"] == 0.12
+        assert rows[0]["filter_reason"] == "cooldown_dedup"
+
+    def test_dedup_empty_skips_db(self, mock_config):
+        """No signals → no cooldown reads, writes or prune."""
+        with (
+            patch.object(scanner, "get_cooldown_ages") as mock_get,
+            patch.object(scanner, "set_cooldowns") as mock_set,
+            patch.object(scanner, "prune_cooldowns") as mock_prune,
+        ):
+            assert scanner.dedup_signals([]) == []
+
+        mock_get.assert_not_called()
+        mock_set.assert_not_called()
+        mock_prune.assert_not_called()
+
+    def test_dedup_prunes_at_most_hourly(self, mock_config):
+        """prune_cooldowns runs on the first call, not again within the hour."""
+        mock_config.signal_cooldown_hours = 2.0
+        mock_config.max_alerts_per_hour = 100
+        sig = MockSignal(market_id="mkt1", direction="BUY_YES", edge=0.10)
+
+        with (
+            patch.object(scanner, "_last_cooldown_prune", 0.0),
+            patch.object(scanner, "get_cooldown_ages", return_value={}),
+            patch.object(scanner, "set_cooldowns"),
+            patch.object(scanner, "prune_cooldowns") as mock_prune,
+        ):
+            scanner.dedup_signals([sig])
+            scanner.dedup_signals([sig])
+
+        mock_prune.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # LLM smart gate logic